@@ -4,709 +4,604 @@
 Complete compilation of all demo components without any alterations
 """
 
+import argparse
 import asyncio
+import contextlib
 import json
+import re
 import sys
-from datetime import datetime
-from typing import Dict, Any, List
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import requests
-import websockets
-
-# =============================================================================
-# 1. VISIONMIND BILLION DOLLAR DEMO - EXECUTIVE DEMO SCRIPT
-# =============================================================================
-
-class VisionMindBillionDollarDemo:
-    def __init__(self):
-        self.demo_results = {}
-        self.start_time = datetime.now()
-        
-    async def run_complete_demo(self):
-        """Run all demo scenarios showcasing $50M+ value proposition"""
-        print("🚀 VISIONMIND AI v3.0 - BILLION-DOLLAR DEMO")
-        print("=" * 60)
-        
-        await self.demo_autonomous_business_analyst()
-        await self.demo_universal_os_control()
-        await self.demo_advanced_security_suite()
-        await self.demo_enterprise_ai_agents()
-        await self.demo_realtime_system_monitoring()
-        await self.demo_advanced_file_intelligence()
-        await self.demo_crypto_security_framework()
-        
-        self.generate_demo_report()
-    
-    async def demo_autonomous_business_analyst(self):
-        """Showcase AI-powered business intelligence"""
-        print("\n📊 1. AUTONOMOUS BUSINESS ANALYST")
-        print("-" * 40)
-        
-        # Simulate market analysis
-        analysis_data = {
-            "market_trends": {
-                "ai_assistant_market_growth": "32% CAGR 2024-2030",
-                "total_addressable_market": "$126B by 2028",
-                "competitive_advantage": "Universal OS Control + Advanced AI",
-                "revenue_projections": ["$5M Year1", "$25M Year2", "$100M Year3"]
-            },
-            "financial_metrics": {
-                "customer_acquisition_cost": "$1,200",
-                "lifetime_value": "$45,000",
-                "gross_margin": "85%",
-                "potential_valuation_multiple": "20x revenue"
-            }
-        }
-        
-        print("✅ Real-time Market Analysis Generated")
-        print("✅ Financial Projections Calculated")
-        print("✅ Competitive Landscape Mapped")
-        
-        self.demo_results["business_analyst"] = {
-            "status": "COMPLETED",
-            "estimated_business_value": "$25M",
-            "time_saved": "240 hours/month",
-            "insights_generated": "15+ strategic insights"
-        }
-    
-    async def demo_universal_os_control(self):
-        """Showcase cross-platform automation capabilities"""
-        print("\n💻 2. UNIVERSAL OS CONTROL SYSTEM")
-        print("-" * 40)
-        
-        # Demonstrate system command execution
-        system_capabilities = [
-            "Execute complex system commands securely",
-            "Manage processes across Windows/Linux/macOS",
-            "Automate file operations at enterprise scale",
-            "Monitor system performance in real-time",
-            "Deploy automated workflows across infrastructure"
-        ]
-        
-        for capability in system_capabilities:
-            print(f"✅ {capability}")
-        
-        self.demo_results["universal_control"] = {
-            "status": "OPERATIONAL",
-            "platforms_supported": ["Windows", "Linux", "macOS", "Docker", "Kubernetes"],
-            "automation_potential": "90% IT operations",
-            "cost_savings": "$2.4M/year for 500-employee company"
-        }
-    
-    async def demo_advanced_security_suite(self):
-        """Showcase enterprise-grade security features"""
-        print("\n🛡️ 3. ADVANCED SECURITY SUITE")
-        print("-" * 40)
-        
-        security_features = [
-            "Real-time domain reputation analysis",
-            "Automated vulnerability scanning",
-            "Advanced cryptography (RSA-4096, Fernet)",
-            "Port scanning and network security",
-            "Compliance monitoring (GDPR, HIPAA, SOC2)"
-        ]
-        
-        for feature in security_features:
-            print(f"✅ {feature}")
-        
-        self.demo_results["security_suite"] = {
-            "status": "ACTIVE",
-            "security_level": "Enterprise Grade",
-            "compliance_frameworks": ["GDPR", "HIPAA", "SOC2", "ISO27001"],
-            "risk_reduction": "92% security incidents",
-            "value_proposition": "$3.8M annual security cost savings"
-        }
-    
-    async def demo_enterprise_ai_agents(self):
-        """Showcase autonomous AI workforce"""
-        print("\n🤖 4. ENTERPRISE AI AGENTS")
-        print("-" * 40)
-        
-        agent_types = [
-            "Research Agent - Comprehensive market analysis",
-            "Customer Service Agent - 24/7 support",
-            "Data Analyst Agent - Real-time insights",
-            "Security Agent - Threat monitoring",
-            "IT Operations Agent - System management"
-        ]
-        
-        for agent in agent_types:
-            print(f"✅ {agent}")
-        
-        self.demo_results["ai_agents"] = {
-            "status": "DEPLOYED",
-            "agent_count": "Unlimited scalable agents",
-            "productivity_boost": "400% team efficiency",
-            "cost_displacement": "$4.2M annual labor savings",
-            "availability": "24/7/365 operation"
-        }
-    
-    async def demo_realtime_system_monitoring(self):
-        """Showcase advanced monitoring capabilities"""
-        print("\n📈 5. REAL-TIME SYSTEM INTELLIGENCE")
-        print("-" * 40)
-        
-        monitoring_capabilities = [
-            "CPU/Memory/Disk performance tracking",
-            "Network activity and bandwidth monitoring",
-            "Application performance insights",
-            "Predictive failure analysis",
-            "Custom dashboard creation"
-        ]
-        
-        for capability in monitoring_capabilities:
-            print(f"✅ {capability}")
-        
-        # Simulate monitoring dashboard
-        print("\n📊 Live System Metrics:")
-        metrics = {
-            "CPU Usage": "23%",
-            "Memory Utilization": "45%",
-            "Network Throughput": "1.2 Gbps",
-            "Active Users": "1,247",
-            "AI Model Accuracy": "96.8%"
-        }
-        
-        for metric, value in metrics.items():
-            print(f"   {metric}: {value}")
-        
-        self.demo_results["system_monitoring"] = {
-            "status": "LIVE",
-            "metrics_tracked": "150+ system parameters",
-            "alert_response_time": "< 30 seconds",
-            "downtime_reduction": "99.9% uptime",
-            "operational_efficiency": "67% improvement"
-        }
-    
-    async def demo_advanced_file_intelligence(self):
-        """Showcase intelligent file processing"""
-        print("\n📁 6. ADVANCED FILE INTELLIGENCE")
-        print("-" * 40)
-        
-        file_capabilities = [
-            "Process 50+ file formats automatically",
-            "PDF text extraction and analysis",
-            "Image content recognition",
-            "Audio transcription and analysis",
-            "Code analysis and quality assessment"
-        ]
-        
-        for capability in file_capabilities:
-            print(f"✅ {capability}")
-        
-        self.demo_results["file_intelligence"] = {
-            "status": "READY",
-            "formats_supported": "50+ file types",
-            "processing_speed": "10x faster than manual",
-            "accuracy_rate": "98.7% content extraction",
-            "labor_savings": "15 FTEs replaced"
-        }
-    
-    async def demo_crypto_security_framework(self):
-        """Showcase cryptographic security"""
-        print("\n🔐 7. ADVANCED CRYPTOGRAPHY FRAMEWORK")
-        print("-" * 40)
-        
-        crypto_features = [
-            "RSA-4096 key generation and management",
-            "Military-grade encryption/decryption",
-            "Secure token generation",
-            "HMAC signature verification",
-            "Cryptographic audit trails"
-        ]
-        
-        for feature in crypto_features:
-            print(f"✅ {feature}")
-        
-        self.demo_results["crypto_framework"] = {
-            "status": "SECURE",
-            "encryption_standard": "AES-256, RSA-4096",
-            "compliance": "FIPS 140-2, NIST standards",
-            "security_level": "Military Grade",
-            "data_protection": "Zero-knowledge architecture"
-        }
-    
-    def generate_demo_report(self):
-        """Generate comprehensive demo report"""
-        print("\n" + "=" * 60)
-        print("🎯 VISIONMIND AI v3.0 - INVESTMENT SUMMARY")
-        print("=" * 60)
-        
-        total_value = 0
-        for component, details in self.demo_results.items():
-            value_str = details.get('cost_savings') or details.get('estimated_business_value', '$0')
-            value = float(value_str.replace('$', '').replace('M', '').replace(' annual', '')) * 1000000
-            total_value += value
-            
-            print(f"\n{component.upper().replace('_', ' ')}:")
-            for k, v in details.items():
-                if k != 'status':
-                    print(f"  {k.replace('_', ' ').title()}: {v}")
-        
-        print(f"\n💰 TOTAL DEMONSTRATED VALUE: ${total_value:,.2f}/year")
-        print(f"🏆 CONSERVATIVE VALUATION: ${total_value * 5:,.2f}")
-        print(f"🚀 AGGRESSIVE VALUATION: ${total_value * 20:,.2f}")
-        
-        # Generate valuation chart
-        self.create_valuation_chart()
-    
-    def create_valuation_chart(self):
-        """Create visual valuation chart"""
-        components = list(self.demo_results.keys())
-        values = []
-        
-        for component in components:
-            details = self.demo_results[component]
-            value_str = details.get('cost_savings') or details.get('estimated_business_value', '$0M')
-            value = float(value_str.replace('$', '').replace('M', '').replace(' annual', ''))
-            values.append(value)
-        
-        plt.figure(figsize=(12, 8))
-        bars = plt.barh([c.replace('_', ' ').title() for c in components], values, color='skyblue')
-        plt.xlabel('Value (Millions $)')
-        plt.title('VisionMind AI v3.0 - Component Valuation Breakdown')
-        plt.grid(axis='x', alpha=0.3)
-        
-        # Add value labels on bars
-        for bar, value in zip(bars, values):
-            plt.text(bar.get_width() + 0.1, bar.get_y() + bar.get_height()/2, 
-                    f'${value}M', ha='left', va='center', fontweight='bold')
-        
-        plt.tight_layout()
-        plt.savefig('visionmind_valuation_breakdown.png', dpi=300, bbox_inches='tight')
-        print(f"\n📊 Valuation chart saved: visionmind_valuation_breakdown.png")
-
-async def run_billion_dollar_demo():
-    """Run the billion-dollar demo"""
-    demo = VisionMindBillionDollarDemo()
-    await demo.run_complete_demo()
-
-# =============================================================================
-# 2. LIVE API DEMONSTRATION
-# =============================================================================
-
-class VisionMindLiveAPIDemo:
-    def __init__(self, base_url="http://localhost:8000"):
-        self.base_url = base_url
-        self.demo_token = None
-    
-    async def authenticate(self):
-        """Demo authentication"""
-        print("🔐 AUTHENTICATING...")
-        auth_data = {
-            "username": "demo@visionmind.ai",
-            "password": "demo123"
-        }
-        
-        # Simulate authentication
-        print("✅ JWT Token Authentication")
-        print("✅ OAuth2 Password Flow")
-        print("✅ API Key Management")
-        print("✅ Role-Based Access Control")
-        
-        self.demo_token = "demo_jwt_token_xyz123"
-        return True
-    
-    async def demo_ai_conversation(self):
-        """Showcase AI conversation capabilities"""
-        print("\n💬 AI CONVERSATION DEMO")
-        print("-" * 30)
-        
-        messages = [
-            "Analyze our Q3 financial performance and suggest optimization strategies",
-            "Create a comprehensive competitive analysis for the AI assistant market",
-            "Generate Python code for real-time stock analysis with risk assessment"
-        ]
-        
-        for i, message in enumerate(messages, 1):
-            print(f"\n{i}. User: {message}")
-            # Simulate AI response
-            response = f"AI Analysis #{i}: Comprehensive analysis generated with 15+ insights and actionable recommendations"
-            print(f"   AI: {response}")
-    
-    async def demo_system_control(self):
-        """Showcase system control capabilities"""
-        print("\n🖥️ SYSTEM CONTROL DEMO")
-        print("-" * 30)
-        
-        commands = [
-            "Get comprehensive system diagnostics",
-            "Analyze network security posture",
-            "Monitor real-time performance metrics",
-            "Execute automated maintenance tasks"
-        ]
-        
-        for command in commands:
-            print(f"✅ {command}")
-    
-    async def demo_security_operations(self):
-        """Showcase security features"""
-        print("\n🔒 SECURITY OPERATIONS DEMO")
-        print("-" * 30)
-        
-        security_ops = [
-            "Domain reputation analysis: google.com - 98/100",
-            "Port scanning simulation completed - 0 vulnerabilities",
-            "Encryption key generation - RSA-4096",
-            "Security audit trail - All operations logged"
-        ]
-        
-        for op in security_ops:
-            print(f"✅ {op}")
-    
-    async def demo_file_processing(self):
-        """Showcase file intelligence"""
-        print("\n📄 FILE INTELLIGENCE DEMO")
-        print("-" * 30)
-        
-        file_types = [
-            "PDF Document Analysis - Text extracted, sentiment analyzed",
-            "Image Processing - Objects detected, metadata extracted",
-            "Audio File - Transcribed, speaker diarization completed",
-            "Code Repository - Quality analysis, vulnerabilities identified"
-        ]
-        
-        for file_type in file_types:
-            print(f"✅ {file_type}")
-    
-    async def run_live_demo(self):
-        """Run complete live demo"""
-        print("🚀 VISIONMIND AI v3.0 - LIVE API DEMONSTRATION")
-        print("=" * 50)
-        
-        await self.authenticate()
-        await self.demo_ai_conversation()
-        await self.demo_system_control()
-        await self.demo_security_operations()
-        await self.demo_file_processing()
-        
-        print("\n" + "=" * 50)
-        print("🎯 DEMO COMPLETED SUCCESSFULLY!")
-        print("💼 Enterprise-ready AI Platform")
-        print("💰 Multi-million dollar value proposition")
-        print("🚀 Scalable to millions of users")
-
-async def run_live_api_demo():
-    demo = VisionMindLiveAPIDemo()
-    await demo.run_live_demo()
-
-# =============================================================================
-# 3. INVESTMENT PITCH DECK COMPANION
-# =============================================================================
-
-class VisionMindInvestmentPitch:
-    def __init__(self):
-        self.pitch_data = self._load_pitch_data()
-    
-    def _load_pitch_data(self):
-        """Load compelling investment data"""
-        return {
-            "company_overview": {
-                "name": "VisionMind AI",
-                "tagline": "The World's Most Advanced AI Assistant Platform",
-                "founding_year": 2024,
-                "stage": "Series A Ready",
-                "technology": "Proprietary AI + Universal OS Control"
-            },
-            "market_opportunity": {
-                "total_market": "$126B",
-                "serviceable_market": "$45B",
-                "serviceable_obtainable_market": "$15B",
-                "growth_rate": "32% CAGR",
-                "market_trends": [
-                    "AI adoption accelerating across enterprises",
-                    "Labor costs increasing 15% annually",
-                    "Security breaches costing $4.5M per incident",
-                    "Digital transformation budgets growing 25% YoY"
-                ]
-            },
-            "competitive_advantage": {
-                "unique_features": [
-                    "Universal OS Control - No competitor has this",
-                    "Advanced Memory System - Context-aware AI",
-                    "Enterprise Security Suite - Built-in compliance",
-                    "Autonomous AI Agents - Scalable workforce"
-                ],
-                "moat": "Proprietary technology + 50+ advanced features",
-                "barriers_to_entry": "Advanced AI research + Security certifications"
-            },
-            "traction_metrics": {
-                "technology_readiness": "Enterprise Production Ready",
-                "customers": ["Fortune 500 Companies", "Government Agencies", "Tech Unicorns"],
-                "partnerships": ["AWS", "Microsoft", "Google Cloud", "Docker"],
-                "awards": ["Best AI Platform 2024", "Top Security Innovation", "Enterprise Excellence"]
-            },
-            "financial_projections": {
-                "year1": {"revenue": "$5M", "customers": 50, "employees": 25},
-                "year2": {"revenue": "$25M", "customers": 250, "employees": 80},
-                "year3": {"revenue": "$100M", "customers": 1000, "employees": 200},
-                "year5": {"revenue": "$500M", "customers": 5000, "employees": 500}
-            },
-            "investment_ask": {
-                "series_a": "$15M",
-                "valuation": "$150M pre-money",
-                "use_of_funds": [
-                    "40% - Engineering & Product Development",
-                    "25% - Sales & Marketing Expansion",
-                    "20% - Enterprise Security Certifications",
-                    "15% - Operational Scale"
-                ],
-                "milestones": [
-                    "Achieve $5M ARR within 12 months",
-                    "Secure 10 Fortune 500 customers",
-                    "Obtain SOC2, ISO27001, HIPAA compliance",
-                    "Expand to European and Asian markets"
-                ]
-            },
-            "team": {
-                "founders": ["AI Research PhDs", "Ex-Google/Meta Engineers", "Security Experts"],
-                "advisors": ["Fortune 500 CTOs", "AI Research Professors", "VC Partners"]
-            }
-        }
-    
-    def generate_executive_summary(self):
-        """Generate compelling executive summary"""
-        print("🚀 VISIONMIND AI - EXECUTIVE SUMMARY")
-        print("=" * 50)
-        
-        overview = self.pitch_data["company_overview"]
-        market = self.pitch_data["market_opportunity"]
-        financials = self.pitch_data["financial_projections"]
-        
-        summary = f"""
-{overview['name']} is revolutionizing enterprise AI with our v3.0 platform that 
-combines advanced artificial intelligence with universal operating system control.
-
-📊 MARKET OPPORTUNITY:
-• Total Addressable Market: {market['total_market']}
-• Serviceable Obtainable Market: {market['serviceable_obtainable_market']}
-• Growth Rate: {market['growth_rate']}
-
-💎 UNIQUE VALUE PROPOSITION:
-• Only platform with Universal OS Control + Advanced AI
-• 50+ proprietary features no competitor can match
-• Enterprise-grade security built-in
-
-💰 FINANCIAL PROJECTIONS:
-• Year 1: {financials['year1']['revenue']} revenue
-• Year 2: {financials['year2']['revenue']} revenue  
-• Year 3: {financials['year3']['revenue']} revenue
-• Year 5: {financials['year5']['revenue']} revenue
-
-🎯 INVESTMENT ASK:
-• {self.pitch_data['investment_ask']['series_a']} Series A
-• {self.pitch_data['investment_ask']['valuation']} pre-money valuation
-• 15-20x ROI potential within 3 years
-"""
-        print(summary)
-    
-    def generate_competitive_analysis(self):
-        """Generate competitive landscape analysis"""
-        print("\n🏆 COMPETITIVE ADVANTAGE ANALYSIS")
-        print("=" * 40)
-        
-        competitors = {
-            "OpenAI": ["Basic AI", "No OS Control", "Limited Security"],
-            "Google Assistant": ["Consumer Focus", "No Enterprise Features"],
-            "Microsoft Copilot": ["Office Integration", "No Universal Control"],
-            "Traditional RPA": ["Automation Only", "No AI Intelligence"]
-        }
-        
-        print("Competitor Limitations:")
-        for competitor, limitations in competitors.items():
-            print(f"• {competitor}: {', '.join(limitations)}")
-        
-        print(f"\n🎯 VisionMind AI Advantages:")
-        for advantage in self.pitch_data["competitive_advantage"]["unique_features"]:
-            print(f"  ✓ {advantage}")
-    
-    def generate_investment_deck(self):
-        """Generate complete investment deck"""
-        print("\n📈 VISIONMIND AI - INVESTMENT DECK")
-        print("=" * 40)
-        
-        slides = [
-            "Slide 1: Title - The Future of Enterprise AI",
-            "Slide 2: Problem - $500B Wasted on Inefficient Operations",
-            "Slide 3: Solution - VisionMind AI v3.0 Platform",
-            "Slide 4: Market Size - $126B Growing at 32% CAGR",
-            "Slide 5: Technology - 50+ Proprietary Features",
-            "Slide 6: Traction - Enterprise Ready, Fortune 500 Interest",
-            "Slide 7: Business Model - SaaS + Enterprise Licensing",
-            "Slide 8: Financials - 85% Gross Margins, Rapid Growth",
-            "Slide 9: Team - World-Class AI Engineers",
-            "Slide 10: Competition - No Direct Competitors",
-            "Slide 11: Investment Ask - $15M for 10%",
-            "Slide 12: Vision - Operating System for Business AI"
-        ]
-        
-        for slide in slides:
-            print(f"✅ {slide}")
-    
-    def generate_valuation_model(self):
-        """Generate financial valuation model"""
-        print("\n💰 VALUATION MODEL")
-        print("=" * 25)
-        
-        # DCF Valuation
-        print("Discounted Cash Flow Analysis:")
-        print("Year 1: $5M revenue → $75M valuation")
-        print("Year 2: $25M revenue → $375M valuation") 
-        print("Year 3: $100M revenue → $1.5B valuation")
-        
-        # Comparables
-        print("\nComparable Company Analysis:")
-        comparables = {
-            "AI Startups": "20-30x Revenue Multiple",
-            "Enterprise SaaS": "15-25x Revenue Multiple", 
-            "Security Companies": "12-18x Revenue Multiple"
-        }
-        
-        for comp, multiple in comparables.items():
-            print(f"• {comp}: {multiple}")
-        
-        print(f"\n🎯 Conservative Valuation: $150M")
-        print("🎯 Realistic Valuation: $300M") 
-        print("🎯 Aggressive Valuation: $500M")
+import time
 
-def run_investment_pitch():
-    """Generate complete investment pitch"""
-    pitch = VisionMindInvestmentPitch()
-    
-    pitch.generate_executive_summary()
-    pitch.generate_competitive_analysis() 
-    pitch.generate_investment_deck()
-    pitch.generate_valuation_model()
-    
-    print("\n" + "=" * 50)
-    print("🎯 INVESTMENT HIGHLIGHTS:")
-    print("• $15M Series A → $150M pre-money valuation")
-    print("• 15-20x ROI potential in 3 years")
-    print("• No direct competitors in market")
-    print("• Proprietary technology moat")
-    print("• Enterprise-ready platform")
-    print("• Massive $126B market opportunity")
-
-# =============================================================================
-# 4. DEMO CONFIGURATION & SETUP
-# =============================================================================
-
-DEMO_CONFIG = {
-    "api_endpoints": {
-        "base_url": "https://api.visionmind.ai/v1",
-        "authentication": "/auth/token",
-        "ai_chat": "/v1/message",
-        "system_control": "/v1/system/command",
-        "file_analysis": "/v1/files/analyze",
-        "security_scan": "/v1/security/domain-reputation"
-    },
-    "demo_scenarios": {
-        "enterprise_ai": [
-            "Financial analysis automation",
-            "Customer service augmentation", 
-            "IT operations automation",
-            "Security monitoring",
-            "Data analysis and insights"
-        ],
-        "cost_savings": {
-            "replaced_ftes": 15,
-            "annual_savings": "$1.8M",
-            "efficiency_gain": "400%",
-            "roi_timeline": "3 months"
-        },
-        "security_benefits": {
-            "incident_reduction": "92%",
-            "compliance_cost_reduction": "$850K",
-            "risk_mitigation": "$4.2M annually"
-        }
-    },
-    "investment_metrics": {
-        "valuation_methods": [
-            "DCF - Discounted Cash Flow",
-            "Comparable Companies", 
-            "Market Multiple",
-            "Revenue Growth Projection"
-        ],
-        "key_metrics": {
-            "customer_acquisition_cost": "$1,200",
-            "lifetime_value": "$45,000", 
-            "gross_margin": "85%",
-            "revenue_growth": "400% YoY"
-        }
-    }
-}
-
-def quick_demo():
-    """Run a 2-minute quick demo"""
-    print("🚀 VisionMind AI v3.0 - Quick Demo")
-    print("✅ Universal OS Control - Manage any system")
-    print("✅ Advanced AI Memory - Context-aware conversations") 
-    print("✅ Enterprise Security - Military-grade encryption")
-    print("✅ Autonomous Agents - Scalable AI workforce")
-    print("✅ Real-time Analytics - Live system intelligence")
-    print("\n💼 Enterprise Value: $50M+")
-    print("💰 Investment Opportunity: $15M Series A")
-    print("🎯 Target Valuation: $150M")
-
-# =============================================================================
-# 5. MAIN EXECUTION CONTROLLER
-# =============================================================================
-
-async def main():
+from visionmind.config import DEMO_CONFIG
+from visionmind.core import (RUN_HISTORY_PATH, ConsoleSink, LazyModule, NullSink, OUTPUT_SINKS,
+                             disable_instrumentation, emit, enable_instrumentation, output_sink,
+                             set_output_sink, use_output_sink)
+
+agents = LazyModule("visionmind.agents")
+audit = LazyModule("visionmind.audit")
+crypto = LazyModule("visionmind.crypto")
+demo = LazyModule("visionmind.demo")
+files = LazyModule("visionmind.files")
+headless = LazyModule("visionmind.headless")
+history = LazyModule("visionmind.history")
+live_api = LazyModule("visionmind.live_api")
+loadgen = LazyModule("visionmind.loadgen")
+market = LazyModule("visionmind.market")
+memory = LazyModule("visionmind.memory")
+metrics = LazyModule("visionmind.metrics")
+mock_server = LazyModule("visionmind.mock_server")
+pitch = LazyModule("visionmind.pitch")
+reputation = LazyModule("visionmind.reputation")
+scanner = LazyModule("visionmind.scanner")
+scenarios = LazyModule("visionmind.scenarios")
+service = LazyModule("visionmind.service")
+simulation = LazyModule("visionmind.simulation")
+startup = LazyModule("visionmind.startup")
+streaming = LazyModule("visionmind.streaming")
+valuation = LazyModule("visionmind.valuation")
+
+
+def demo_suite_graph(history_path=None, demo_options=None, pitch_options=None):
+    """Menu option 5 as a ScenarioGraph: the four demos, independent of each other"""
+    pitch_options = pitch_options or {}
+
+    def pitch_inputs():
+        # A Monte Carlo run reports its own timing, so it is never replayed
+        if pitch_options.get("valuation_scenarios"):
+            return None
+        return {"code": scenarios.code_fingerprint(pitch.run_investment_pitch,
+                                                   pitch.VisionMindInvestmentPitch)}
+
+    graph = scenarios.ScenarioGraph()
+    graph.add("billion-dollar",
+              lambda deps: demo.run_billion_dollar_demo(chart_preview=True, history_path=history_path,
+                                                        **(demo_options or {})))
+    graph.add("live-api", lambda deps: live_api.run_live_api_demo(),
+              inputs=lambda: {"code": scenarios.code_fingerprint(live_api.run_live_api_demo, live_api.VisionMindLiveAPIDemo)})
+    graph.add("pitch", lambda deps: pitch.run_investment_pitch(**pitch_options),
+              inputs=pitch_inputs)
+    graph.add("quick", lambda deps: demo.quick_demo(),
+              inputs=lambda: {"code": scenarios.code_fingerprint(demo.quick_demo)})
+    return graph
+
+
+async def main(demo_options=None, pitch_options=None):
     """Master controller for all VisionMind AI v3.0 demos"""
-    print("🎮 VISIONMIND AI v3.0 - MASTER DEMO CONTROLLER")
-    print("=" * 50)
-    print("1. Billion Dollar Full Demo")
-    print("2. Live API Demo")
-    print("3. Investment Pitch Generator")
-    print("4. Quick Demo (2-minute)")
-    print("5. Run ALL Demos")
+    demo_options = demo_options or {}
+    pitch_options = pitch_options or {}
+    emit("🎮 VISIONMIND AI v3.0 - MASTER DEMO CONTROLLER")
+    emit("=" * 50)
+    emit("1. Billion Dollar Full Demo")
+    emit("2. Live API Demo")
+    emit("3. Investment Pitch Generator")
+    emit("4. Quick Demo (2-minute)")
+    emit("5. Run ALL Demos")
     
     try:
+        output_sink().flush()
         choice = input("\nSelect demo (1-5): ").strip()
         
         if choice == "1":
-            await run_billion_dollar_demo()
+            await demo.run_billion_dollar_demo(chart_preview=True, history_path=RUN_HISTORY_PATH,
+                                               **demo_options)
         elif choice == "2":
-            await run_live_api_demo()
+            await live_api.run_live_api_demo()
         elif choice == "3":
-            run_investment_pitch()
+            pitch.run_investment_pitch(**pitch_options)
         elif choice == "4":
-            quick_demo()
+            demo.quick_demo()
         elif choice == "5":
-            print("\n" + "="*60)
-            print("🚀 RUNNING COMPLETE VISIONMIND AI v3.0 DEMO SUITE")
-            print("="*60)
+            emit("\n" + "="*60)
+            emit("🚀 RUNNING COMPLETE VISIONMIND AI v3.0 DEMO SUITE")
+            emit("="*60)
             
-            await run_billion_dollar_demo()
-            print("\n" + "="*60)
-            await run_live_api_demo()
-            print("\n" + "="*60)
-            run_investment_pitch()
-            print("\n" + "="*60)
-            quick_demo()
+            suite = demo_suite_graph(RUN_HISTORY_PATH, demo_options, pitch_options)
+            await scenarios.ScenarioExecutor(suite).run(separator="\n" + "="*60 + "\n")
         else:
-            print("❌ Invalid choice. Running quick demo...")
-            quick_demo()
+            emit("❌ Invalid choice. Running quick demo...")
+            demo.quick_demo()
             
     except KeyboardInterrupt:
-        print("\n\n⚠️ Demo interrupted by user")
+        emit("\n\n⚠️ Demo interrupted by user")
     except Exception as e:
-        print(f"\n\n❌ Demo error: {e}")
+        emit(f"\n\n❌ Demo error: {e}")
     finally:
-        print("\n" + "="*50)
-        print("🎯 VisionMind AI v3.0 Demo Completed!")
-        print("💎 The Future of Enterprise AI is Here")
-        print("💰 Valuation: $50M - $500M+")
+        emit("\n" + "="*50)
+        emit("🎯 VisionMind AI v3.0 Demo Completed!")
+        emit("💎 The Future of Enterprise AI is Here")
+        emit("💰 Valuation: $50M - $500M+")
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        description="VisionMind AI v3.0 demos. Without a command the interactive menu runs.")
+    parser.add_argument("--output", choices=sorted(OUTPUT_SINKS), default="console",
+                        help="demo output format (default: %(default)s)")
+    settings = parser.add_argument_group(
+        "billion-dollar demo settings (menu options 1 and 5, run billion-dollar)")
+    settings.add_argument("--no-live-metrics", action="store_true",
+                          help="show the sample monitoring figures instead of sampling /proc")
+    settings.add_argument("--file-scan-root", metavar="DIR",
+                          help="analyze this directory in the file intelligence scenario")
+    settings.add_argument("--crypto-key-size", type=int, metavar="BITS",
+                          help="issue pooled RSA keys of this size in the cryptography scenario")
+    settings.add_argument("--audit-log", metavar="PATH",
+                          help="append every scenario's completion to this hash-chained audit log")
+    settings.add_argument("--port-scan-target", metavar="HOST",
+                          help="scan this host's common service ports in the security scenario")
+    settings.add_argument("--agent-tasks", type=int, default=0, metavar="N",
+                          help="run N tasks on the agent runtime in the AI agents scenario")
+    settings.add_argument("--market-data", metavar="PATH",
+                          help="CSV/Parquet file or directory the business analyst scenario analyzes")
+    settings.add_argument("--scenario-cache", metavar="PATH",
+                          help="memoize scenario outputs in this file instead of the shared cache")
+    pitch_settings = parser.add_argument_group(
+        "investment pitch settings (menu options 3 and 5, run pitch)")
+    pitch_settings.add_argument("--valuation-scenarios", type=int, default=0, metavar="N",
+                                help="add a Monte Carlo valuation of N scenarios to the pitch")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="run scenarios headless and print JSON statistics")
+    run.add_argument("scenarios", nargs="+", metavar="SCENARIO",
+                     choices=sorted(headless.HEADLESS_SCENARIOS) + ["all"],
+                     help="scenario names: %(choices)s")
+    limit = run.add_mutually_exclusive_group()
+    limit.add_argument("-n", "--repeat", type=int, default=1,
+                       help="iterations to run (default: 1)")
+    limit.add_argument("-d", "--duration", type=float,
+                       help="run iterations for this many seconds instead")
+    run.add_argument("--warmup", type=int, default=0,
+                     help="untimed iterations to run first")
+    run.add_argument("--echo", action="store_true",
+                     help="send demo output to stderr instead of discarding it")
+    run.add_argument("--memo", action="store_true",
+                     help="replay memoized scenario outputs (timings then measure replays)")
+    run.add_argument("--profile-out", metavar="PREFIX",
+                     help="instrument every scenario and write PREFIX.json (and PREFIX.folded)")
+    run.add_argument("--cprofile", action="store_true", help="with --profile-out: run cProfile")
+    run.add_argument("--tracemalloc", action="store_true",
+                     help="with --profile-out: record allocation growth and peaks")
+    run.add_argument("--stacks", action="store_true",
+                     help="with --profile-out: sample folded stacks for flamegraphs")
+
+    commands.add_parser("startup-benchmark",
+                        help="check cold-start time and RSS of every menu option")
+
+    live = commands.add_parser("live-api", help="run the live API demo against a real backend")
+    live.add_argument("--base-url", default="http://localhost:8000",
+                      help="API base URL (default: %(default)s)")
+    live.add_argument("--mock", action="store_true",
+                      help="start a local mock server and run against it")
+    live.add_argument("--stream", action="store_true",
+                      help="stream AI replies over the WebSocket endpoint")
+    live.add_argument("--stream-url",
+                      help="WebSocket URL for --stream (default: derived from the base URL)")
+    live.add_argument("--port-scan-target", metavar="HOST",
+                      help="scan this host's common service ports in the security scan")
+    live.add_argument("--blocklist", action="append", default=[],
+                      help="score domains against this blocklist file (repeatable)")
+    live.add_argument("--allowlist", action="append", default=[],
+                      help="allowlist file for --blocklist scoring (repeatable)")
+    live.add_argument("--memory", metavar="DIR",
+                      help="conversation memory store to recall from and save to")
+
+    stream = commands.add_parser("stream-chat",
+                                 help="multiplex streaming conversations and print JSON metrics")
+    stream.add_argument("--url",
+                        help="WebSocket URL (default: a bundled local streaming echo server)")
+    stream.add_argument("--conversations", type=int, default=8,
+                        help="concurrent conversations (default: 8)")
+    stream.add_argument("--messages", type=int, default=len(streaming.STREAMING_MESSAGES),
+                        choices=range(1, len(streaming.STREAMING_MESSAGES) + 1),
+                        help="messages per conversation (default: %(default)s)")
+    stream.add_argument("--token-delay", type=float, default=0.005,
+                        help="bundled server: seconds between tokens")
+
+    load = commands.add_parser("loadgen", help="load-test the /v1/* endpoints and print JSON")
+    load.add_argument("--base-url",
+                      help="API base URL (default: a bundled local mock server)")
+    load.add_argument("--mode", choices=["closed", "open"], default="closed",
+                      help="closed: fixed virtual users; open: fixed arrival rate")
+    load.add_argument("--duration", type=float, default=10.0, help="seconds (default: 10)")
+    load.add_argument("--rate", type=float, default=100.0,
+                      help="open loop: requests per second (default: 100)")
+    load.add_argument("--poisson", action="store_true",
+                      help="open loop: Poisson instead of evenly spaced arrivals")
+    load.add_argument("--concurrency", type=int, default=16,
+                      help="closed loop: virtual users (default: 16)")
+    load.add_argument("--think-time", type=float, default=0.0,
+                      help="closed loop: seconds each user waits between requests")
+    load.add_argument("--connections", type=int, default=64,
+                      help="maximum open connections (default: 64)")
+    load.add_argument("--mix", type=loadgen.parse_mix, default=loadgen.LOADGEN_DEFAULT_MIX,
+                      help="endpoint weights, e.g. ai_chat=5,security_scan=3")
+    load.add_argument("--mock-latency", type=float, default=0.0,
+                      help="bundled mock: seconds to delay every response")
+    load.add_argument("--mock-fail-rate", type=float, default=0.0,
+                      help="bundled mock: fraction of requests answered with 503")
+
+    monitor = commands.add_parser("monitor", help="sample /proc system metrics and print JSON")
+    monitor.add_argument("--interval", type=float, default=1.0,
+                         help="seconds between samples (default: 1)")
+    monitor.add_argument("--duration", type=float, default=10.0,
+                         help="seconds to sample for (default: 10)")
+
+    scan = commands.add_parser("scan-files", help="analyze a directory tree and print JSON throughput")
+    scan.add_argument("root", help="directory to scan")
+    scan.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    scan.add_argument("--no-cache", action="store_true",
+                      help="analyze every file, ignoring and not updating the scan cache")
+
+    crypto_bench = commands.add_parser("crypto-bench", help="benchmark crypto primitives, print JSON")
+    crypto_bench.add_argument("--key-size", type=int, default=2048, help="RSA key size (default: 2048)")
+    crypto_bench.add_argument("--batch", type=int, default=1000, help="batch size (default: 1000)")
+    crypto_bench.add_argument("--duration", type=float, default=1.0,
+                              help="seconds per primitive (default: 1)")
+    crypto_bench.add_argument("--pool-size", type=int, default=4, help="ready RSA keys to keep")
+    crypto_bench.add_argument("--workers", type=int, default=2, help="key generation processes")
+
+    audit_bench = commands.add_parser("audit-bench",
+                                      help="group-commit write and parallel verify benchmark, JSON")
+    audit_bench.add_argument("path", help="audit log file (appended to)")
+    audit_bench.add_argument("--entries", type=int, default=100000)
+    audit_bench.add_argument("--writers", type=int, default=64, help="concurrent writer threads")
+    audit_bench.add_argument("--no-fsync", action="store_true", help="skip fsync on commit")
+    audit_bench.add_argument("--workers", type=int, help="verification processes (default: CPU count)")
+
+    verify = commands.add_parser("audit-verify", help="verify an audit log's hash chain, JSON")
+    verify.add_argument("path")
+    verify.add_argument("--workers", type=int, help="verification processes (default: CPU count)")
+
+    port_scan = commands.add_parser("port-scan", help="asyncio TCP connect scan, JSON summary")
+    port_scan.add_argument("host")
+    port_scan.add_argument("--ports", type=scanner.parse_ports, default=scanner.COMMON_PORTS,
+                           help="e.g. 1-1024,8080 (default: common service ports)")
+    port_scan.add_argument("--concurrency", type=int, default=500,
+                           help="maximum connects in flight (default: 500)")
+    port_scan.add_argument("--timeout", type=float, default=1.0,
+                           help="seconds per connect (default: 1)")
+    port_scan.add_argument("--no-adaptive", action="store_true",
+                           help="keep the full concurrency window instead of AIMD pacing")
+    port_scan.add_argument("--stream", action="store_true",
+                           help="print each open port as a JSON line as soon as it is found")
+    port_scan.add_argument("--all-results", action="store_true",
+                           help="with --stream: print closed and filtered ports too")
+    port_scan.add_argument("--listeners", type=int, default=0,
+                           help="open this many local listeners first and add their ports (self-test)")
+
+    scoring = commands.add_parser("reputation",
+                                  help="bulk-score domains found in a file, JSON summary")
+    scoring.add_argument("input", nargs="?", help='log or domain file ("-" for stdin)')
+    scoring.add_argument("--blocklist", action="append", default=[],
+                         help="blocklist file, plain or hosts format (repeatable)")
+    scoring.add_argument("--allowlist", action="append", default=[],
+                         help="allowlist file (repeatable)")
+    scoring.add_argument("--results", help="write domain<TAB>score<TAB>verdict lines here")
+    scoring.add_argument("--synthetic", type=int, metavar="N",
+                         help="benchmark instead: N-entry blocklist and N lookups")
+
+    workload = commands.add_parser("agents", help="run a mixed agent workload, JSON stats")
+    workload.add_argument("--tasks", type=int, default=2000, help="tasks to run (default: 2000)")
+    workload.add_argument("--workers", type=int, default=16, help="async workers (default: 16)")
+    workload.add_argument("--queue-size", type=int, default=256,
+                          help="queue capacity before submit waits (default: 256)")
+    workload.add_argument("--cpu-workers", type=int,
+                          help="processes for CPU-bound agents (default: CPU count)")
+    workload.add_argument("--mix", type=agents.parse_agent_mix,
+                          help="agent weights, e.g. research=3,security=1")
+
+    analytics = commands.add_parser("market-analytics",
+                                    help="incremental CAGR, CAC/LTV and margins over CSV/Parquet, JSON")
+    analytics.add_argument("path", help="CSV or Parquet file, or a directory of them")
+    analytics.add_argument("--generate", type=int, metavar="ROWS",
+                           help="first write ROWS synthetic rows to the CSV at path")
+    analytics.add_argument("--append", action="store_true",
+                           help="with --generate: append to the file instead of replacing it")
+    analytics.add_argument("--chunk-rows", type=int, default=250000,
+                           help="rows per streamed chunk (default: 250000)")
+    analytics.add_argument("--no-cache", action="store_true",
+                           help="read every row, ignoring and not updating the aggregate cache")
+
+    monte_carlo = commands.add_parser("valuation",
+                                      help="Monte Carlo valuation of the pitch projections, JSON")
+    monte_carlo.add_argument("--scenarios", type=int, default=10000000,
+                             help="scenarios to simulate (default: 10000000)")
+    monte_carlo.add_argument("--memory-mb", type=float, default=64,
+                             help="memory budget per chunk (default: 64)")
+    monte_carlo.add_argument("--workers", type=int, help="processes (default: CPU count)")
+    monte_carlo.add_argument("--seed", type=int)
+
+    runs = commands.add_parser("history", help="query the run history, JSON records")
+    runs.add_argument("view", choices=["runs", "results", "compare", "trend", "bench"],
+                      help="bench: insert synthetic runs and time the queries")
+    runs.add_argument("--db", default=RUN_HISTORY_PATH,
+                      help="history database (default: %(default)s)")
+    runs.add_argument("--last", type=int, help="most recent N runs or rows")
+    runs.add_argument("--component", help="demo_results component, e.g. ai_agents")
+    runs.add_argument("--since", help="ISO date or time to start from")
+    runs.add_argument("--bucket", choices=["minute", "hour", "day", "week"], default="day",
+                      help="trend bucket width (default: day)")
+    runs.add_argument("--runs", type=int, default=100000,
+                      help="bench: synthetic runs to insert (default: 100000)")
+
+    memory_bench = commands.add_parser("memory-bench",
+                                       help="conversation memory query latency by store size, JSON")
+    memory_bench.add_argument("--sizes", type=lambda text: [int(size) for size in text.split(",")],
+                              default=[1000, 10000, 100000],
+                              help="comma-separated store sizes (default: 1000,10000,100000)")
+    memory_bench.add_argument("--dim", type=int, default=256, help="embedding width (default: 256)")
+    memory_bench.add_argument("--queries", type=int, default=64, help="query batch size (default: 64)")
+    memory_bench.add_argument("-k", type=int, default=10, help="results per query (default: 10)")
+
+    serve = commands.add_parser("serve", help="serve demo results, pitch and chart over HTTP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--workers", type=int, default=1,
+                       help="worker processes sharing the socket (default: 1)")
+
+    serve_bench = commands.add_parser("serve-bench",
+                                      help="HTTP service requests/s, cached vs uncached, JSON")
+    serve_bench.add_argument("--workers", type=int, default=2, help="worker processes (default: 2)")
+    serve_bench.add_argument("--duration", type=float, default=3.0,
+                             help="seconds per path and mode (default: 3)")
+    serve_bench.add_argument("--concurrency", type=int, default=32,
+                             help="keep-alive clients (default: 32)")
+    serve_bench.add_argument("--paths", type=lambda text: text.split(","),
+                             default=["/demo/results", "/pitch/valuation_model", "/chart.png"],
+                             help="comma-separated paths to benchmark")
+
+    simulate = commands.add_parser("simulate",
+                                   help="run thousands of demo sessions on one loop, JSON")
+    simulate.add_argument("--sessions", type=int, default=5000,
+                          help="concurrent demo sessions (default: 5000)")
+    simulate.add_argument("--think-time", type=float, default=0.01,
+                          help="seconds each session pauses between scenarios (default: 0.01)")
+    simulate.add_argument("--dict", action="store_true",
+                          help="keep demo_results dicts instead of slots records")
+    simulate.add_argument("--compare", action="store_true",
+                          help="run both representations")
+
+    mock = commands.add_parser("mock-server", help="serve the local mock API until interrupted")
+    mock.add_argument("--host", default="127.0.0.1")
+    mock.add_argument("--port", type=int, default=8000)
+    mock.add_argument("--fail-rate", type=float, default=0.0,
+                      help="fraction of requests answered with 503")
+    mock.add_argument("--latency", type=float, default=0.0,
+                      help="seconds to delay every response")
+    return parser
+
+
+def _demo_options(args):
+    """run_billion_dollar_demo keyword arguments from the demo settings flags"""
+    return {"live_metrics": not args.no_live_metrics, "file_scan_root": args.file_scan_root,
+            "crypto_key_size": args.crypto_key_size, "audit_path": args.audit_log,
+            "port_scan_target": args.port_scan_target, "agent_tasks": args.agent_tasks,
+            "market_data": args.market_data, "scenario_cache_path": args.scenario_cache}
+
+
+def _pitch_options(args):
+    """run_investment_pitch keyword arguments from the pitch settings flags"""
+    return {"valuation_scenarios": args.valuation_scenarios}
+
+
+def cli(argv=None):
+    """Command-line entry point; returns the process exit code"""
+    args = _build_parser().parse_args(argv)
+    set_output_sink(OUTPUT_SINKS[args.output]())
+
+    if args.command == "startup-benchmark":
+        return startup.run_startup_benchmark()
+
+    if args.command == "run":
+        names = []
+        for name in args.scenarios:
+            names.extend(headless.HEADLESS_ALL if name == "all" else [name])
+        if args.profile_out:
+            enable_instrumentation(cprofile=args.cprofile, tracemalloc=args.tracemalloc,
+                                   stack_sampling=args.stacks)
+        # Benchmark the work itself unless replays are asked for
+        scenarios.SCENARIO_CACHE.enabled = args.memo
+        sink = ConsoleSink(sys.stderr) if args.echo else NullSink()
+        with use_output_sink(sink):
+            stats = asyncio.run(headless.run_headless(names, args.repeat, args.duration, args.warmup,
+                                                      {"billion-dollar": _demo_options(args),
+                                                       "pitch": _pitch_options(args)}))
+        if args.profile_out:
+            disable_instrumentation().export(args.profile_out)
+        print(json.dumps(stats, indent=2))
+        return 1 if stats["errors"] else 0
+
+    if args.command == "live-api":
+        asyncio.run(_run_live_api(args))
+        return 0
+
+    if args.command == "stream-chat":
+        print(json.dumps(asyncio.run(_run_stream_chat(args)), indent=2))
+        return 0
+
+    if args.command == "loadgen":
+        options = dict(mode=args.mode, mix=args.mix, duration=args.duration, rate=args.rate,
+                       concurrency=args.concurrency, max_connections=args.connections,
+                       think_time=args.think_time, poisson=args.poisson)
+        if args.base_url:
+            stats = asyncio.run(loadgen.run_load_test(args.base_url, **options))
+        else:
+            with mock_server.MockVisionMindServer(latency=args.mock_latency,
+                                                  fail_rate=args.mock_fail_rate) as server:
+                stats = asyncio.run(loadgen.run_load_test(server.base_url, **options))
+        print(json.dumps(stats, indent=2))
+        return 0
+
+    if args.command == "monitor":
+        with metrics.SystemMetricsSampler(interval=args.interval) as sampler:
+            time.sleep(args.duration)
+        print(json.dumps(sampler.report(), indent=2))
+        return 0
+
+    if args.command == "scan-files":
+        pipeline = files.FileIntelligencePipeline(workers=args.workers, use_cache=not args.no_cache)
+        print(json.dumps(pipeline.scan(args.root), indent=2))
+        return 0
+
+    if args.command == "crypto-bench":
+        print(json.dumps(crypto.benchmark_crypto(args.key_size, args.batch, args.duration,
+                                                 args.pool_size, args.workers), indent=2))
+        return 0
+
+    if args.command == "audit-bench":
+        print(json.dumps(audit.benchmark_audit_log(args.path, args.entries, args.writers,
+                                                   not args.no_fsync, args.workers), indent=2))
+        return 0
+
+    if args.command == "audit-verify":
+        report = audit.verify_audit_log(args.path, args.workers)
+        print(json.dumps(report, indent=2))
+        return 0 if report["valid"] else 1
+
+    if args.command == "port-scan":
+        print(json.dumps(asyncio.run(_run_port_scan_cli(args)), indent=2))
+        return 0
+
+    if args.command == "reputation":
+        if args.synthetic:
+            report = reputation.benchmark_reputation(args.synthetic, args.synthetic)
+        elif args.input:
+            engine = reputation.DomainReputationEngine(reputation.DomainSet.from_files(args.blocklist),
+                                                       reputation.DomainSet.from_files(args.allowlist))
+            with contextlib.ExitStack() as stack:
+                output = (stack.enter_context(open(args.results, "w", encoding="utf-8"))
+                          if args.results else None)
+                report = engine.score_file(args.input, output)
+        else:
+            _build_parser().error("reputation needs an input file or --synthetic N")
+        print(json.dumps(report, indent=2))
+        return 0
+
+    if args.command == "agents":
+        print(json.dumps(asyncio.run(agents.run_agent_workload(
+            args.tasks, args.workers, args.queue_size, args.cpu_workers, args.mix)), indent=2))
+        return 0
+
+    if args.command == "market-analytics":
+        if args.generate:
+            market.write_market_dataset(args.path, args.generate, append=args.append)
+        analytics = market.MarketAnalytics(args.chunk_rows, use_cache=not args.no_cache)
+        print(json.dumps(analytics.analyze(args.path), indent=2))
+        return 0
+
+    if args.command == "valuation":
+        engine = valuation.MonteCarloValuation.from_pitch(
+            pitch.VisionMindInvestmentPitch().pitch_data, memory_budget_mb=args.memory_mb,
+            workers=args.workers)
+        print(json.dumps(engine.run(args.scenarios, args.seed), indent=2))
+        return 0
+
+    if args.command == "history":
+        if args.view == "bench":
+            print(json.dumps(history.benchmark_run_history(args.runs), indent=2))
+            return 0
+        with history.RunHistoryStore(args.db) as store:
+            if args.view == "runs":
+                frame = store.runs(since=args.since, last=args.last)
+            elif args.view == "results":
+                frame = store.results(args.component, since=args.since, last=args.last)
+            elif args.view == "compare":
+                frame = store.compare(last=args.last or 5).reset_index()
+            else:
+                frame = store.trend(args.component, args.bucket, since=args.since)
+        print(frame.to_json(orient="records", date_format="iso", indent=2))
+        return 0
+
+    if args.command == "memory-bench":
+        print(json.dumps(memory.benchmark_memory_store(args.sizes, args.dim, args.queries, args.k),
+                         indent=2))
+        return 0
+
+    if args.command == "serve":
+        service.serve_http(service.app, args.host, args.port, args.workers)
+        return 0
+
+    if args.command == "serve-bench":
+        print(json.dumps(service.benchmark_service(args.workers, args.duration, args.concurrency,
+                                                   args.paths), indent=2))
+        return 0
+
+    if args.command == "simulate":
+        if args.compare:
+            report = simulation.benchmark_demo_sessions(args.sessions, args.think_time)
+        else:
+            report = simulation.simulate_demo_sessions(args.sessions, args.think_time, not args.dict)
+        print(json.dumps(report, indent=2))
+        return 0
+
+    if args.command == "mock-server":
+        server = mock_server.MockVisionMindServer(args.host, args.port, args.fail_rate, args.latency)
+        emit(f"🌐 Mock VisionMind API listening on {server.base_url}", flush=True)
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+        return 0
+
+    asyncio.run(main(_demo_options(args), _pitch_options(args)))
+    return 0
+
+
+async def _run_stream_chat(args):
+    conversations = [streaming.STREAMING_MESSAGES[:args.messages]] * args.conversations
+    if args.url:
+        return await streaming.run_streaming_conversations(args.url, conversations)
+    async with streaming.StreamingEchoServer(token_delay=args.token_delay) as server:
+        return await streaming.run_streaming_conversations(server.url, conversations)
+
+
+async def _run_live_api(args):
+    stream_url = args.stream_url
+    async with contextlib.AsyncExitStack() as stack:
+        if args.mock:
+            base_url = stack.enter_context(mock_server.MockVisionMindServer()).base_url
+            if args.stream and not stream_url:
+                stream_url = (await stack.enter_async_context(streaming.StreamingEchoServer())).url
+        else:
+            base_url = args.base_url
+            if args.stream and not stream_url:
+                stream_url = (re.sub(r"^http", "ws", base_url.rstrip("/"))
+                              + DEMO_CONFIG["api_endpoints"]["ai_stream"])
+        store = memory.ConversationMemory.open(args.memory) if args.memory else None
+        engine = None
+        if args.blocklist or args.allowlist:
+            engine = reputation.DomainReputationEngine(reputation.DomainSet.from_files(args.blocklist),
+                                                       reputation.DomainSet.from_files(args.allowlist))
+        await live_api.run_live_api_demo(base_url, live=True, stream_url=stream_url,
+                                         port_scan_target=args.port_scan_target,
+                                         reputation_engine=engine, memory=store)
+        if store is not None:
+            store.save(args.memory)
+
+
+async def _run_port_scan_cli(args):
+    def stream(result):
+        if result.state == "open" or args.all_results:
+            print(json.dumps(result._asdict()), flush=True)
+
+    on_result = stream if args.stream else None
+    if not args.listeners:
+        return await scanner.run_port_scan(args.host, args.ports, args.concurrency, args.timeout,
+                                           not args.no_adaptive, on_result)
+    with scanner.local_listeners(args.listeners, args.host) as expected:
+        ports = sorted(set(args.ports) | set(expected))
+        report = await scanner.run_port_scan(args.host, ports, args.concurrency, args.timeout,
+                                             not args.no_adaptive, on_result)
+    report["expected_open"] = expected
+    report["missed"] = sorted(set(expected) - set(report["open_ports"]))
+    return report
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(cli())
 
-# =============================================================================
-# USAGE INSTRUCTIONS (Preserved from original)
-# =============================================================================
 
 """
 🎯 USAGE INSTRUCTIONS:
@@ -720,6 +615,105 @@ python visionmind_complete_demo.py  # and select option
 # Quick 2-minute demo
 python -c "from __main__ import quick_demo; quick_demo()"
 
+# Check cold-start time and memory of every menu option against its budget
+python visionmind_complete_demo.py startup-benchmark
+
+# Headless: run scenarios 1000 times (or for 30s) and print JSON statistics
+python visionmind_complete_demo.py run quick pitch -n 1000
+python visionmind_complete_demo.py run all --duration 30
+
+# Per-scenario wall/CPU timers, cProfile, tracemalloc and flamegraph stacks
+python visionmind_complete_demo.py run billion-dollar --profile-out prof --cprofile --tracemalloc --stacks
+
+# Demo output as JSON lines, or none at all
+python visionmind_complete_demo.py --output jsonl live-api --mock
+python visionmind_complete_demo.py --output null
+
+# Live API demo against a real backend, or against a local mock server
+python visionmind_complete_demo.py live-api --base-url http://localhost:8000
+python visionmind_complete_demo.py live-api --mock
+python visionmind_complete_demo.py live-api --mock --stream
+python visionmind_complete_demo.py mock-server --port 8000 --fail-rate 0.1
+
+# Load-test the /v1/* endpoints (bundled mock server unless --base-url is given)
+python visionmind_complete_demo.py loadgen --mode closed --concurrency 32 --duration 10
+python visionmind_complete_demo.py loadgen --mode open --rate 500 --mix ai_chat=5,security_scan=3
+
+# Streaming chat: many WebSocket conversations on one event loop, TTFT and tokens/s
+python visionmind_complete_demo.py stream-chat --conversations 50
+
+# Sample real CPU/memory/disk/network metrics from /proc with 1s/10s/60s rollups
+python visionmind_complete_demo.py monitor --interval 0.5 --duration 30
+# (the billion-dollar demo's monitoring scenario samples /proc too; --no-live-metrics turns it off)
+python visionmind_complete_demo.py --no-live-metrics run billion-dollar
+
+# Analyze a directory tree on a process pool (unchanged files are skipped next time)
+python visionmind_complete_demo.py scan-files ~/Documents --workers 8
+# (or as the billion-dollar demo's file intelligence scenario)
+python visionmind_complete_demo.py --file-scan-root ~/Documents run billion-dollar
+
+# Operations per second for tokens, HMAC sign/verify and pooled RSA keys
+python visionmind_complete_demo.py crypto-bench --key-size 4096 --pool-size 4
+# (or RSA keys and HMAC batches in the billion-dollar demo's cryptography scenario)
+python visionmind_complete_demo.py --crypto-key-size 2048 run billion-dollar
+
+# Hash-chained audit trail: concurrent group-commit writes, parallel verification
+python visionmind_complete_demo.py audit-bench audit.log --entries 1000000 --writers 128
+python visionmind_complete_demo.py audit-verify audit.log
+# (the billion-dollar demo can log each scenario's completion too)
+python visionmind_complete_demo.py --audit-log demo-audit.log run billion-dollar
+
+# Asyncio port scan with adaptive pacing; --listeners self-tests against localhost
+python visionmind_complete_demo.py port-scan 127.0.0.1 --ports 1-65535 --stream
+python visionmind_complete_demo.py port-scan 127.0.0.1 --ports 20000-30000 --listeners 20
+# (the security scenario and the live API security scan take a target too)
+python visionmind_complete_demo.py --port-scan-target 127.0.0.1 run billion-dollar
+python visionmind_complete_demo.py live-api --mock --port-scan-target 127.0.0.1 --blocklist hosts.txt
+
+# Bulk domain reputation from logs against large block/allow lists
+python visionmind_complete_demo.py reputation access.log --blocklist hosts.txt --results scores.tsv
+python visionmind_complete_demo.py reputation --synthetic 1000000
+
+# Agent runtime sizing: priority queue, async workers, process pool for CPU-bound agents
+python visionmind_complete_demo.py agents --tasks 10000 --workers 64 --queue-size 512
+python visionmind_complete_demo.py --agent-tasks 2000 run billion-dollar
+
+# Market analytics over large CSV/Parquet data; re-runs only read appended rows
+# (CSV needs only pandas; Parquet needs the optional pyarrow: pip install pyarrow)
+python visionmind_complete_demo.py market-analytics market.csv --generate 10000000
+python visionmind_complete_demo.py market-analytics market.csv --generate 100000 --append
+python visionmind_complete_demo.py --market-data market.csv run billion-dollar
+
+# Billion-dollar scenarios, report and chart are memoized by input hash; unchanged ones replay
+# (the menu replays them; "run" recomputes unless --memo asks to time the replays)
+python visionmind_complete_demo.py run billion-dollar -n 100
+python visionmind_complete_demo.py run billion-dollar -n 100 --memo
+python visionmind_complete_demo.py --scenario-cache memo.json run billion-dollar -n 100 --memo
+
+# Monte Carlo valuation: percentiles and sensitivity tables from the financial projections
+python visionmind_complete_demo.py valuation --scenarios 10000000 --memory-mb 64
+# (or inside the investment pitch, menu option 3)
+python visionmind_complete_demo.py --valuation-scenarios 1000000 run pitch
+
+# Run history: every billion-dollar run from the menu lands in SQLite; compare and trend them
+python visionmind_complete_demo.py history runs --last 20
+python visionmind_complete_demo.py history compare --last 5
+python visionmind_complete_demo.py history trend --component ai_agents --bucket hour
+python visionmind_complete_demo.py history bench --runs 1000000
+
+# Conversation memory: recall across live demo runs, and query latency by store size
+python visionmind_complete_demo.py live-api --mock --memory ~/.cache/visionmind/memory
+python visionmind_complete_demo.py memory-bench --sizes 1000,10000,100000,1000000
+
+# HTTP service: demo results, pitch sections and the valuation chart with ETag caching
+python visionmind_complete_demo.py serve --port 8000 --workers 4
+uvicorn visionmind_complete_demo:app --workers 4
+python visionmind_complete_demo.py serve-bench --workers 4 --duration 5
+
+# Thousands of concurrent demo sessions on one loop: sessions/s and memory per session
+python visionmind_complete_demo.py simulate --sessions 20000 --think-time 0.05
+python visionmind_complete_demo.py simulate --sessions 5000 --compare
+
 🎯 KEY SELLING POINTS HIGHLIGHTED:
 
 1. $126B Market Opportunity - Massive TAM in enterprise AI
@@ -737,4 +731,4 @@ python -c "from __main__ import quick_demo; quick_demo()"
 • Path to $500M valuation in 5 years
 
 This complete demo package demonstrates why VisionMind AI v3.0 is easily worth $50M+ and has billion-dollar potential!
-"""
\ No newline at end of file
+"""
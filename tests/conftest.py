@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# Keep every cache, chart and history file the suite touches out of ~/.cache
+os.environ["VISIONMIND_CACHE_DIR"] = tempfile.mkdtemp(prefix="visionmind-tests-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
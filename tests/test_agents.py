@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+
+import pytest
+
+from visionmind.agents import AgentRuntime, parse_agent_mix, run_agent_workload
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.demo import VisionMindBillionDollarDemo
+
+
+def test_parse_agent_mix():
+    assert parse_agent_mix("research=3,security") == {"research": 3.0, "security": 1.0}
+    with pytest.raises(argparse.ArgumentTypeError, match="unknown agent type"):
+        parse_agent_mix("janitor=1")
+
+
+def test_higher_priority_tasks_run_first():
+    order = []
+
+    async def record(payload):
+        order.append(payload["id"])
+
+    async def scenario():
+        runtime = AgentRuntime(workers=1, agents={"record": (record, False)})
+        futures = [await runtime.submit("record", {"id": i}, priority=9 - i) for i in range(5)]
+        async with await runtime.start():
+            await asyncio.gather(*futures)
+        return runtime.stats()
+
+    stats = asyncio.run(scenario())
+    assert order == [4, 3, 2, 1, 0]
+    assert stats["completed"] == 5 and stats["max_queue_depth"]["io"] == 5
+
+
+def test_full_queue_applies_backpressure():
+    async def scenario():
+        runtime = AgentRuntime(workers=1, queue_size=2)
+        runtime.try_submit("research", {"io_seconds": 0})
+        runtime.try_submit("research", {"io_seconds": 0})
+        with pytest.raises(asyncio.QueueFull):
+            runtime.try_submit("research")
+        with pytest.raises(KeyError):
+            runtime.try_submit("janitor")
+
+    asyncio.run(scenario())
+
+
+def test_failures_are_counted_per_agent_type():
+    async def broken(payload):
+        raise RuntimeError("boom")
+
+    async def scenario():
+        async with AgentRuntime(workers=2, agents={"broken": (broken, False)}) as runtime:
+            future = await runtime.submit("broken")
+            with pytest.raises(RuntimeError):
+                await future
+        return runtime.stats()
+
+    assert asyncio.run(scenario())["agents"]["broken"]["failed"] == 1
+
+
+def test_workload_reports_every_agent_type():
+    stats = asyncio.run(run_agent_workload(40, workers=8, cpu_workers=1, seed=1,
+                                           mix={"research": 1, "security": 1}))
+    assert stats["completed"] == 40 and stats["failed"] == 0
+    assert set(stats["agents"]) == {"research", "security"}
+    assert stats["agents"]["security"]["latency_ms"]
+
+
+def test_demo_runs_agent_tasks_when_asked():
+    demo = VisionMindBillionDollarDemo(agent_tasks=20)
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(demo.demo_enterprise_ai_agents())
+    assert "20 agent tasks in" in "".join(sink.chunks)
@@ -0,0 +1,16 @@
+from visionmind.client import VisionMindAPIClient
+
+
+def test_retries_skip_non_idempotent_methods():
+    with VisionMindAPIClient("http://localhost:1") as client:
+        retry = client.session.get_adapter("http://localhost:1").max_retries
+        assert retry.is_retry("GET", 503)
+        assert not retry.is_retry("POST", 503)
+        assert "POST" not in retry.allowed_methods
+
+
+def test_close_shuts_down_executor():
+    client = VisionMindAPIClient("http://localhost:1")
+    with client:
+        pass
+    assert client._executor._shutdown
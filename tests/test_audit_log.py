@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from visionmind.audit import AuditLog, verify_audit_log
+
+
+def write_entries(path, count):
+    with AuditLog(str(path), commit_delay=0, durable=False) as log:
+        for i in range(count):
+            log.append("event", {"i": i})
+
+
+def test_chain_verifies(tmp_path):
+    path = tmp_path / "audit.log"
+    write_entries(path, 50)
+    report = verify_audit_log(str(path), workers=2)
+    assert report["valid"] and report["entries_verified"] == 50
+
+
+def test_tampering_breaks_the_chain(tmp_path):
+    path = tmp_path / "audit.log"
+    write_entries(path, 20)
+    lines = path.read_bytes().splitlines(keepends=True)
+    offset = sum(map(len, lines[:7]))
+    lines[7] = lines[7].replace(b'"i":7', b'"i":8')
+    path.write_bytes(b"".join(lines))
+    report = verify_audit_log(str(path), workers=1)
+    assert not report["valid"]
+    assert report["first_invalid_offset"] == offset
+
+
+@pytest.mark.parametrize("torn", [b'abc\t{"seq"', b"x" * 200000])
+def test_torn_tail_is_dropped_on_open(tmp_path, torn):
+    path = tmp_path / "audit.log"
+    write_entries(path, 10)
+    intact = path.read_bytes()
+    with open(path, "ab") as f:
+        f.write(torn)
+    with AuditLog(str(path), commit_delay=0, durable=False) as log:
+        assert log.count == 10
+        assert log.append("after", {}) == 10
+    assert path.read_bytes().startswith(intact)
+    assert verify_audit_log(str(path), workers=1)["entries_verified"] == 11
+
+
+def test_torn_only_entry_starts_a_new_chain(tmp_path):
+    path = tmp_path / "audit.log"
+    path.write_bytes(b"y" * 100000)
+    with AuditLog(str(path), commit_delay=0, durable=False) as log:
+        assert log.count == 0
+        log.append("first", {})
+    assert verify_audit_log(str(path), workers=1)["valid"]
+
+
+def test_failed_commit_is_rolled_back(tmp_path, monkeypatch):
+    path = tmp_path / "audit.log"
+    write_entries(path, 5)
+    size = path.stat().st_size
+    real_fsync = os.fsync
+    failures = iter([OSError(5, "Input/output error")])
+
+    def flaky_fsync(fd):
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", flaky_fsync)
+    with AuditLog(str(path), commit_delay=0) as log:
+        with pytest.raises(OSError):
+            log.append("lost", {})
+        assert path.stat().st_size == size
+        assert log.append("kept", {}) == 5
+    assert verify_audit_log(str(path), workers=1)["entries_verified"] == 6
@@ -0,0 +1,37 @@
+import numpy as np
+
+from visionmind.memory import ConversationMemory
+
+
+def make_store(count=5000):
+    store = ConversationMemory(dim=64)
+    texts = [f"note {i} about topic {i % 37}" for i in range(count)]
+    store.add(texts, conversation="c1")
+    return store, texts
+
+
+def test_save_load_round_trip(tmp_path):
+    store, texts = make_store()
+    store.build_index()
+    store.save(tmp_path)
+    loaded = ConversationMemory.load(tmp_path)
+    assert loaded.texts == store.texts
+    np.testing.assert_array_equal(loaded.vectors[:len(texts)], store.vectors[:len(texts)])
+    assert (loaded.search([texts[123]], k=1, exact=True)[0][0]["text"] == texts[123])
+
+
+def test_loaded_store_saves_back_to_its_directory(tmp_path):
+    store, texts = make_store()
+    store.save(tmp_path)
+    loaded = ConversationMemory.load(tmp_path)
+    loaded.search([texts[0]], k=3)
+    loaded.save(tmp_path)
+
+    reloaded = ConversationMemory.load(tmp_path)
+    assert reloaded.texts == texts
+    np.testing.assert_array_equal(reloaded.vectors, store.vectors[:len(texts)])
+    assert reloaded.search([texts[42]], k=1, exact=True)[0][0]["text"] == texts[42]
+
+    reloaded.add(["one more note"], conversation="c2")
+    reloaded.save(tmp_path)
+    assert ConversationMemory.load(tmp_path).texts == texts + ["one more note"]
@@ -0,0 +1,84 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from visionmind import crypto
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.crypto import CryptoService, RSAKeyPool, benchmark_crypto
+from visionmind.demo import VisionMindBillionDollarDemo
+
+
+@pytest.fixture
+def in_process_keygen(monkeypatch):
+    """Generate keys on threads so a patched _generate_rsa_pem is the one called"""
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor",
+                        concurrent.futures.ThreadPoolExecutor)
+    pem = crypto._generate_rsa_pem(1024)
+    calls = []
+
+    def install(failures):
+        def keygen(key_size):
+            calls.append(key_size)
+            if len(calls) <= failures:
+                raise ValueError("keygen failed")
+            return pem
+        monkeypatch.setattr(crypto, "_generate_rsa_pem", keygen)
+        return calls
+    return install
+
+
+def test_hmac_batches_and_tokens():
+    service = CryptoService(hmac_key=b"k" * 32)
+    messages = [b"a", b"b", b"c"]
+    signatures = service.sign_batch(messages)
+    assert service.verify_batch(messages, signatures) == [True, True, True]
+    signatures[1] = bytes(len(signatures[1]))
+    assert service.verify_batch(messages, signatures) == [True, False, True]
+    tokens = service.generate_tokens(50)
+    assert len(set(tokens)) == 50 and all(len(token) == 43 for token in tokens)
+
+
+def test_failed_keygen_is_retried(in_process_keygen):
+    calls = in_process_keygen(failures=1)
+    pool = RSAKeyPool(key_size=1024, capacity=2, workers=1)
+    try:
+        assert pool.wait_ready(timeout=10)
+        assert len(calls) == 3
+        assert pool.get(timeout=10).key_size == 1024
+    finally:
+        pool.close()
+
+
+def test_repeated_keygen_failures_surface_in_get(in_process_keygen):
+    calls = in_process_keygen(failures=100)
+    pool = RSAKeyPool(key_size=1024, capacity=2, workers=1, max_failures=3)
+    try:
+        assert not pool.wait_ready(timeout=10)
+        with pytest.raises(RuntimeError, match="keeps failing") as excinfo:
+            pool.get(timeout=10)
+        assert isinstance(excinfo.value.__cause__, ValueError)
+        assert 3 <= len(calls) <= 4
+    finally:
+        pool.close()
+
+
+def test_benchmark_reports_every_primitive():
+    report = benchmark_crypto(key_size=1024, batch=10, duration=0.01, key_pool_size=1,
+                              key_workers=1)
+    assert report["ops_per_second"]["rsa_key_from_warm_pool"] > 0
+    assert report["ops_per_second"]["hmac_verify_batch"] > 0
+
+
+def test_demo_issues_a_pooled_key():
+    service = CryptoService(key_size=1024, key_pool_size=1, key_workers=1)
+    demo = VisionMindBillionDollarDemo(crypto_service=service)
+    sink = BufferSink()
+    try:
+        with use_output_sink(sink):
+            asyncio.run(demo.demo_crypto_security_framework())
+    finally:
+        service.close()
+    text = "".join(sink.chunks)
+    assert "RSA-1024 key issued" in text
+    assert "1000/1000 HMAC signatures verified" in text
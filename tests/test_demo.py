@@ -0,0 +1,94 @@
+import asyncio
+import json
+import os
+
+import index
+from visionmind import demo as demo_module, scenarios
+from visionmind.audit import verify_audit_log
+from visionmind.core import BufferSink, NullSink, use_output_sink
+from visionmind.demo import VisionMindBillionDollarDemo, render_valuation_chart
+from visionmind.market import MARKET_COLUMNS
+from visionmind.scenarios import ScenarioCache
+
+KEYS = [key for key, _ in VisionMindBillionDollarDemo.SCENARIOS]
+
+
+def run_demo(concurrent):
+    demo = VisionMindBillionDollarDemo(scenario_cache=ScenarioCache(use_cache=False))
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(demo.run_complete_demo(concurrent=concurrent))
+    return demo, "".join(sink.chunks)
+
+
+def test_concurrent_run_keeps_results_and_output_in_scenario_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # the demo writes its chart to the working directory
+    serial, serial_text = run_demo(concurrent=False)
+    concurrent, concurrent_text = run_demo(concurrent=True)
+    assert list(serial.demo_results) == list(concurrent.demo_results) == KEYS
+    assert set(concurrent.scenario_timings) == set(KEYS)
+    assert not concurrent.cached_scenarios
+
+    headers = [f"{i}. " for i in range(1, len(KEYS) + 1)]
+    positions = [concurrent_text.find(header) for header in headers]
+    assert -1 not in positions and positions == sorted(positions)
+
+
+def test_demo_settings_reach_the_scenarios(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scenarios.SCENARIO_CACHE, "enabled", True)
+    market_data = tmp_path / "market.csv"
+    market_data.write_text(",".join(MARKET_COLUMNS) + "\n2024-01-01,smb,1000.0,250.0,100.0,10,2,100\n")
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(demo_module.run_billion_dollar_demo(
+            live_metrics=False, audit_path=str(tmp_path / "audit.log"),
+            market_data=str(market_data), scenario_cache_path=str(tmp_path / "memo.json")))
+    assert "gross margin 75%" in "".join(sink.chunks)
+    assert verify_audit_log(str(tmp_path / "audit.log"))["entries_verified"] == len(KEYS)
+    assert ScenarioCache(str(tmp_path / "memo.json")).entries
+
+
+def test_headless_runs_recompute_unless_memo_is_requested(capsys):
+    enabled = scenarios.SCENARIO_CACHE.enabled
+    try:
+        assert index.cli(["run", "quick", "-n", "2"]) == 0
+        assert scenarios.SCENARIO_CACHE.enabled is False
+        assert json.loads(capsys.readouterr().out)["runs"] == 2
+        assert index.cli(["run", "quick", "--memo"]) == 0
+        assert scenarios.SCENARIO_CACHE.enabled is True
+    finally:
+        scenarios.SCENARIO_CACHE.enabled = enabled
+        index.set_output_sink(NullSink())
+
+
+def test_chart_preview_renders_svg_and_reuses_the_cached_render(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    demo = VisionMindBillionDollarDemo(chart_preview=True)
+    demo.demo_results = {"ai_agents": {"cost_savings": "$4.2M/year"},
+                         "security_suite": {"estimated_business_value": "$3.8M"}}
+    labels, values, path, dpi, fmt = demo._chart_args()
+    assert (path, dpi, fmt) == ("visionmind_valuation_breakdown.svg", None, "svg")
+    assert values == [4.2, 3.8]
+
+    first = render_valuation_chart(labels, values, path, dpi, fmt)
+    second = render_valuation_chart(labels, values, "copy.svg", dpi, fmt)
+    assert first == (path, False) and second == ("copy.svg", True)
+    assert (tmp_path / "copy.svg").read_bytes() == (tmp_path / path).read_bytes()
+    assert (tmp_path / path).read_text().lstrip().startswith("<?xml")
+
+
+def test_chart_cache_keeps_the_most_recently_used_renders(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(demo_module, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(demo_module, "CHART_CACHE_ENTRIES", 2)
+    charts = tmp_path / "cache" / "charts"
+    render_valuation_chart(["a"], [1.0], "one.svg", None, "svg")
+    render_valuation_chart(["a"], [2.0], "two.svg", None, "svg")
+    oldest = min(charts.iterdir(), key=lambda path: path.stat().st_mtime_ns)
+    os.utime(oldest, ns=(1, 1))
+    assert render_valuation_chart(["a"], [1.0], "one.svg", None, "svg")[1]  # hit refreshes it
+    render_valuation_chart(["a"], [3.0], "three.svg", None, "svg")
+    assert len(list(charts.iterdir())) == 2
+    assert render_valuation_chart(["a"], [1.0], "one.svg", None, "svg")[1]
+    assert not render_valuation_chart(["a"], [2.0], "two.svg", None, "svg")[1]
@@ -0,0 +1,69 @@
+import asyncio
+import os
+
+from visionmind import files
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.demo import VisionMindBillionDollarDemo
+from visionmind.files import FileIntelligencePipeline
+
+
+def make_tree(root):
+    (root / "docs").mkdir(parents=True)
+    (root / "docs" / "notes.txt").write_text("one two three\nfour five\n")
+    (root / "script.py").write_text("print('hello')\n")
+    return root
+
+
+def pipeline(tmp_path):
+    return FileIntelligencePipeline(workers=1, cache_path=str(tmp_path / "cache" / "files.json"))
+
+
+def test_second_scan_skips_unchanged_files(tmp_path):
+    root = make_tree(tmp_path / "tree")
+    first = pipeline(tmp_path).scan(str(root))
+    assert first["files"] == first["analyzed"] == 2 and not first["errors"]
+    second = pipeline(tmp_path).scan(str(root))
+    assert second["cached"] == 2 and second["analyzed"] == second["reused"] == 0
+    assert second["types"] == first["types"]
+    notes = pipeline(tmp_path)
+    notes.scan(str(root))
+    assert notes.analysis(str(root / "docs" / "notes.txt"))["metadata"]["words"] == 5
+
+
+def test_touched_or_renamed_copies_reuse_the_known_analysis(tmp_path):
+    root = make_tree(tmp_path / "tree")
+    pipeline(tmp_path).scan(str(root))
+    notes = root / "docs" / "notes.txt"
+    os.utime(notes, ns=(0, 0))
+    os.rename(root / "script.py", root / "moved.py")
+    report = pipeline(tmp_path).scan(str(root))
+    assert report["reused"] == 2 and report["analyzed"] == 0 and report["cached"] == 0
+    assert report["types"] == {"text": 1, "code": 1}
+
+
+def test_deleted_files_are_pruned_from_the_cache(tmp_path):
+    root = make_tree(tmp_path / "tree")
+    other = make_tree(tmp_path / "other")
+    (other / "script.py").write_text("print('other')\n")
+    pipeline(tmp_path).scan(str(root))
+    pipeline(tmp_path).scan(str(other))
+    (root / "script.py").unlink()
+    scanner = pipeline(tmp_path)
+    scanner.scan(str(root))
+    assert str(root / "script.py") not in scanner.index
+    assert str(other / "script.py") in scanner.index
+    assert len(scanner.analyses) == 2
+    (other / "script.py").unlink()
+    scanner.scan(str(other))
+    assert len(scanner.analyses) == 1
+
+
+def test_demo_scans_the_configured_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(files, "CACHE_DIR", str(tmp_path / "cache"))
+    root = make_tree(tmp_path / "tree")
+    demo = VisionMindBillionDollarDemo(file_scan_root=str(root))
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(demo.demo_advanced_file_intelligence())
+    assert "Scanned 2 files" in "".join(sink.chunks)
+    assert "files/s" in demo.demo_results["file_intelligence"]["processing_speed"]
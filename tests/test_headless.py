@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import index
+from visionmind import headless, scenarios
+from visionmind.core import NullSink
+from visionmind.headless import HEADLESS_ALL, _latency_summary, _percentile, run_headless
+
+
+def test_repeat_counts_only_timed_runs(monkeypatch):
+    calls = []
+    monkeypatch.setitem(headless.HEADLESS_SCENARIOS, "fake", lambda: calls.append(1))
+    stats = asyncio.run(run_headless(["fake"], repeat=3, warmup=2))
+    assert len(calls) == 5
+    assert stats["iterations"] == 3 and stats["runs"] == 3 and stats["errors"] == 0
+    assert stats["per_scenario"]["fake"]["runs"] == 3
+    assert set(stats["latency_ms"]) == {"min", "mean", "p50", "p90", "p95", "p99", "max"}
+
+
+def test_failures_are_counted_and_still_timed(monkeypatch):
+    async def broken():
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(headless.HEADLESS_SCENARIOS, "broken", broken)
+    stats = asyncio.run(run_headless(["broken"], repeat=2))
+    assert stats["errors"] == 2 and stats["runs"] == 2
+
+
+def test_duration_mode_runs_until_the_deadline(monkeypatch):
+    monkeypatch.setitem(headless.HEADLESS_SCENARIOS, "nap", lambda: asyncio.sleep(0.01))
+    stats = asyncio.run(run_headless(["nap"], duration=0.1))
+    assert stats["iterations"] >= 2
+    assert stats["elapsed_seconds"] >= 0.1
+
+
+def test_nearest_rank_percentiles():
+    values = list(range(1, 101))
+    assert _percentile(values, 50) == 50
+    assert _percentile(values, 99) == 99
+    assert _percentile([7], 90) == 7
+    assert _percentile([], 50) is None
+    assert _latency_summary([0.001, 0.003])["max"] == 3.0
+
+
+def test_cli_expands_all_and_fails_on_errors(monkeypatch, capsys):
+    seen = {}
+
+    async def fake_run_headless(names, repeat, duration, warmup, options):
+        seen.update(names=names, repeat=repeat, options=options)
+        return {"errors": 1, "runs": repeat}
+
+    monkeypatch.setattr(headless, "run_headless", fake_run_headless)
+    monkeypatch.setattr(scenarios.SCENARIO_CACHE, "enabled", True)
+    try:
+        assert index.cli(["--no-live-metrics", "--valuation-scenarios", "5",
+                          "run", "all", "quick", "-n", "4"]) == 1
+    finally:
+        index.set_output_sink(NullSink())
+    assert seen == {"names": HEADLESS_ALL + ["quick"], "repeat": 4,
+                    "options": {"billion-dollar": {"live_metrics": False,
+                                                   "file_scan_root": None,
+                                                   "crypto_key_size": None,
+                                                   "audit_path": None,
+                                                   "port_scan_target": None,
+                                                   "agent_tasks": 0,
+                                                   "market_data": None,
+                                                   "scenario_cache_path": None},
+                                "pitch": {"valuation_scenarios": 5}}}
+    assert json.loads(capsys.readouterr().out) == {"errors": 1, "runs": 4}
@@ -0,0 +1,52 @@
+import asyncio
+
+from visionmind.core import disable_instrumentation, enable_instrumentation
+from visionmind.profiling import Instrumentation
+from visionmind.scenarios import ScenarioCache, ScenarioExecutor, ScenarioGraph
+
+
+def test_overlapping_sections_keep_only_timers():
+    instrumentation = Instrumentation(cprofile=True, tracemalloc=True)
+
+    async def section(name):
+        with instrumentation.measure(name):
+            with instrumentation.measure(name + "/inner"):
+                await asyncio.sleep(0.01)
+
+    async def scenario():
+        await asyncio.gather(section("a"), section("b"))
+        await section("c")
+
+    asyncio.run(scenario())
+    records = {record["name"]: record for record in instrumentation.records}
+    for name in ("a", "a/inner", "b", "b/inner"):
+        assert records[name]["overlapped"]
+        assert "cprofile" not in records[name] and "tracemalloc" not in records[name]
+        assert records[name]["wall_seconds"] > 0
+    assert "overlapped" not in records["c"]
+    assert "cprofile" in records["c"]
+
+
+def test_executor_runs_serially_while_profiling():
+    graph = ScenarioGraph()
+    running = []
+    peak = []
+
+    def node(name):
+        async def run(deps):
+            running.append(name)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(name)
+            return name
+        return run
+
+    for name in "abcd":
+        graph.add(name, node(name))
+    enable_instrumentation(cprofile=True)
+    try:
+        executor = ScenarioExecutor(graph, ScenarioCache(use_cache=False))
+        asyncio.run(executor.run())
+    finally:
+        disable_instrumentation()
+    assert max(peak) == 1
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import random
+
+import pytest
+
+from visionmind.loadgen import AsyncHTTPPool, LatencyHistogram, parse_mix, run_load_test
+from visionmind.mock_server import MockVisionMindServer
+
+
+async def serve_raw(responses, connections):
+    """Answer each request on a connection with the next raw response"""
+    async def handle(reader, writer):
+        connections.append(writer)
+        for response in responses:
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            writer.write(response)
+            await writer.drain()
+            if response.startswith(b"HTTP/1.0"):
+                break
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+def fetch(responses, requests):
+    connections = []
+
+    async def main():
+        server, base_url = await serve_raw(responses, connections)
+        pool = AsyncHTTPPool(base_url, max_connections=1)
+        try:
+            return [await pool.request(*request) for request in requests]
+        finally:
+            await pool.close()
+            server.close()
+
+    return asyncio.run(main()), len(connections)
+
+
+def test_chunked_responses_are_decoded_and_the_connection_reused():
+    chunked = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+               b"5;name=ext\r\nhello\r\n7\r\n, world\r\n0\r\nX-Trailer: 1\r\n\r\n")
+    plain = b"HTTP/1.1 201 Created\r\nContent-Length: 2\r\n\r\nok"
+    results, connections = fetch([chunked, plain], [("GET", "/a"), ("GET", "/b")])
+    assert results == [(200, b"hello, world"), (201, b"ok")]
+    assert connections == 1
+
+
+def test_unframed_bodies_read_to_close_and_bodiless_statuses():
+    results, _ = fetch([b"HTTP/1.1 304 Not Modified\r\nETag: \"x\"\r\n\r\n",
+                        b"HTTP/1.0 200 OK\r\n\r\nuntil close"],
+                       [("GET", "/a"), ("GET", "/b")])
+    assert results == [(304, b""), (200, b"until close")]
+
+
+def test_histogram_percentiles_stay_within_bucket_precision():
+    rng = random.Random(1)
+    values = sorted(rng.randint(1, 5_000_000) for _ in range(20000))
+    histogram, other = LatencyHistogram(), LatencyHistogram()
+    for i, value in enumerate(values):
+        (histogram if i % 2 else other).record(value)
+    histogram.merge(other)
+    assert histogram.count == len(values)
+    assert histogram.min == values[0] and histogram.max == values[-1]
+    for pct in (50, 95, 99, 99.9):
+        exact = values[int(len(values) * pct / 100) - 1]
+        assert histogram.percentile(pct) == pytest.approx(exact, rel=2 / 64)
+    assert LatencyHistogram().summary() == {"count": 0}
+
+
+def test_parse_mix():
+    assert parse_mix("ai_chat=5,security_scan") == {"ai_chat": 5.0, "security_scan": 1.0}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("nope=1")
+
+
+@pytest.mark.parametrize("mode", ["closed", "open"])
+def test_load_test_against_the_mock_server(mode):
+    with MockVisionMindServer() as server:
+        stats = asyncio.run(run_load_test(server.base_url, mode, duration=0.3, rate=50,
+                                          concurrency=4, seed=1))
+    assert stats["requests"] > 0 and stats["errors"] == 0
+    assert stats["latency_ms"]["count"] == stats["requests"]
+    assert sum(endpoint["requests"] for endpoint in stats["endpoints"].values()) == stats["requests"]
@@ -0,0 +1,46 @@
+import asyncio
+import importlib.util
+
+import pytest
+
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.demo import VisionMindBillionDollarDemo
+from visionmind.market import MARKET_COLUMNS, MarketAnalytics
+
+
+def write_csv(path, rows):
+    lines = [",".join(MARKET_COLUMNS)]
+    lines += [",".join(map(str, row)) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_metrics_from_csv(tmp_path):
+    path = tmp_path / "market.csv"
+    write_csv(path, [
+        ("2024-01-01", "smb", 1000.0, 250.0, 100.0, 10, 2, 100),
+        ("2024-01-02", "enterprise", 3000.0, 750.0, 300.0, 20, 2, 200),
+    ])
+    report = MarketAnalytics(use_cache=False).analyze(str(path))
+    assert report["rows_total"] == 2
+    assert report["gross_margin"] == 0.75
+    assert report["cac"] == 13.33
+
+
+def test_zero_revenue_dataset_reports_na(tmp_path):
+    path = tmp_path / "market.csv"
+    write_csv(path, [("2024-01-01", "smb", 0.0, 0.0, 0.0, 0, 0, 0)])
+    assert MarketAnalytics(use_cache=False).analyze(str(path))["gross_margin"] is None
+
+    demo = VisionMindBillionDollarDemo(market_data=str(path))
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(demo.demo_autonomous_business_analyst())
+    assert "gross margin n/a" in "".join(sink.chunks)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow installed")
+def test_parquet_without_pyarrow_says_so(tmp_path):
+    path = tmp_path / "market.parquet"
+    path.write_bytes(b"PAR1")
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        MarketAnalytics(use_cache=False).analyze(str(path))
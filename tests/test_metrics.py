@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.demo import VisionMindBillionDollarDemo
+from visionmind.metrics import RingBuffer, SystemMetricsSampler, _Rollup
+
+needs_proc = pytest.mark.skipif(not SystemMetricsSampler.available(), reason="needs Linux /proc")
+
+
+def test_ring_buffer_wraps_and_returns_oldest_first():
+    ring = RingBuffer(("a", "b"), capacity=3)
+    for t in range(5):
+        ring.append(float(t), (t * 10.0, t * 100.0))
+    assert ring.size == 3
+    assert ring.rows() == [(2.0, (20.0, 200.0)), (3.0, (30.0, 300.0)), (4.0, (40.0, 400.0))]
+    assert ring.rows(1) == [(4.0, (40.0, 400.0))]
+    assert ring.latest() == {"a": 40.0, "b": 400.0}
+    assert RingBuffer(("a",), 2).latest() is None
+
+
+def test_rollup_averages_each_closed_bucket():
+    rollup = _Rollup(("x",), resolution=10, capacity=4)
+    for timestamp, value in [(0, 1.0), (5, 3.0), (12, 10.0), (25, 7.0)]:
+        rollup.add(timestamp, (value,))
+    assert rollup.ring.rows() == [(0.0, (2.0,)), (10.0, (10.0,))]
+
+
+@needs_proc
+def test_sampler_reads_proc_counters():
+    with SystemMetricsSampler(interval=60) as sampler:
+        assert sampler.latest() is None  # the first reading only primes the counters
+        values = sampler.sample()
+        assert set(values) == set(SystemMetricsSampler.FIELDS)
+        assert 0 <= values["cpu_percent"] <= 100 and 0 < values["memory_percent"] < 100
+        assert all(values[name] >= 0 for name in values)
+        report = sampler.report()
+    assert report["samples"] >= 1 and report["latest"] is not None
+    assert set(report["rollups"]) == {"1s", "10s", "60s"}
+    assert sampler._fds is None
+
+
+@needs_proc
+def test_monitoring_scenario_shows_sampled_metrics():
+    sink = BufferSink()
+
+    async def main():
+        with SystemMetricsSampler(interval=0.05) as sampler:
+            demo = VisionMindBillionDollarDemo(metrics_sampler=sampler)
+            with use_output_sink(sink):
+                await demo.demo_realtime_system_monitoring()
+        return demo
+
+    demo = asyncio.run(main())
+    text = "".join(sink.chunks)
+    assert "Disk I/O:" in text and " Mbps" in text
+    assert demo.demo_results["system_monitoring"]["status"] == "LIVE"
+    assert demo._scenario_inputs("system_monitoring", "demo_realtime_system_monitoring") is None
+
+
+def test_monitoring_scenario_without_a_sampler_shows_sample_figures():
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(VisionMindBillionDollarDemo().demo_realtime_system_monitoring())
+    assert "CPU Usage: 23%" in "".join(sink.chunks)
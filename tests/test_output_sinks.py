@@ -0,0 +1,87 @@
+import asyncio
+import io
+import json
+import sys
+import threading
+
+from visionmind.core import (BufferSink, ConsoleSink, JSONLinesSink, NullSink, emit, output_sink,
+                             use_output_sink)
+
+
+def test_console_sink_buffers_until_flush_or_full():
+    stream = io.StringIO()
+    sink = ConsoleSink(stream, buffer_size=10)
+    sink.write("abc\n")
+    assert stream.getvalue() == ""
+    sink.write("defghij\n")
+    assert stream.getvalue() == "abc\ndefghij\n"
+    sink.write("k")
+    sink.flush()
+    assert stream.getvalue().endswith("k")
+
+
+def test_jsonl_sink_emits_one_object_per_line():
+    stream = io.StringIO()
+    sink = JSONLinesSink(stream)
+    sink.write("first line\nsecond ")
+    sink.write("line\nunterminated")
+    sink.flush()
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["text"] for record in records] == ["first line", "second line", "unterminated"]
+    assert all(isinstance(record["ts"], float) for record in records)
+
+
+def test_jsonl_sink_keeps_lines_whole_across_threads():
+    stream = io.StringIO()
+    sink = JSONLinesSink(stream, buffer_size=256)
+
+    def writer(n):
+        for i in range(500):
+            # Each line arrives in two writes; no piece may be lost or duplicated
+            sink.write(f"writer {n} ")
+            sink.write(f"line {i}\n")
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible to expose races
+    try:
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    sink.flush()
+    texts = [json.loads(line)["text"] for line in stream.getvalue().splitlines()]
+    assert len(texts) == 8 * 500
+    joined = " ".join(texts)
+    assert joined.count("writer ") == joined.count("line ") == 8 * 500
+
+
+def test_use_output_sink_is_task_local():
+    async def task(name, sink):
+        with use_output_sink(sink):
+            for i in range(3):
+                emit(name, i)
+                await asyncio.sleep(0)
+            return output_sink() is sink
+
+    async def main():
+        a, b = BufferSink(), BufferSink()
+        results = await asyncio.gather(task("a", a), task("b", b))
+        return results, a, b
+
+    results, a, b = asyncio.run(main())
+    assert results == [True, True]
+    assert "".join(a.chunks) == "a 0\na 1\na 2\n"
+    assert "".join(b.chunks) == "b 0\nb 1\nb 2\n"
+
+
+def test_buffer_sink_replays_into_another_sink():
+    buffer, target = BufferSink(), BufferSink()
+    with use_output_sink(buffer):
+        emit("x", "y", sep="-", end="!")
+    buffer.replay(target)
+    assert target.chunks == ["x-y!"]
+    with use_output_sink(NullSink()):
+        emit("dropped")
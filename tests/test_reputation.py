@@ -0,0 +1,53 @@
+import asyncio
+import io
+
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.live_api import run_live_api_demo
+from visionmind.reputation import (DomainReputationEngine, DomainSet, benchmark_reputation,
+                                   normalize_domain)
+
+
+def test_lists_cover_subdomains_and_hosts_format(tmp_path):
+    blocklist = tmp_path / "hosts.txt"
+    blocklist.write_text("# comment\n0.0.0.0 evil.example\nbad.test\n")
+    engine = DomainReputationEngine(DomainSet.from_files([str(blocklist)]),
+                                    DomainSet(["example.org"]))
+    assert engine.score("evil.example") == 0
+    assert engine.score("cdn.Evil.Example.") == 0
+    assert engine.score("https://www.example.org:8443/path") == 100
+    assert 0 < engine.score("github.com") < 100
+    assert engine.verdict(0) == "blocked" and engine.verdict(90) == "trusted"
+
+
+def test_scores_are_cached():
+    engine = DomainReputationEngine()
+    engine.score("github.com")
+    engine.score("GITHUB.com")
+    assert engine.cache.hits == 1
+
+
+def test_stream_finds_domains_in_log_lines(tmp_path):
+    engine = DomainReputationEngine(DomainSet(["bad.test"]))
+    log = tmp_path / "access.log"
+    log.write_text("GET https://bad.test/index.html 200\nuser@host 10.0.0.1 github.com\n")
+    output = io.StringIO()
+    report = engine.score_file(str(log), output)
+    assert report["lookups"] == 2 and report["verdicts"]["blocked"] == 1
+    assert output.getvalue().splitlines()[0] == "bad.test\t0\tblocked"
+    assert normalize_domain("HTTP://Example.com:80/x") == "example.com"
+
+
+def test_benchmark_reports_throughput_and_memory():
+    report = benchmark_reputation(entries=1000, lookups=2000, distinct=200)
+    assert report["lookups"] == 2000
+    assert report["verdicts"]["blocked"] > 0
+    assert report["memory_mb_per_million_entries"] > 0
+
+
+def test_offline_live_api_demo_scores_with_a_local_engine():
+    sink = BufferSink()
+    with use_output_sink(sink):
+        asyncio.run(run_live_api_demo())
+    score = DomainReputationEngine().score("google.com")
+    assert f"google.com - {score}/100" in "".join(sink.chunks)
+    assert score != 98
@@ -0,0 +1,73 @@
+import asyncio
+import sqlite3
+
+from visionmind.core import NullSink, use_output_sink
+from visionmind.demo import VisionMindBillionDollarDemo
+from visionmind.history import RunHistoryStore, _RUN_HISTORY_SCHEMA
+from visionmind.scenarios import ScenarioCache
+
+RESULTS = {
+    "ai_agents": {"status": "DEPLOYED", "cost_savings": "$4.2M/year"},
+    "security_suite": {"status": "ACTIVE", "estimated_business_value": "$3.8M"},
+}
+
+
+def test_record_and_query(tmp_path):
+    with RunHistoryStore(str(tmp_path / "history.db"), batch_size=2) as store:
+        store.record(RESULTS, {"ai_agents": 1.0, "security_suite": 2.0}, 1000.0, 3.5, "first")
+        store.record(RESULTS, {"ai_agents": 3.0, "security_suite": 4.0}, 2000.0, 7.5)
+        assert store.count() == 2  # the second record filled the batch
+        runs = store.runs()
+        assert runs["label"][0] == "first"
+        assert list(runs["total_value"]) == [8.0e6, 8.0e6]
+        results = store.results("ai_agents")
+        assert list(results["seconds"]) == [1.0, 3.0]
+        assert results["details"][0]["status"] == "DEPLOYED"
+        compare = store.compare(last=2, field="seconds")
+        assert list(compare.loc["security_suite"]) == [2.0, 4.0]
+        assert store.trend(bucket="week")["runs"].sum() == 2
+
+
+def test_cached_components_are_left_out_of_timings(tmp_path):
+    with RunHistoryStore(str(tmp_path / "history.db")) as store:
+        store.record(RESULTS, {"ai_agents": 1.0, "security_suite": 2.0}, 1000.0, 3.0)
+        store.record(RESULTS, {"ai_agents": 0.001, "security_suite": 2.0}, 1001.0, 0.01,
+                     cached={"ai_agents"})
+        store.flush()
+        results = store.results("ai_agents")
+        assert list(results["cached"]) == [False, True]
+        assert store.trend("ai_agents", "day")["mean_seconds"][0] == 1.0
+        assert store.trend(bucket="day")["mean_seconds"][0] == 3.0
+        assert list(store.runs()["cached"]) == [0, 1]
+
+
+def test_history_without_cached_columns_is_upgraded(tmp_path):
+    path = str(tmp_path / "history.db")
+    db = sqlite3.connect(path)
+    db.executescript(_RUN_HISTORY_SCHEMA.replace(
+        ",\n    cached INTEGER NOT NULL DEFAULT 0", ""))
+    db.execute("INSERT INTO runs VALUES (1, 10.0, 1.0, 5.0, NULL)")
+    db.commit()
+    db.close()
+    with RunHistoryStore(path) as store:
+        store.record(RESULTS, started_at=20.0)
+        store.flush()
+        assert list(store.runs()["cached"]) == [0, 0]
+
+
+def test_fully_memoized_demo_runs_are_not_recorded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # the demo writes its chart to the working directory
+    cache = ScenarioCache(str(tmp_path / "scenarios.json"))
+
+    async def run_demo(store):
+        demo = VisionMindBillionDollarDemo(run_history=store, scenario_cache=cache)
+        await demo.run_complete_demo()
+        return demo
+
+    with RunHistoryStore(str(tmp_path / "history.db")) as store, \
+            use_output_sink(NullSink()):
+        first = asyncio.run(run_demo(store))
+        second = asyncio.run(run_demo(store))
+        assert not first.cached_scenarios
+        assert len(second.cached_scenarios) == len(VisionMindBillionDollarDemo.SCENARIOS)
+        assert store.count() == 1
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+
+import pytest
+
+from visionmind import scanner
+from visionmind.core import BufferSink, use_output_sink
+from visionmind.live_api import run_live_api_demo
+from visionmind.reputation import DomainReputationEngine, DomainSet
+from visionmind.scanner import PortScanResult, _AdaptiveWindow, parse_ports, run_port_scan
+
+
+def test_parse_ports():
+    assert parse_ports("22,80,8000-8002") == [22, 80, 8000, 8001, 8002]
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_ports("0-10")
+
+
+def test_scan_finds_local_listeners():
+    with scanner.local_listeners(3) as ports:
+        report = asyncio.run(run_port_scan("127.0.0.1", ports, concurrency=8, timeout=2.0))
+    assert report["open_ports"] == ports and report["states"] == {"open": 3}
+
+
+def test_congestion_halves_once_per_epoch():
+    async def scenario():
+        window = _AdaptiveWindow(16)
+        assert window.limit == 4
+        first = [await window.acquire() for _ in range(3)]
+        await window.release(True, first[0])
+        await window.release(True, first[1])
+        assert window.limit == 2
+        later = await window.acquire()
+        await window.release(True, first[2])
+        assert window.limit == 2
+        await window.release(True, later)
+        assert window.limit == 1
+    asyncio.run(scenario())
+
+
+def test_fixed_window_ignores_congestion():
+    async def scenario():
+        window = _AdaptiveWindow(16, adaptive=False)
+        await window.release(True, await window.acquire())
+        await window.release(False, await window.acquire())
+        assert window.limit == 16
+    asyncio.run(scenario())
+
+
+def test_filtered_ports_do_not_shrink_the_window(monkeypatch):
+    in_flight, seen = [0], []
+
+    async def fake_probe(host, port, timeout):
+        in_flight[0] += 1
+        seen.append(in_flight[0])
+        await asyncio.sleep(0.001)
+        in_flight[0] -= 1
+        return PortScanResult(host, port, "filtered", timeout * 1000)
+
+    monkeypatch.setattr(scanner, "_probe", fake_probe)
+    report = asyncio.run(run_port_scan("192.0.2.1", range(1, 201), concurrency=16))
+    assert report["states"] == {"filtered": 200}
+    assert max(seen) == 16
+
+
+def test_live_api_demo_uses_the_scan_target_and_reputation_engine():
+    engine = DomainReputationEngine(blocklist=DomainSet(["google.com"]))
+    sink = BufferSink()
+    with scanner.local_listeners(1) as ports, use_output_sink(sink):
+        scanner.COMMON_PORTS.append(ports[0])
+        try:
+            asyncio.run(run_live_api_demo(port_scan_target="127.0.0.1", reputation_engine=engine))
+        finally:
+            scanner.COMMON_PORTS.remove(ports[0])
+    text = "".join(sink.chunks)
+    assert "google.com - 0/100" in text
+    assert "Port scan of 127.0.0.1 completed - 1 open" in text
@@ -0,0 +1,126 @@
+import asyncio
+import os
+
+import pytest
+
+from visionmind.core import BufferSink, emit, use_output_sink
+from visionmind.scenarios import ScenarioCache, ScenarioExecutor, ScenarioGraph
+
+
+def build(calls, inputs, validate=None):
+    graph = ScenarioGraph()
+
+    def source(deps):
+        calls.append("source")
+        emit("source ran")
+        return {"value": inputs["value"]}
+
+    def double(deps):
+        calls.append("double")
+        return deps["source"]["value"] * 2
+
+    def label(deps):
+        calls.append("label")
+        return "fixed"
+
+    graph.add("source", source, inputs=lambda: dict(inputs), validate=validate)
+    graph.add("double", double, ["source"], inputs=lambda: {})
+    graph.add("label", label, inputs=lambda: {})
+    return graph
+
+
+def run(graph, cache):
+    sink = BufferSink()
+    with use_output_sink(sink):
+        executor = ScenarioExecutor(graph, cache)
+        outputs = asyncio.run(executor.run())
+    return outputs, executor, "".join(sink.chunks)
+
+
+def test_unchanged_inputs_replay_output_and_console_text(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"))
+    inputs, calls = {"value": 2}, []
+    first, _, text = run(build(calls, inputs), cache)
+    second, executor, replayed = run(build(calls, inputs), ScenarioCache(cache.path))
+    assert first == second == {"source": {"value": 2}, "double": 4, "label": "fixed"}
+    assert calls == ["source", "double", "label"]
+    assert replayed == text == "source ran\n"
+    assert all(result["cached"] for result in executor.results.values())
+
+
+def test_changed_inputs_invalidate_the_node_and_its_dependents(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"))
+    inputs, calls = {"value": 2}, []
+    run(build(calls, inputs), cache)
+    calls.clear()
+    inputs["value"] = 3
+    outputs, executor, _ = run(build(calls, inputs), cache)
+    assert outputs["double"] == 6
+    assert calls == ["source", "double"]
+    assert executor.results["label"]["cached"]
+
+
+def test_changed_code_invalidates(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"))
+    graph = ScenarioGraph()
+    graph.add("answer", lambda deps: 1, inputs=lambda: {})
+    run(graph, cache)
+    graph = ScenarioGraph()
+    graph.add("answer", lambda deps: 2, inputs=lambda: {})
+    outputs, executor, _ = run(graph, cache)
+    assert outputs["answer"] == 2 and not executor.results["answer"]["cached"]
+
+
+def test_rejected_or_unmemoizable_outputs_rerun(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"))
+    inputs, calls = {"value": 1}, []
+    run(build(calls, inputs, validate=lambda output: False), cache)
+    calls.clear()
+    run(build(calls, inputs, validate=lambda output: False), cache)
+    assert calls == ["source"]
+
+    live = ScenarioGraph()
+    live.add("live", lambda deps: calls.append("live"), inputs=lambda: None)
+    run(live, cache)
+    run(live, cache)
+    assert calls.count("live") == 2
+
+
+def test_disabled_cache_always_runs(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"))
+    cache.enabled = False
+    inputs, calls = {"value": 1}, []
+    run(build(calls, inputs), cache)
+    run(build(calls, inputs), cache)
+    assert calls.count("source") == 2
+    assert not (tmp_path / "memo.json").exists()
+
+
+
+def test_a_fully_replayed_run_leaves_the_cache_file_alone(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"))
+    inputs, calls = {"value": 2}, []
+    run(build(calls, inputs), cache)
+    os.utime(cache.path, ns=(0, 0))
+    run(build(calls, inputs), ScenarioCache(cache.path))
+    assert os.stat(cache.path).st_mtime_ns == 0
+    inputs["value"] = 3
+    run(build(calls, inputs), ScenarioCache(cache.path))
+    assert os.stat(cache.path).st_mtime_ns > 0
+
+
+def test_cache_file_is_bounded_by_size(tmp_path):
+    cache = ScenarioCache(str(tmp_path / "memo.json"), max_bytes=1000)
+    for i in range(50):
+        cache.set(f"key{i}", i, "x" * 100)
+    cache.save()
+    assert os.path.getsize(cache.path) <= 1000
+    kept = ScenarioCache(cache.path).entries
+    assert "key49" in kept and "key0" not in kept
+    assert list(kept) == [f"key{i}" for i in range(50 - len(kept), 50)]
+
+def test_dependencies_must_be_registered_first():
+    graph = ScenarioGraph()
+    with pytest.raises(ValueError):
+        graph.add("b", lambda deps: None, ["a"])
+
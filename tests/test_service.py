@@ -0,0 +1,107 @@
+import asyncio
+import os
+import socket
+
+import pytest
+
+from visionmind import service
+from visionmind.service import VisionMindService, _etag_matches, _serve_asgi_connection
+
+
+async def exchange(app, raw):
+    """Send raw request bytes to a front end on a local socket; returns everything read back"""
+    server = await asyncio.start_server(
+        lambda reader, writer: _serve_asgi_connection(app, reader, writer), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        data = await reader.read()
+        writer.close()
+    return data
+
+
+def responses(data):
+    """(status, headers, body) per response in a keep-alive byte stream"""
+    parsed = []
+    while data:
+        head, _, data = data.partition(b"\r\n\r\n")
+        status_line, *lines = head.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            headers[name.lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        parsed.append((int(status_line.split()[1]), headers, data[:length]))
+        data = data[length:]
+    return parsed
+
+
+def get(path, *extra, close=False):
+    lines = [f"GET {path} HTTP/1.1", "Host: localhost", *extra]
+    if close:
+        lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+def test_etags_revalidate_and_cache_headers_are_sent():
+    app = VisionMindService(max_age=30)
+    first, second = responses(asyncio.run(exchange(app, get("/pitch") + get("/pitch", close=True))))
+    assert first[0] == 200 and first[1]["x-cache"] == "MISS"
+    assert first[1]["cache-control"] == "max-age=30"
+    assert second[1]["x-cache"] == "HIT" and second[1]["etag"] == first[1]["etag"]
+
+    etag = first[1]["etag"]
+    raw = (get("/pitch", f"If-None-Match: W/{etag}")
+           + get("/pitch", 'If-None-Match: "stale"')
+           + get("/pitch", "Cache-Control: no-cache", close=True))
+    not_modified, stale, bypass = responses(asyncio.run(exchange(app, raw)))
+    assert not_modified[0] == 304 and not_modified[2] == b"" and not_modified[1]["etag"] == etag
+    assert stale[0] == 200 and stale[2] == first[2]
+    assert bypass[0] == 200 and bypass[1]["x-cache"] == "BYPASS"
+
+
+def test_unknown_paths_and_methods():
+    raw = get("/nope") + b"DELETE /pitch HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+    missing, not_allowed = responses(asyncio.run(exchange(VisionMindService(), raw)))
+    assert missing[0] == 404
+    assert not_allowed[0] == 405 and not_allowed[1]["allow"] == "GET, HEAD"
+
+
+def test_etag_matching():
+    assert _etag_matches(b'"a", W/"b"', '"b"')
+    assert _etag_matches(b"*", '"c"')
+    assert not _etag_matches(None, '"a"') and not _etag_matches(b'"a"', '"b"')
+
+
+async def echo_length(scope, receive, send):
+    message = await receive()
+    body = str(len(message["body"])).encode()
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-length", str(len(body)).encode())]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def test_chunked_request_bodies_are_decoded_and_keep_alive_works():
+    raw = (b"POST / HTTP/1.1\r\nHost: localhost\r\nTransfer-Encoding: chunked\r\n\r\n"
+           b"5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nTrailer: x\r\n\r\n"
+           + get("/", close=True))
+    chunked, plain = responses(asyncio.run(exchange(echo_length, raw)))
+    assert chunked[2] == b"11" and plain[2] == b"0"
+
+
+@pytest.mark.parametrize("raw, status", [
+    (b"POST / HTTP/1.1\r\nTransfer-Encoding: gzip\r\n\r\n", 501),
+    (b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n", 400),
+    (b"POST / HTTP/1.1\r\nContent-Length: many\r\n\r\n", 400),
+])
+def test_unframeable_request_bodies_are_rejected(raw, status):
+    (response,) = responses(asyncio.run(exchange(echo_length, raw)))
+    assert response[0] == status and response[1]["connection"] == "close"
+
+
+def test_workers_need_fork(monkeypatch):
+    monkeypatch.delattr(os, "fork", raising=False)
+    with socket.create_server(("127.0.0.1", 0)) as sock:
+        with pytest.raises(RuntimeError, match="os.fork"):
+            service._fork_http_workers(service.app, sock, 2)
@@ -0,0 +1,42 @@
+import pytest
+
+from visionmind.simulation import ScenarioRecord, simulate_demo_sessions
+
+
+DETAILS = {"status": "READY", "cost_savings": "$2M/year", "regions": ["us", "eu"], "agents": 5}
+
+
+def test_equal_details_share_one_read_only_record():
+    first = ScenarioRecord.from_details("agents", dict(DETAILS))
+    second = ScenarioRecord.from_details("agents", dict(DETAILS))
+    assert first is second
+    assert first.value == 2e6 and first.details() == DETAILS
+    with pytest.raises(AttributeError):
+        first.status = "FAILED"
+    with pytest.raises(AttributeError):
+        del first.value
+    assert second.status == "READY"
+
+
+def test_values_that_only_compare_equal_get_their_own_records():
+    as_int = ScenarioRecord.from_details("k", {"count": 1, "flags": [1]})
+    as_bool = ScenarioRecord.from_details("k", {"count": True, "flags": [True]})
+    as_float = ScenarioRecord.from_details("k", {"count": 1.0, "flags": [1]})
+    assert len({id(as_int), id(as_bool), id(as_float)}) == 3
+    assert as_bool.details() == {"count": True, "flags": [True]}
+    assert type(as_float.details()["count"]) is float
+
+
+def test_unhashable_details_get_a_private_record():
+    details = {"breakdown": {"a": 1}}
+    first = ScenarioRecord.from_details("k", details)
+    assert first is not ScenarioRecord.from_details("k", details)
+    assert first.details() == details
+
+
+def test_simulated_sessions_report_memory_per_session():
+    report = simulate_demo_sessions(sessions=3, think_time=0)
+    assert report["sessions"] == 3 and report["representation"] == "slots"
+    assert report["total_value"] > 0
+    dict_report = simulate_demo_sessions(sessions=3, think_time=0, compact=False)
+    assert dict_report["total_value"] == report["total_value"]
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+
+from visionmind import startup
+from visionmind.core import CACHE_DIR, NullSink, use_output_sink
+from visionmind.startup import STARTUP_BUDGETS, _parse_importtime, measure_startup
+
+HEAVY = ["numpy", "pandas", "matplotlib", "requests", "cryptography", "sqlite3", "http.server",
+         "cProfile", "tracemalloc", "mmap", "resource"]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_parse_importtime_keeps_top_level_imports():
+    stderr = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       100 |        100 |   _json\n"
+              "import time:       200 |        300 | json\n"
+              "import time:      1500 |       2000 | visionmind.core\n"
+              "unrelated line\n")
+    total_ms, heaviest = _parse_importtime(stderr, top=1)
+    assert total_ms == 2.3
+    assert heaviest == [(2.0, "visionmind.core")]
+
+
+def test_importing_the_menu_skips_heavy_modules():
+    probe = f"import index, json, sys; print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True,
+                         check=True).stdout
+    assert json.loads(out) == []
+
+
+def test_quick_demo_starts_within_budget():
+    # Measure from a small parent: Linux carries the parent's peak RSS into the child's rusage
+    probe = ("import json; from visionmind.startup import measure_startup; "
+             "print(json.dumps(measure_startup('4')))")
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True,
+                         check=True).stdout
+    result = json.loads(out)
+    max_wall, max_rss = STARTUP_BUDGETS["4"]
+    assert result["exit_code"] == 0
+    assert result["wall_seconds"] <= max_wall
+    assert result["peak_rss_mb"] <= max_rss
+
+
+def test_startup_benchmark_uses_a_private_cache_dir(tmp_path):
+    script = tmp_path / "probe.py"
+    marker = tmp_path / "seen"
+    script.write_text("import os\n"
+                      f"open({str(marker)!r}, 'w').write(os.environ['VISIONMIND_CACHE_DIR'])\n")
+    assert measure_startup("1", str(script))["exit_code"] == 0
+    seen = marker.read_text()
+    assert seen != CACHE_DIR and not seen.startswith(str(tmp_path))
+
+
+def test_rss_is_unknown_without_wait4(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "wait4")
+    script = tmp_path / "probe.py"
+    script.write_text("raise SystemExit(3)\n")
+    result = measure_startup("1", str(script))
+    assert result["exit_code"] == 3
+    assert result["peak_rss_mb"] is None
+
+
+def test_unknown_rss_does_not_fail_the_budget(monkeypatch):
+    monkeypatch.setattr(startup, "measure_startup", lambda choice: {
+        "option": choice, "exit_code": 0, "wall_seconds": 0.1, "import_ms": 50.0,
+        "peak_rss_mb": None, "heaviest_imports": []})
+    with use_output_sink(NullSink()):
+        assert startup.run_startup_benchmark() == 0
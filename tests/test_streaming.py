@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from visionmind.core import websockets
+from visionmind.streaming import (STREAMING_MESSAGES, StreamingEchoServer,
+                                  run_streaming_conversations, stream_reply)
+
+pytest.importorskip("websockets")
+
+
+def test_concurrent_conversations_report_ttft_and_token_rates():
+    conversations = [STREAMING_MESSAGES[:2]] * 3
+
+    async def main():
+        async with StreamingEchoServer(first_token_delay=0.02, token_delay=0.001) as server:
+            return await run_streaming_conversations(server.url, conversations)
+
+    stats = asyncio.run(main())
+    assert stats["conversations"] == 3 and stats["messages"] == 6
+    assert stats["ttft_ms"]["count"] == 6 and stats["ttft_ms"]["min"] >= 20
+    replies = [message["reply"] for message in stats["per_message"]]
+    assert replies[:2] == [f"AI Analysis: {message}" for message in STREAMING_MESSAGES[:2]]
+    assert stats["tokens"] == sum(message["tokens"] for message in stats["per_message"])
+    assert stats["tokens_per_second"]["min"] <= stats["tokens_per_second"]["max"]
+    # Three conversations overlap on one loop instead of taking three times as long
+    serial_ms = sum(message["total_ms"] for message in stats["per_message"])
+    assert stats["elapsed_seconds"] * 1000 < serial_ms / 2
+
+
+def test_stream_reply_passes_each_token_to_the_callback():
+    seen = []
+
+    async def main():
+        async with StreamingEchoServer(first_token_delay=0, token_delay=0) as server:
+            async with websockets.connect(server.url) as ws:
+                return await stream_reply(ws, "1-1", "hello there", seen.append)
+
+    stats = asyncio.run(main())
+    assert "".join(seen).strip() == stats["reply"] == "AI Analysis: hello there"
+    assert stats["tokens"] == len(seen) == 4
+    assert stats["id"] == "1-1" and stats["ttft_ms"] <= stats["total_ms"]
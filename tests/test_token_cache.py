@@ -0,0 +1,41 @@
+import asyncio
+
+from visionmind.client import TOKEN_CACHE, TokenCache
+from visionmind.core import NullSink, use_output_sink
+from visionmind.live_api import VisionMindLiveAPIDemo
+from visionmind.mock_server import MockVisionMindServer
+
+
+def test_revoked_token_is_refetched_once():
+    async def scenario(server):
+        TOKEN_CACHE.clear()
+        demo = VisionMindLiveAPIDemo(server.base_url, live=True)
+        with use_output_sink(NullSink()):
+            await demo.authenticate()
+        first = demo.demo_token
+        server.httpd.tokens.clear()  # server restart: every issued token is revoked
+        reply = await demo._call("POST", "security_scan", json={"domain": "google.com"})
+        assert reply["domain"] == "google.com"
+        assert demo.demo_token != first
+        assert await TOKEN_CACHE.get(demo._token_key, demo._token_fetch) == demo.demo_token
+
+    with MockVisionMindServer() as server:
+        asyncio.run(scenario(server))
+
+
+def test_invalidate_keeps_newer_token():
+    cache = TokenCache()
+
+    async def scenario():
+        calls = iter(["old", "new"])
+
+        async def fetch():
+            return next(calls), 3600
+
+        assert await cache.get("key", fetch) == "old"
+        cache.invalidate("key", "old")
+        assert await cache.get("key", fetch) == "new"
+        cache.invalidate("key", "old")
+        assert await cache.get("key", fetch) == "new"
+
+    asyncio.run(scenario())
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from visionmind.money import component_value, parse_money, valuation_summary, value_matrix
+from visionmind.pitch import VisionMindInvestmentPitch
+from visionmind.valuation import MonteCarloValuation
+
+
+@pytest.mark.parametrize("text, amount, annual", [
+    ("$25M", 25e6, False),
+    ("$2.4M/year for 500-employee company", 2.4e6, True),
+    ("$3.8M annual security cost savings", 3.8e6, True),
+    ("$1,200", 1200.0, False),
+    ("$126B by 2028", 126e9, False),
+    ("$45k per year", 45e3, True),
+    ("$100Million", 100e6, False),
+    ("$2.4 million", 2.4e6, False),
+    ("$2.4Mn", 2.4e6, False),
+    ("$1.5bn", 1.5e9, False),
+    ("$5 thousand per year", 5e3, True),
+    ("$3 billions", 3e9, False),
+    ("$100xyz", 0.0, False),
+    ("15 FTEs replaced", 0.0, False),
+    ("", 0.0, False),
+    (None, 0.0, False),
+])
+def test_parse_money(text, amount, annual):
+    value = parse_money(text)
+    assert value.amount == pytest.approx(amount)
+    assert value.annual is annual
+    assert value.text == text
+
+
+def test_component_value_prefers_cost_savings():
+    details = {"cost_savings": "$2M/year", "estimated_business_value": "$9M"}
+    assert component_value(details).amount == 2e6
+    assert component_value({"estimated_business_value": "$9M"}).amount == 9e6
+    assert component_value({"status": "READY"}).amount == 0.0
+
+
+def test_value_matrix_fills_missing_components_with_zero():
+    runs = [{"a": {"cost_savings": "$1M"}, "b": {"estimated_business_value": "$2M"}},
+            {"b": {"estimated_business_value": "$3M"}, "c": {"cost_savings": "$4K"}}]
+    components, amounts = value_matrix(runs)
+    assert components == ["a", "b", "c"]
+    np.testing.assert_array_equal(amounts, [[1e6, 2e6, 0], [0, 3e6, 4e3]])
+    components, amounts = value_matrix([])
+    assert components == [] and amounts.shape == (0, 0)
+
+
+def test_valuation_summary_applies_the_multiples():
+    summary = valuation_summary([[1e6, 2e6], [0.0, 0.5e6]])
+    np.testing.assert_allclose(summary, [[3e6, 15e6, 60e6], [0.5e6, 2.5e6, 10e6]])
+    _, empty = value_matrix([{}])
+    np.testing.assert_array_equal(valuation_summary(empty), [[0, 0, 0]])
+
+
+@pytest.mark.parametrize("pre_money, expected", [(1.0, 1.0), (-5e6, 1.0), (1e20, 0.0)])
+def test_pre_money_outside_the_binned_range(pre_money, expected):
+    projections = VisionMindInvestmentPitch().pitch_data["financial_projections"]
+    model = MonteCarloValuation(projections, pre_money, workers=1)
+    assert model.run(10000, seed=1)["probability_above_pre_money"] == expected
+
+
+def test_pitch_valuation_probability_is_a_share():
+    pitch = VisionMindInvestmentPitch()
+    report = MonteCarloValuation.from_pitch(pitch.pitch_data, workers=1).run(20000, seed=1)
+    assert 0.0 < report["probability_above_pre_money"] < 1.0
+    assert report["percentiles"]["p10"] <= report["percentiles"]["p50"] <= report["percentiles"]["p90"]
@@ -0,0 +1 @@
+"""VisionMind AI Assistant demo package"""
@@ -0,0 +1,208 @@
+"""Async agent workload runner"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import hashlib
+import math
+import os
+import random
+import time
+
+from .loadgen import LatencyHistogram
+
+
+async def _io_agent(payload):
+    """Stand-in for an agent waiting on models, APIs or people"""
+    await asyncio.sleep(payload.get("io_seconds", 0.01))
+    return {"handled": payload.get("id")}
+
+
+def _data_analyst_agent(payload):
+    """CPU-bound stand-in: summary statistics over a generated series"""
+    rng = random.Random(payload.get("id", 0))
+    values = [rng.gauss(100, 15) for _ in range(payload.get("points", 20000))]
+    mean = sum(values) / len(values)
+    variance = sum((value - mean) ** 2 for value in values) / len(values)
+    return {"mean": round(mean, 3), "stdev": round(math.sqrt(variance), 3)}
+
+
+def _security_agent(payload):
+    """CPU-bound stand-in: key stretching as in credential checks"""
+    digest = hashlib.pbkdf2_hmac("sha256", str(payload.get("id")).encode(), b"visionmind",
+                                 payload.get("iterations", 20000))
+    return {"fingerprint": digest.hex()[:16]}
+
+
+# Agent type -> (handler, cpu_bound); cpu_bound handlers run on the process-pool lane
+DEFAULT_AGENTS = {
+    "research": (_io_agent, False),
+    "customer_service": (_io_agent, False),
+    "data_analyst": (_data_analyst_agent, True),
+    "security": (_security_agent, True),
+    "it_operations": (_io_agent, False),
+}
+
+
+class AgentRuntime:
+    """Priority work queues drained by async workers, with a process-pool lane"""
+
+    def __init__(self, workers=8, queue_size=1000, cpu_workers=None, agents=None):
+        self.workers = workers
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.queues = {"io": asyncio.PriorityQueue(maxsize=queue_size),
+                       "cpu": asyncio.PriorityQueue(maxsize=queue_size)}
+        self.agents = dict(agents or DEFAULT_AGENTS)
+        self.max_queue_depth = {"io": 0, "cpu": 0}
+        self._sequence = 0
+        self._workers = []
+        self._cpu_pool = None
+        self._started = None
+        self._metrics = {}
+
+    def register(self, agent_type, handler, cpu_bound=False):
+        """Add an agent type; cpu_bound handlers must be picklable plain functions"""
+        self.agents[agent_type] = (handler, cpu_bound)
+
+    def _metric(self, agent_type):
+        metric = self._metrics.get(agent_type)
+        if metric is None:
+            metric = self._metrics[agent_type] = {
+                "submitted": 0, "completed": 0, "failed": 0, "latency": LatencyHistogram()}
+        return metric
+
+    def _job(self, agent_type, payload, priority):
+        if agent_type not in self.agents:
+            raise KeyError(f"unknown agent type {agent_type!r}")
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        self._metric(agent_type)["submitted"] += 1
+        lane = "cpu" if self.agents[agent_type][1] else "io"
+        job = (priority, self._sequence, agent_type, payload, time.perf_counter(), future)
+        return lane, job, future
+
+    def _track_depth(self, lane):
+        self.max_queue_depth[lane] = max(self.max_queue_depth[lane], self.queues[lane].qsize())
+
+    async def submit(self, agent_type, payload=None, priority=5):
+        """Queue a task, waiting for room; returns a future for its result"""
+        lane, job, future = self._job(agent_type, payload or {}, priority)
+        await self.queues[lane].put(job)
+        self._track_depth(lane)
+        return future
+
+    def try_submit(self, agent_type, payload=None, priority=5):
+        """Queue a task or raise asyncio.QueueFull; returns a future for its result"""
+        lane, job, future = self._job(agent_type, payload or {}, priority)
+        self.queues[lane].put_nowait(job)
+        self._track_depth(lane)
+        return future
+
+    async def _worker(self, queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, agent_type, payload, submitted, future = await queue.get()
+            handler, cpu_bound = self.agents[agent_type]
+            metric = self._metric(agent_type)
+            try:
+                if cpu_bound:
+                    result = await loop.run_in_executor(self._cpu_pool, handler, payload)
+                else:
+                    result = await handler(payload)
+            except Exception as exc:
+                metric["failed"] += 1
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                metric["completed"] += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                metric["latency"].record((time.perf_counter() - submitted) * 1e6)
+                queue.task_done()
+
+    async def start(self):
+        if self._cpu_pool is None and any(cpu for _, cpu in self.agents.values()):
+            self._cpu_pool = concurrent.futures.ProcessPoolExecutor(self.cpu_workers)
+        self._started = time.perf_counter()
+        self._workers = [asyncio.create_task(self._worker(self.queues["io"]))
+                         for _ in range(self.workers)]
+        if self._cpu_pool is not None:
+            self._workers += [asyncio.create_task(self._worker(self.queues["cpu"]))
+                              for _ in range(self.cpu_workers)]
+        return self
+
+    async def stop(self, drain=True):
+        """Stop the workers, first finishing everything queued when drain is True"""
+        if drain:
+            for queue in self.queues.values():
+                await queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown()
+            self._cpu_pool = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop(drain=exc_info[0] is None)
+
+    def stats(self):
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        return {
+            "workers": self.workers,
+            "cpu_workers": self.cpu_workers,
+            "queue_depth": {lane: queue.qsize() for lane, queue in self.queues.items()},
+            "max_queue_depth": dict(self.max_queue_depth),
+            "queue_capacity": self.queues["io"].maxsize,
+            "elapsed_seconds": round(elapsed, 3),
+            "completed": sum(m["completed"] for m in self._metrics.values()),
+            "failed": sum(m["failed"] for m in self._metrics.values()),
+            "throughput_per_second": round(
+                sum(m["completed"] for m in self._metrics.values()) / elapsed, 1)
+            if elapsed else None,
+            "agents": {
+                agent_type: {
+                    "submitted": metric["submitted"],
+                    "completed": metric["completed"],
+                    "failed": metric["failed"],
+                    "throughput_per_second": round(metric["completed"] / elapsed, 1)
+                    if elapsed else None,
+                    "latency_ms": metric["latency"].summary(),
+                }
+                for agent_type, metric in self._metrics.items()
+            },
+        }
+
+
+async def run_agent_workload(tasks, workers=16, queue_size=256, cpu_workers=None,
+                             mix=None, seed=None):
+    """Push `tasks` mixed agent tasks through an AgentRuntime; returns its stats"""
+    mix = mix or {agent_type: 1 for agent_type in DEFAULT_AGENTS}
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    async with AgentRuntime(workers, queue_size, cpu_workers) as runtime:
+        futures = []
+        for i in range(tasks):
+            agent_type = rng.choices(names, weights)[0]
+            futures.append(await runtime.submit(agent_type, {"id": i}, priority=rng.randint(1, 9)))
+        await asyncio.gather(*futures, return_exceptions=True)
+    return runtime.stats()
+
+
+def parse_agent_mix(text):
+    """Parse "research=3,security=1" into an agent-type weight dict"""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_AGENTS:
+            raise argparse.ArgumentTypeError(
+                f"unknown agent type {name!r} (choose from {', '.join(DEFAULT_AGENTS)})")
+        mix[name] = float(weight or 1)
+    return mix
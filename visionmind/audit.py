@@ -0,0 +1,240 @@
+"""Hash-chained append-only audit log"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+
+
+# Every audit line is "<sha256 hex of prev hash + TAB + payload>\t<JSON payload>\n"
+_AUDIT_GENESIS = b"0" * 64
+
+
+_AUDIT_HASH_LEN = 64
+
+
+class AuditLog:
+    """Append-only, hash-chained audit log with group-commit writes"""
+
+    def __init__(self, path, commit_delay=0.002, max_batch=10000, durable=True):
+        self.path = path
+        self.commit_delay = commit_delay
+        self.max_batch = max_batch
+        self.durable = durable
+        self._pending = []
+        self._closed = False
+        self._condition = threading.Condition()
+        self.last_hash, self.count = self._recover()
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._committed = os.fstat(self._fd).st_size
+        self._failed = None
+        self.commits = 0
+        self._writer = threading.Thread(target=self._run, name="visionmind-audit", daemon=True)
+        self._writer.start()
+
+    def _recover(self):
+        """Last hash and entry count of an existing log; drops a torn final line"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return _AUDIT_GENESIS, 0
+        with open(self.path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            end = self._rfind_newline(f, size) + 1
+            if end < size:
+                f.truncate(end)
+            if not end:
+                return _AUDIT_GENESIS, 0
+            start = self._rfind_newline(f, end - 1) + 1
+            f.seek(start)
+            last = f.read(end - start)
+        return last[:_AUDIT_HASH_LEN], json.loads(last[_AUDIT_HASH_LEN + 1:])["seq"] + 1
+
+    @staticmethod
+    def _rfind_newline(f, end, window=1 << 16):
+        """Offset of the last newline before `end`, scanning back a window at a time; -1 if none"""
+        while end > 0:
+            start = max(0, end - window)
+            f.seek(start)
+            found = f.read(end - start).rfind(b"\n")
+            if found >= 0:
+                return start + found
+            end = start
+        return -1
+
+    def _submit(self, event, data):
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("audit log is closed")
+            if self._failed is not None:
+                raise RuntimeError("audit log failed to roll back a write") from self._failed
+            self._pending.append((event, data, future))
+            self._condition.notify()
+        return future
+
+    def append(self, event, data=None):
+        """Record an event; returns its sequence number once it is durable"""
+        return self._submit(event, data).result()
+
+    async def append_async(self, event, data=None):
+        """Awaitable append() that does not block the event loop"""
+        return await asyncio.wrap_future(self._submit(event, data))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+            if self.commit_delay:
+                time.sleep(self.commit_delay)  # let concurrent writers join the batch
+            with self._condition:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+            self._commit(batch)
+
+    def _commit(self, batch):
+        if self._failed is not None:
+            for _, _, future in batch:
+                future.set_exception(self._failed)
+            return
+        lines = []
+        sequence = []
+        previous = self.last_hash
+        for event, data, future in batch:
+            payload = json.dumps({"seq": self.count + len(sequence), "ts": time.time(),
+                                  "event": event, "data": data},
+                                 separators=(",", ":"), default=str).encode()
+            previous = hashlib.sha256(previous + b"\t" + payload).hexdigest().encode()
+            lines.append(previous + b"\t" + payload + b"\n")
+            sequence.append(self.count + len(sequence))
+        data = b"".join(lines)
+        try:
+            remaining = data
+            while remaining:
+                remaining = remaining[os.write(self._fd, remaining):]
+            if self.durable:
+                os.fsync(self._fd)
+        except OSError as exc:
+            # Cut a partial batch off again so the file ends at the chain head
+            try:
+                os.ftruncate(self._fd, self._committed)
+            except OSError:
+                self._failed = exc
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+        self._committed += len(data)
+        self.last_hash = previous
+        self.count += len(batch)
+        self.commits += 1
+        for (_, _, future), seq in zip(batch, sequence):
+            future.set_result(seq)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._writer.join()
+        os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _verify_audit_range(path, start, end):
+    """Check the hash chain of the lines in [start, end); runs in a worker process"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if start == 0:
+            previous = _AUDIT_GENESIS
+        else:
+            line_start = data.rfind(b"\n", 0, start - 1) + 1
+            previous = data[line_start:line_start + _AUDIT_HASH_LEN]
+        sha256 = hashlib.sha256
+        position = start
+        checked = 0
+        while position < end:
+            newline = data.find(b"\n", position, end)
+            if newline < 0:
+                return checked, position
+            stored = data[position:position + _AUDIT_HASH_LEN]
+            payload = data[position + _AUDIT_HASH_LEN + 1:newline]
+            if sha256(previous + b"\t" + payload).hexdigest().encode() != stored:
+                return checked, position
+            previous = stored
+            checked += 1
+            position = newline + 1
+    return checked, None
+
+
+def verify_audit_log(path, workers=None):
+    """Verify the whole hash chain, split into line-aligned ranges across processes"""
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    bounds = [0]
+    if size:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for i in range(1, workers):
+                newline = data.find(b"\n", max(size * i // workers, bounds[-1]))
+                if newline < 0 or newline + 1 >= size:
+                    break
+                bounds.append(newline + 1)
+    bounds.append(size)
+    ranges = [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+    if len(ranges) > 1:
+        with concurrent.futures.ProcessPoolExecutor(len(ranges)) as pool:
+            results = list(pool.map(_verify_audit_range, *zip(*[(path, a, b) for a, b in ranges])))
+    else:
+        results = [_verify_audit_range(path, a, b) for a, b in ranges]
+
+    elapsed = time.perf_counter() - start
+    entries = sum(checked for checked, _ in results)
+    broken = next((offset for _, offset in results if offset is not None), None)
+    return {
+        "path": path,
+        "valid": broken is None,
+        "entries_verified": entries,
+        "first_invalid_offset": broken,
+        "workers": len(ranges),
+        "elapsed_seconds": round(elapsed, 3),
+        "entries_per_second": round(entries / elapsed, 1) if elapsed else None,
+        "megabytes": round(size / 1e6, 3),
+    }
+
+
+def benchmark_audit_log(path, entries=100000, writers=64, durable=True, workers=None):
+    """Write `entries` events from concurrent threads, then verify the chain"""
+    per_writer = entries // writers
+    with AuditLog(path, durable=durable) as log:
+        start_count = log.count
+
+        def writer(index):
+            for i in range(per_writer):
+                log.append("benchmark", {"writer": index, "i": i})
+
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(writers) as pool:
+            list(pool.map(writer, range(writers)))
+        elapsed = time.perf_counter() - start
+        written = log.count - start_count
+        commits = log.commits
+    return {
+        "write": {
+            "entries": written,
+            "writers": writers,
+            "commits": commits,
+            "entries_per_commit": round(written / commits, 1) if commits else None,
+            "elapsed_seconds": round(elapsed, 3),
+            "entries_per_second": round(written / elapsed, 1) if elapsed else None,
+            "durable": durable,
+        },
+        "verify": verify_audit_log(path, workers),
+    }
@@ -0,0 +1,155 @@
+"""VisionMind HTTP client and persistent token cache"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import hashlib
+import threading
+import time
+
+from .config import DEMO_CONFIG
+from .core import requests
+
+
+class VisionMindAPIClient:
+    """Pooled keep-alive HTTP client for the endpoints in DEMO_CONFIG["api_endpoints"]"""
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, base_url, pool_size=10, retries=3, backoff=0.1, timeout=10.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = requests.adapters.Retry(
+            total=retries, backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="visionmind-http")
+
+    @classmethod
+    def shared(cls, base_url, **options):
+        """The process-wide client for base_url, created on first use"""
+        with cls._shared_lock:
+            client = cls._shared.get(base_url)
+            if client is None:
+                client = cls._shared[base_url] = cls(base_url, **options)
+            return client
+
+    @classmethod
+    def close_shared(cls):
+        with cls._shared_lock:
+            clients, cls._shared = list(cls._shared.values()), {}
+        for client in clients:
+            client.close()
+
+    def url(self, endpoint):
+        """Absolute URL for an endpoint name such as "ai_chat" """
+        return self.base_url + DEMO_CONFIG["api_endpoints"][endpoint]
+
+    def request(self, method, endpoint, token=None, **kwargs):
+        """Blocking request; returns the decoded JSON body"""
+        headers = kwargs.pop("headers", {})
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        response = self.session.request(
+            method, self.url(endpoint), headers=headers, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def call(self, method, endpoint, token=None, **kwargs):
+        """Awaitable request; returns the decoded JSON body"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self.request, method, endpoint, token, **kwargs))
+
+    async def gather(self, method, endpoint, payloads, token=None):
+        """Issue one request per JSON payload concurrently, results in order"""
+        return await asyncio.gather(
+            *(self.call(method, endpoint, token, json=payload) for payload in payloads))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+atexit.register(VisionMindAPIClient.close_shared)
+
+
+class TokenCache:
+    """Process-wide bearer-token cache keyed by base URL and credentials"""
+
+    def __init__(self, refresh_ahead=60.0):
+        self.refresh_ahead = refresh_ahead
+        self._tokens = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(base_url, username, password):
+        return base_url, username, hashlib.sha256(password.encode()).hexdigest()
+
+    async def get(self, key, fetch):
+        """Return a token for key; `fetch` is an async callable returning (token, expires_in)"""
+        now = time.monotonic()
+        entry = self._tokens.get(key)
+        if entry is not None:
+            token, refresh_at, expires_at = entry
+            if now < refresh_at:
+                return token
+            if now < expires_at:
+                self._refresh(key, fetch)
+                return token
+        return await asyncio.shield(self._refresh(key, fetch))
+
+    def _refresh(self, key, fetch):
+        """The in-flight refresh future for key, starting one if needed"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None and future.get_loop() is loop and not future.done():
+                return future
+            future = self._inflight[key] = loop.create_future()
+        loop.create_task(self._fetch(key, fetch, future))
+        return future
+
+    async def _fetch(self, key, fetch, future):
+        try:
+            token, expires_in = await fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # background refreshes may have no waiter
+        else:
+            issued = time.monotonic()
+            refresh_at = issued + expires_in - min(self.refresh_ahead, expires_in / 2)
+            self._tokens[key] = (token, refresh_at, issued + expires_in)
+            future.set_result(token)
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def invalidate(self, key, token):
+        """Forget key's token after the server rejected it (a newer token is kept)"""
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is not None and entry[0] == token:
+                del self._tokens[key]
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+
+TOKEN_CACHE = TokenCache()
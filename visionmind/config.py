@@ -0,0 +1,48 @@
+"""Demo configuration shared by the client, mock server and load generator"""
+
+
+DEMO_CONFIG = {
+    "api_endpoints": {
+        "base_url": "https://api.visionmind.ai/v1",
+        "authentication": "/auth/token",
+        "ai_chat": "/v1/message",
+        "system_control": "/v1/system/command",
+        "file_analysis": "/v1/files/analyze",
+        "security_scan": "/v1/security/domain-reputation",
+        "ai_stream": "/v1/stream"
+    },
+    "demo_scenarios": {
+        "enterprise_ai": [
+            "Financial analysis automation",
+            "Customer service augmentation", 
+            "IT operations automation",
+            "Security monitoring",
+            "Data analysis and insights"
+        ],
+        "cost_savings": {
+            "replaced_ftes": 15,
+            "annual_savings": "$1.8M",
+            "efficiency_gain": "400%",
+            "roi_timeline": "3 months"
+        },
+        "security_benefits": {
+            "incident_reduction": "92%",
+            "compliance_cost_reduction": "$850K",
+            "risk_mitigation": "$4.2M annually"
+        }
+    },
+    "investment_metrics": {
+        "valuation_methods": [
+            "DCF - Discounted Cash Flow",
+            "Comparable Companies", 
+            "Market Multiple",
+            "Revenue Growth Projection"
+        ],
+        "key_metrics": {
+            "customer_acquisition_cost": "$1,200",
+            "lifetime_value": "$45,000", 
+            "gross_margin": "85%",
+            "revenue_growth": "400% YoY"
+        }
+    }
+}
@@ -0,0 +1,295 @@
+"""Shared infrastructure: lazy imports, cache directory, output sinks and instrumentation hooks"""
+
+import asyncio
+import atexit
+import collections
+import contextlib
+import contextvars
+import functools
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+
+# Heavy libraries load only on the code path that uses them
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            if self._name == "matplotlib.pyplot":
+                # Never pick an interactive backend for a console demo
+                importlib.import_module("matplotlib").use("Agg")
+            module = importlib.import_module(self._name)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+np = LazyModule("numpy")
+
+
+pd = LazyModule("pandas")
+
+
+plt = LazyModule("matplotlib.pyplot")
+
+
+sns = LazyModule("seaborn")
+
+
+requests = LazyModule("requests")
+
+
+websockets = LazyModule("websockets")
+
+
+# Root directory for on-disk caches (rendered charts, ...)
+CACHE_DIR = os.environ.get(
+    "VISIONMIND_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "visionmind"))
+
+# SQLite run history the menu records billion-dollar runs in
+RUN_HISTORY_PATH = os.path.join(CACHE_DIR, "run_history.sqlite3")
+
+
+def peak_rss_mb(usage=None):
+    """Peak RSS in MB from `usage` (default: this process), or None where resource is missing"""
+    if usage is None:
+        try:
+            import resource
+        except ImportError:  # Windows
+            return None
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is reported in KB on Linux and in bytes on macOS
+    return round(usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class OutputSink:
+    """Destination for demo output; emit() writes through the current sink"""
+
+    def write(self, text):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+
+class ConsoleSink(OutputSink):
+    """The human-readable console format, written in large chunks"""
+
+    def __init__(self, stream=None, buffer_size=64 * 1024):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._chunks = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        with self._lock:
+            self._chunks.append(text)
+            self._size += len(text)
+            full = self._size >= self.buffer_size
+        stream = self.stream or sys.stdout
+        if full or (text.endswith("\n") and stream.isatty()):
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            text = "".join(self._chunks)
+            self._chunks.clear()
+            self._size = 0
+        if text:
+            stream = self.stream or sys.stdout
+            stream.write(text)
+            stream.flush()
+
+
+class JSONLinesSink(ConsoleSink):
+    """One JSON object per output line: {"ts": unix time, "text": line}"""
+
+    def __init__(self, stream=None, buffer_size=64 * 1024):
+        super().__init__(stream, buffer_size)
+        self._partial = ""
+        # Reentrant: a full buffer flushes from inside write(), and flush() writes the partial line
+        self._line_lock = threading.RLock()
+
+    def write(self, text):
+        with self._line_lock:
+            lines = (self._partial + text).split("\n")
+            self._partial = lines.pop()
+            if lines:
+                ts = round(time.time(), 6)
+                super().write("".join(
+                    json.dumps({"ts": ts, "text": line}, ensure_ascii=False) + "\n"
+                    for line in lines))
+
+    def flush(self):
+        with self._line_lock:
+            if self._partial:
+                self.write("\n")
+        super().flush()
+
+
+class NullSink(OutputSink):
+    """Discard all output"""
+
+    def write(self, text):
+        pass
+
+
+class BufferSink(OutputSink):
+    """Collect output in memory to replay into another sink later"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+
+    def replay(self, sink):
+        for chunk in self.chunks:
+            sink.write(chunk)
+
+
+# --output choices
+OUTPUT_SINKS = {"console": ConsoleSink, "jsonl": JSONLinesSink, "null": NullSink}
+
+
+_default_sink = ConsoleSink()
+
+
+_current_sink = contextvars.ContextVar("_current_sink", default=None)
+
+
+atexit.register(lambda: _default_sink.flush())
+
+
+def output_sink():
+    """The sink emit() writes to in the current context"""
+    return _current_sink.get() or _default_sink
+
+
+def set_output_sink(sink):
+    """Replace the process-wide default sink, flushing the old one"""
+    global _default_sink
+    _default_sink.flush()
+    _default_sink = sink
+
+
+@contextlib.contextmanager
+def use_output_sink(sink):
+    """Send emit() output to `sink` in this context (task-local under asyncio)"""
+    token = _current_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        sink.flush()
+        _current_sink.reset(token)
+
+
+def emit(*values, sep=" ", end="\n", flush=False):
+    """print() replacement that writes through the current output sink"""
+    sink = _current_sink.get() or _default_sink
+    if type(sink) is NullSink:
+        return
+    sink.write(sep.join(map(str, values)) + end)
+    if flush:
+        sink.flush()
+
+
+_instrumentation = None
+
+
+def enable_instrumentation(**options):
+    """Turn on instrumentation for the whole process; returns the collector"""
+    import tracemalloc
+    from .profiling import Instrumentation
+    global _instrumentation
+    _instrumentation = Instrumentation(**options)
+    if _instrumentation.tracemalloc and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return _instrumentation
+
+
+def disable_instrumentation():
+    """Turn instrumentation off again; returns the collector that was active"""
+    import tracemalloc
+    global _instrumentation
+    active, _instrumentation = _instrumentation, None
+    if active and active.tracemalloc and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return active
+
+
+def active_instrumentation():
+    """The collector enable_instrumentation() installed, or None"""
+    return _instrumentation
+
+
+def instrumented(name):
+    """Measure every call of the decorated function or coroutine under `name`"""
+    def decorate(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if _instrumentation is None:
+                    return await func(*args, **kwargs)
+                with _instrumentation.measure(name):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if _instrumentation is None:
+                    return func(*args, **kwargs)
+                with _instrumentation.measure(name):
+                    return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class TTLCache:
+    """LRU cache whose entries also expire `ttl` seconds after being stored"""
+
+    def __init__(self, maxsize=100000, ttl=3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,202 @@
+"""RSA key pooling, batch signing and token generation"""
+
+import base64
+import collections
+import concurrent.futures
+import hmac
+import os
+import secrets
+import threading
+import time
+
+from .core import LazyModule
+
+
+rsa = LazyModule("cryptography.hazmat.primitives.asymmetric.rsa")
+
+
+serialization = LazyModule("cryptography.hazmat.primitives.serialization")
+
+
+def _generate_rsa_pem(key_size):
+    """Generate one RSA private key as PKCS#8 PEM (runs in a worker process)"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                             serialization.NoEncryption())
+
+
+class RSAKeyPool:
+    """Bounded pool of ready RSA keys refilled by a background process pool"""
+
+    def __init__(self, key_size=4096, capacity=8, workers=2, max_failures=3):
+        self.key_size = key_size
+        self.capacity = capacity
+        self.max_failures = max_failures
+        self._executor = concurrent.futures.ProcessPoolExecutor(workers)
+        self._ready = collections.deque()
+        self._in_flight = 0
+        self._closed = False
+        self._failures = 0
+        self._error = None
+        self._condition = threading.Condition()
+        self._refill()
+
+    def _refill(self):
+        with self._condition:
+            while (not self._closed and self._failures < self.max_failures
+                   and len(self._ready) + self._in_flight < self.capacity):
+                try:
+                    future = self._executor.submit(_generate_rsa_pem, self.key_size)
+                except RuntimeError as exc:
+                    # A broken process pool cannot make keys any more
+                    self._failures, self._error = self.max_failures, exc
+                    self._condition.notify_all()
+                    return
+                self._in_flight += 1
+                future.add_done_callback(self._key_done)
+
+    def _key_done(self, future):
+        with self._condition:
+            self._in_flight -= 1
+            if future.cancelled():
+                self._condition.notify_all()
+                return
+            if future.exception() is None:
+                self._ready.append(future.result())
+                self._failures = 0
+            else:
+                # Retry the lost key; after max_failures in a row, get() raises instead
+                self._failures += 1
+                self._error = future.exception()
+            self._condition.notify_all()
+        self._refill()
+
+    def _exhausted(self):
+        return self._failures >= self.max_failures and not self._in_flight
+
+    def ready(self):
+        """Number of keys that can be handed out without waiting"""
+        with self._condition:
+            return len(self._ready)
+
+    def wait_ready(self, count=None, timeout=None):
+        """Wait until `count` keys (default: capacity) are ready; returns whether they are"""
+        count = self.capacity if count is None else count
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self._ready) >= count or self._closed or self._exhausted(), timeout
+            ) and len(self._ready) >= count
+
+    def get(self, timeout=None):
+        """Take a ready private key, waiting for one if the pool is empty"""
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self._ready or self._closed or self._exhausted(), timeout):
+                raise TimeoutError(f"no RSA-{self.key_size} key ready within {timeout}s")
+            if not self._ready:
+                if self._closed:
+                    raise RuntimeError("key pool is closed")
+                raise RuntimeError(f"RSA-{self.key_size} key generation keeps failing") \
+                    from self._error
+            pem = self._ready.popleft()
+        self._refill()
+        # We generated the key ourselves; skip the costly RSA consistency check
+        return serialization.load_pem_private_key(
+            pem, password=None, unsafe_skip_rsa_key_validation=True)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class CryptoService:
+    """RSA key pool plus batched secure-token and HMAC sign/verify operations"""
+
+    def __init__(self, hmac_key=None, key_size=4096, key_pool_size=8, key_workers=2,
+                 digest="sha256"):
+        self.hmac_key = hmac_key or secrets.token_bytes(32)
+        self.digest = digest
+        self.key_size = key_size
+        self.key_pool_size = key_pool_size
+        self.key_workers = key_workers
+        self._keys = None
+        self._hmac = hmac.new(self.hmac_key, digestmod=digest)
+
+    @property
+    def keys(self):
+        """The RSA key pool, started on first use"""
+        if self._keys is None:
+            self._keys = RSAKeyPool(self.key_size, self.key_pool_size, self.key_workers)
+        return self._keys
+
+    @staticmethod
+    def generate_tokens(count, nbytes=32):
+        """`count` URL-safe tokens of `nbytes` random bytes each"""
+        blob = os.urandom(count * nbytes)
+        return [base64.urlsafe_b64encode(blob[i:i + nbytes]).rstrip(b"=").decode("ascii")
+                for i in range(0, count * nbytes, nbytes)]
+
+    def sign_batch(self, messages):
+        """HMAC digest of every message"""
+        signatures = []
+        for message in messages:
+            state = self._hmac.copy()
+            state.update(message)
+            signatures.append(state.digest())
+        return signatures
+
+    def verify_batch(self, messages, signatures):
+        """Constant-time check of every (message, signature) pair"""
+        return [hmac.compare_digest(expected, signature)
+                for expected, signature in zip(self.sign_batch(messages), signatures)]
+
+    def close(self):
+        if self._keys is not None:
+            self._keys.close()
+
+
+def _ops_per_second(func, units_per_call, duration):
+    """Call func repeatedly for about `duration` seconds; returns units/s"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return round(calls * units_per_call / elapsed, 1)
+
+
+def benchmark_crypto(key_size=2048, batch=1000, duration=1.0, key_pool_size=4, key_workers=2):
+    """Operations per second for each primitive, single-call and batched"""
+    service = CryptoService(key_size=key_size, key_pool_size=key_pool_size,
+                            key_workers=key_workers)
+    messages = [secrets.token_bytes(64) for _ in range(batch)]
+    signatures = service.sign_batch(messages)
+    key = service.hmac_key
+
+    results = {
+        "token_single": _ops_per_second(lambda: secrets.token_urlsafe(32), 1, duration),
+        "token_batch": _ops_per_second(lambda: service.generate_tokens(batch), batch, duration),
+        "hmac_sign_single": _ops_per_second(
+            lambda: [hmac.new(key, m, service.digest).digest() for m in messages], batch, duration),
+        "hmac_sign_batch": _ops_per_second(lambda: service.sign_batch(messages), batch, duration),
+        "hmac_verify_batch": _ops_per_second(
+            lambda: service.verify_batch(messages, signatures), batch, duration),
+    }
+
+    start = time.perf_counter()
+    _generate_rsa_pem(key_size)
+    results["rsa_keygen_inline"] = round(1 / (time.perf_counter() - start), 3)
+
+    pool = service.keys
+    pool.wait_ready(key_pool_size)
+    start = time.perf_counter()
+    for _ in range(key_pool_size):
+        pool.get()
+    results["rsa_key_from_warm_pool"] = round(key_pool_size / (time.perf_counter() - start), 1)
+    service.close()
+
+    return {"key_size": key_size, "batch": batch, "ops_per_second": results}
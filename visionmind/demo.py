@@ -0,0 +1,580 @@
+"""The billion-dollar demo and its valuation chart"""
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+
+from .core import CACHE_DIR, LazyModule, active_instrumentation, emit, instrumented
+from .money import component_value, valuation_summary, value_matrix
+from .scenarios import (SCENARIO_CACHE, ScenarioCache, ScenarioExecutor, ScenarioGraph,
+                        code_fingerprint)
+
+agents = LazyModule("visionmind.agents")
+audit = LazyModule("visionmind.audit")
+crypto = LazyModule("visionmind.crypto")
+files = LazyModule("visionmind.files")
+history = LazyModule("visionmind.history")
+market = LazyModule("visionmind.market")
+metrics = LazyModule("visionmind.metrics")
+scanner = LazyModule("visionmind.scanner")
+
+
+class VisionMindBillionDollarDemo:
+    # Scenarios in presentation order, keyed by the demo_results entry they fill
+    SCENARIOS = [
+        ("business_analyst", "demo_autonomous_business_analyst"),
+        ("universal_control", "demo_universal_os_control"),
+        ("security_suite", "demo_advanced_security_suite"),
+        ("ai_agents", "demo_enterprise_ai_agents"),
+        ("system_monitoring", "demo_realtime_system_monitoring"),
+        ("file_intelligence", "demo_advanced_file_intelligence"),
+        ("crypto_framework", "demo_crypto_security_framework"),
+    ]
+
+    def __init__(self, chart_preview=False, metrics_sampler=None, file_scan_root=None,
+                 crypto_service=None, audit_log=None, port_scan_target=None, agent_tasks=0,
+                 run_history=None, market_data=None, scenario_cache=None):
+        self.demo_results = {}
+        self.chart_preview = chart_preview
+        self.metrics_sampler = metrics_sampler
+        self.file_scan_root = file_scan_root
+        self.crypto_service = crypto_service
+        self.audit_log = audit_log
+        self.port_scan_target = port_scan_target
+        self.agent_tasks = agent_tasks
+        self.run_history = run_history
+        self.market_data = market_data
+        self.scenario_cache = scenario_cache
+        self.scenario_timings = {}
+        self.cached_scenarios = set()
+        self.total_run_time = None
+        self.start_time = datetime.now()
+        
+    async def run_complete_demo(self, concurrent=False, max_concurrency=None,
+                                scenario_timeout=None):
+        """Run all demo scenarios showcasing $50M+ value proposition"""
+        emit("🚀 VISIONMIND AI v3.0 - BILLION-DOLLAR DEMO")
+        emit("=" * 60)
+        
+        start = time.perf_counter()
+        executor = ScenarioExecutor(self.scenario_graph(scenario_timeout), self.scenario_cache,
+                                    max_concurrency if concurrent else 1)
+        outputs = await executor.run()
+        self.total_run_time = time.perf_counter() - start
+        self._collect_results(outputs)
+        for key, _ in self.SCENARIOS:
+            if executor.results[key]["cached"]:
+                self.cached_scenarios.add(key)
+                await self._audit_scenario(key, executor.results[key]["seconds"], cached=True)
+        
+        # A run replayed entirely from the scenario cache measured nothing
+        if self.run_history is not None and len(self.cached_scenarios) < len(self.SCENARIOS):
+            self.run_history.record_demo(self)
+            self.run_history.flush()
+
+    def scenario_graph(self, scenario_timeout=None):
+        """The scenarios, then the report and chart built from all of them"""
+        graph = ScenarioGraph()
+        for key, method in self.SCENARIOS:
+            graph.add(key, functools.partial(self._scenario_node, key, method, scenario_timeout),
+                      inputs=functools.partial(self._scenario_inputs, key, method),
+                      validate=lambda output: (output or {}).get("status") != "TIMEOUT")
+        keys = [key for key, _ in self.SCENARIOS]
+        graph.add("report", self._report_node, keys,
+                  inputs=lambda: {"code": code_fingerprint(self.generate_demo_report)})
+        graph.add("chart", self._chart_node, keys,
+                  inputs=lambda: {"args": self._chart_args()[2:],
+                                  "code": code_fingerprint(_draw_valuation_chart)},
+                  validate=self._chart_is_current)
+        return graph
+
+    def _scenario_inputs(self, key, method):
+        """What a scenario's output depends on; None when it measures something live"""
+        live = {
+            "security_suite": self.port_scan_target,
+            "ai_agents": self.agent_tasks,
+            "system_monitoring": self.metrics_sampler,
+            "file_intelligence": self.file_scan_root,
+            "crypto_framework": self.crypto_service,
+        }
+        if live.get(key):
+            return None
+        inputs = {"code": code_fingerprint(getattr(type(self), method))}
+        if key == "business_analyst" and self.market_data:
+            inputs["market_data"] = [
+                (path, os.stat(path).st_size, os.stat(path).st_mtime_ns)
+                for path in market.MarketAnalytics.dataset_files(self.market_data)]
+        return inputs
+
+    async def _scenario_node(self, key, method, timeout, deps):
+        await self._run_scenario(key, method, timeout)
+        return self.demo_results.get(key)
+
+    def _collect_results(self, outputs):
+        """Rebuild demo_results from scenario outputs, in scenario order"""
+        self.demo_results = {key: outputs[key] for key, _ in self.SCENARIOS
+                             if outputs.get(key) is not None}
+
+    def _report_node(self, deps):
+        self._collect_results(deps)
+        self.generate_demo_report(chart=False)
+
+    async def _chart_node(self, deps):
+        self._collect_results(deps)
+        await self.create_valuation_chart_async()
+        path = self._chart_args()[2]
+        with open(path, "rb") as f:
+            return {"path": path, "sha256": hashlib.sha256(f.read()).hexdigest()}
+
+    @staticmethod
+    def _chart_is_current(output):
+        """A memoized chart counts only while the file on disk is still that chart"""
+        try:
+            with open(output["path"], "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest() == output["sha256"]
+        except OSError:
+            return False
+
+    async def _run_scenario(self, key, method, timeout):
+        """Run one scenario coroutine, recording its wall time"""
+        start = time.perf_counter()
+        try:
+            instrumentation = active_instrumentation()
+            if instrumentation is None:
+                await asyncio.wait_for(getattr(self, method)(), timeout)
+            else:
+                with instrumentation.measure(key):
+                    await asyncio.wait_for(getattr(self, method)(), timeout)
+        except asyncio.TimeoutError:
+            emit(f"\n⏱️ {key.upper().replace('_', ' ')} timed out after {timeout}s")
+            self.demo_results[key] = {"status": "TIMEOUT"}
+        self.scenario_timings[key] = time.perf_counter() - start
+        await self._audit_scenario(key, self.scenario_timings[key])
+
+    async def _audit_scenario(self, key, seconds, cached=False):
+        if self.audit_log is not None:
+            details = {
+                "scenario": key,
+                "status": self.demo_results.get(key, {}).get("status"),
+                "seconds": round(seconds, 6),
+            }
+            if cached:
+                details["cached"] = True
+            await self.audit_log.append_async("scenario_completed", details)
+    
+    async def demo_autonomous_business_analyst(self):
+        """Showcase AI-powered business intelligence"""
+        emit("\n📊 1. AUTONOMOUS BUSINESS ANALYST")
+        emit("-" * 40)
+        
+        # Simulate market analysis
+        analysis_data = {
+            "market_trends": {
+                "ai_assistant_market_growth": "32% CAGR 2024-2030",
+                "total_addressable_market": "$126B by 2028",
+                "competitive_advantage": "Universal OS Control + Advanced AI",
+                "revenue_projections": ["$5M Year1", "$25M Year2", "$100M Year3"]
+            },
+            "financial_metrics": {
+                "customer_acquisition_cost": "$1,200",
+                "lifetime_value": "$45,000",
+                "gross_margin": "85%",
+                "potential_valuation_multiple": "20x revenue"
+            }
+        }
+        
+        if self.market_data:
+            loop = asyncio.get_running_loop()
+            stats = await loop.run_in_executor(
+                None, market.MarketAnalytics().analyze, self.market_data)
+            cac, ltv, margin = stats["cac"], stats["ltv"], stats["gross_margin"]
+            analysis_data["financial_metrics"].update({
+                "customer_acquisition_cost": f"${cac:,.0f}" if cac else "n/a",
+                "lifetime_value": f"${ltv:,.0f}" if ltv else "n/a",
+                "gross_margin": f"{margin:.0%}" if margin is not None else "n/a",
+            })
+            emit(f"📈 {stats['rows_total']:,} market rows analyzed "
+                 f"({stats['rows_processed']:,} new in {stats['elapsed_seconds']}s)")
+            if stats["revenue_cagr"] is not None:
+                emit(f"   Revenue CAGR: {stats['revenue_cagr']:.1%}")
+            emit(f"   CAC {analysis_data['financial_metrics']['customer_acquisition_cost']}, "
+                 f"LTV {analysis_data['financial_metrics']['lifetime_value']}, "
+                 f"LTV/CAC {stats['ltv_to_cac'] or 'n/a'}x, "
+                 f"gross margin {analysis_data['financial_metrics']['gross_margin']}")
+        
+        emit("✅ Real-time Market Analysis Generated")
+        emit("✅ Financial Projections Calculated")
+        emit("✅ Competitive Landscape Mapped")
+        
+        self.demo_results["business_analyst"] = {
+            "status": "COMPLETED",
+            "estimated_business_value": "$25M",
+            "time_saved": "240 hours/month",
+            "insights_generated": "15+ strategic insights"
+        }
+    
+    async def demo_universal_os_control(self):
+        """Showcase cross-platform automation capabilities"""
+        emit("\n💻 2. UNIVERSAL OS CONTROL SYSTEM")
+        emit("-" * 40)
+        
+        # Demonstrate system command execution
+        system_capabilities = [
+            "Execute complex system commands securely",
+            "Manage processes across Windows/Linux/macOS",
+            "Automate file operations at enterprise scale",
+            "Monitor system performance in real-time",
+            "Deploy automated workflows across infrastructure"
+        ]
+        
+        for capability in system_capabilities:
+            emit(f"✅ {capability}")
+        
+        self.demo_results["universal_control"] = {
+            "status": "OPERATIONAL",
+            "platforms_supported": ["Windows", "Linux", "macOS", "Docker", "Kubernetes"],
+            "automation_potential": "90% IT operations",
+            "cost_savings": "$2.4M/year for 500-employee company"
+        }
+    
+    async def demo_advanced_security_suite(self):
+        """Showcase enterprise-grade security features"""
+        emit("\n🛡️ 3. ADVANCED SECURITY SUITE")
+        emit("-" * 40)
+        
+        security_features = [
+            "Real-time domain reputation analysis",
+            "Automated vulnerability scanning",
+            "Advanced cryptography (RSA-4096, Fernet)",
+            "Port scanning and network security",
+            "Compliance monitoring (GDPR, HIPAA, SOC2)"
+        ]
+        
+        for feature in security_features:
+            emit(f"✅ {feature}")
+        
+        self.demo_results["security_suite"] = {
+            "status": "ACTIVE",
+            "security_level": "Enterprise Grade",
+            "compliance_frameworks": ["GDPR", "HIPAA", "SOC2", "ISO27001"],
+            "risk_reduction": "92% security incidents",
+            "value_proposition": "$3.8M annual security cost savings"
+        }
+        
+        if self.port_scan_target:
+            report = await scanner.run_port_scan(self.port_scan_target, scanner.COMMON_PORTS)
+            emit(f"\n🔎 Port scan of {report['host']}: {report['ports_scanned']} ports in "
+                 f"{report['elapsed_seconds']}s ({report['ports_per_second']} ports/s)")
+            emit(f"   Open ports: {', '.join(map(str, report['open_ports'])) or 'none'}")
+    
+    async def demo_enterprise_ai_agents(self):
+        """Showcase autonomous AI workforce"""
+        emit("\n🤖 4. ENTERPRISE AI AGENTS")
+        emit("-" * 40)
+        
+        agent_types = [
+            "Research Agent - Comprehensive market analysis",
+            "Customer Service Agent - 24/7 support",
+            "Data Analyst Agent - Real-time insights",
+            "Security Agent - Threat monitoring",
+            "IT Operations Agent - System management"
+        ]
+        
+        for agent in agent_types:
+            emit(f"✅ {agent}")
+        
+        self.demo_results["ai_agents"] = {
+            "status": "DEPLOYED",
+            "agent_count": "Unlimited scalable agents",
+            "productivity_boost": "400% team efficiency",
+            "cost_displacement": "$4.2M annual labor savings",
+            "availability": "24/7/365 operation"
+        }
+        
+        if self.agent_tasks:
+            stats = await agents.run_agent_workload(self.agent_tasks)
+            emit(f"\n⚙️ {stats['completed']} agent tasks in {stats['elapsed_seconds']}s "
+                 f"({stats['throughput_per_second']}/s, {stats['workers']} workers)")
+            for agent_type, agent in stats["agents"].items():
+                emit(f"   {agent_type}: {agent['completed']} done, "
+                     f"p95 {agent['latency_ms'].get('p95')}ms")
+    
+    async def demo_realtime_system_monitoring(self):
+        """Showcase advanced monitoring capabilities"""
+        emit("\n📈 5. REAL-TIME SYSTEM INTELLIGENCE")
+        emit("-" * 40)
+        
+        monitoring_capabilities = [
+            "CPU/Memory/Disk performance tracking",
+            "Network activity and bandwidth monitoring",
+            "Application performance insights",
+            "Predictive failure analysis",
+            "Custom dashboard creation"
+        ]
+        
+        for capability in monitoring_capabilities:
+            emit(f"✅ {capability}")
+        
+        # Simulate monitoring dashboard unless a live sampler is attached
+        emit("\n📊 Live System Metrics:")
+        dashboard = {
+            "CPU Usage": "23%",
+            "Memory Utilization": "45%",
+            "Network Throughput": "1.2 Gbps",
+            "Active Users": "1,247",
+            "AI Model Accuracy": "96.8%"
+        }
+        latest = None
+        if self.metrics_sampler is not None:
+            latest = self.metrics_sampler.latest()
+            if latest is None:  # started moments ago: measure over a short window instead
+                await asyncio.sleep(min(self.metrics_sampler.interval, 0.2))
+                latest = self.metrics_sampler.sample()
+        if latest:
+            network_bits = (latest["net_rx_bps"] + latest["net_tx_bps"]) * 8
+            dashboard["CPU Usage"] = f"{latest['cpu_percent']:.0f}%"
+            dashboard["Memory Utilization"] = f"{latest['memory_percent']:.0f}%"
+            dashboard["Network Throughput"] = f"{network_bits / 1e6:.1f} Mbps"
+            dashboard["Disk I/O"] = (f"{latest['disk_read_bps'] / 1e6:.1f} MB/s read, "
+                                     f"{latest['disk_write_bps'] / 1e6:.1f} MB/s write")
+        
+        for metric, value in dashboard.items():
+            emit(f"   {metric}: {value}")
+        
+        self.demo_results["system_monitoring"] = {
+            "status": "LIVE",
+            "metrics_tracked": "150+ system parameters",
+            "alert_response_time": "< 30 seconds",
+            "downtime_reduction": "99.9% uptime",
+            "operational_efficiency": "67% improvement"
+        }
+    
+    async def demo_advanced_file_intelligence(self):
+        """Showcase intelligent file processing"""
+        emit("\n📁 6. ADVANCED FILE INTELLIGENCE")
+        emit("-" * 40)
+        
+        file_capabilities = [
+            "Process 50+ file formats automatically",
+            "PDF text extraction and analysis",
+            "Image content recognition",
+            "Audio transcription and analysis",
+            "Code analysis and quality assessment"
+        ]
+        
+        for capability in file_capabilities:
+            emit(f"✅ {capability}")
+        
+        self.demo_results["file_intelligence"] = {
+            "status": "READY",
+            "formats_supported": "50+ file types",
+            "processing_speed": "10x faster than manual",
+            "accuracy_rate": "98.7% content extraction",
+            "labor_savings": "15 FTEs replaced"
+        }
+        
+        if self.file_scan_root:
+            pipeline = files.FileIntelligencePipeline()
+            loop = asyncio.get_running_loop()
+            report = await loop.run_in_executor(None, pipeline.scan, self.file_scan_root)
+            emit(f"\n📂 Scanned {report['files']} files ({report['megabytes']} MB) "
+                 f"in {report['elapsed_seconds']}s")
+            emit(f"   {report['files_per_second']} files/s, {report['mb_per_second']} MB/s, "
+                 f"{report['cached']} unchanged files skipped, "
+                 f"{report['reused']} known contents reused")
+            for file_type, count in sorted(report["types"].items(), key=lambda item: -item[1])[:5]:
+                emit(f"   {file_type}: {count}")
+            self.demo_results["file_intelligence"]["processing_speed"] = (
+                f"{report['files_per_second']} files/s, {report['mb_per_second']} MB/s")
+    
+    async def demo_crypto_security_framework(self):
+        """Showcase cryptographic security"""
+        emit("\n🔐 7. ADVANCED CRYPTOGRAPHY FRAMEWORK")
+        emit("-" * 40)
+        
+        crypto_features = [
+            "RSA-4096 key generation and management",
+            "Military-grade encryption/decryption",
+            "Secure token generation",
+            "HMAC signature verification",
+            "Cryptographic audit trails"
+        ]
+        
+        for feature in crypto_features:
+            emit(f"✅ {feature}")
+        
+        self.demo_results["crypto_framework"] = {
+            "status": "SECURE",
+            "encryption_standard": "AES-256, RSA-4096",
+            "compliance": "FIPS 140-2, NIST standards",
+            "security_level": "Military Grade",
+            "data_protection": "Zero-knowledge architecture"
+        }
+        
+        if self.crypto_service:
+            loop = asyncio.get_running_loop()
+            service = self.crypto_service
+            key = await loop.run_in_executor(None, service.keys.get)
+            messages = [f"audit-event-{i}".encode() for i in range(1000)]
+            signatures = service.sign_batch(messages)
+            verified = sum(service.verify_batch(messages, signatures))
+            tokens = service.generate_tokens(1000)
+            emit(f"\n🔑 RSA-{key.key_size} key issued from a pool of "
+                 f"{service.keys.ready()} ready keys")
+            emit(f"🔏 {verified}/{len(messages)} HMAC signatures verified, "
+                 f"{len(tokens)} secure tokens generated")
+    
+    @instrumented("generate_demo_report")
+    def generate_demo_report(self, chart=True):
+        """Generate comprehensive demo report"""
+        emit("\n" + "=" * 60)
+        emit("🎯 VISIONMIND AI v3.0 - INVESTMENT SUMMARY")
+        emit("=" * 60)
+        
+        for component, details in self.demo_results.items():
+            emit(f"\n{component.upper().replace('_', ' ')}:")
+            for k, v in details.items():
+                if k != 'status':
+                    emit(f"  {k.replace('_', ' ').title()}: {v}")
+        
+        _, amounts = value_matrix([self.demo_results])
+        total_value, conservative, aggressive = valuation_summary(amounts)[0]
+        emit(f"\n💰 TOTAL DEMONSTRATED VALUE: ${total_value:,.2f}/year")
+        emit(f"🏆 CONSERVATIVE VALUATION: ${conservative:,.2f}")
+        emit(f"🚀 AGGRESSIVE VALUATION: ${aggressive:,.2f}")
+        
+        # Generate valuation chart
+        if chart:
+            self.create_valuation_chart()
+    
+    def _chart_args(self):
+        """Arguments for render_valuation_chart built from demo_results"""
+        components = list(self.demo_results.keys())
+        values = [component_value(self.demo_results[c]).amount / 1e6 for c in components]
+        
+        labels = [c.replace('_', ' ').title() for c in components]
+        if self.chart_preview:
+            return labels, values, 'visionmind_valuation_breakdown.svg', None, 'svg'
+        return labels, values, 'visionmind_valuation_breakdown.png', 300, 'png'
+    
+    @instrumented("create_valuation_chart")
+    def create_valuation_chart(self):
+        """Create visual valuation chart"""
+        path, cached = render_valuation_chart(*self._chart_args())
+        emit(f"\n📊 Valuation chart saved: {path}{' (cached)' if cached else ''}")
+    
+    @instrumented("create_valuation_chart")
+    async def create_valuation_chart_async(self, executor=None):
+        """Create the valuation chart without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        path, cached = await loop.run_in_executor(
+            executor, render_valuation_chart, *self._chart_args())
+        emit(f"\n📊 Valuation chart saved: {path}{' (cached)' if cached else ''}")
+
+
+def _draw_valuation_chart(labels, values, path, dpi, fmt):
+    """Draw the valuation chart with the object API (no pyplot state, thread safe)"""
+    Figure = importlib.import_module("matplotlib.figure").Figure
+    fig = Figure(figsize=(12, 8))
+    ax = fig.add_subplot()
+    bars = ax.barh(labels, values, color='skyblue')
+    ax.set_xlabel('Value (Millions $)')
+    ax.set_title('VisionMind AI v3.0 - Component Valuation Breakdown')
+    ax.grid(axis='x', alpha=0.3)
+    
+    # Add value labels on bars
+    for bar, value in zip(bars, values):
+        ax.text(bar.get_width() + 0.1, bar.get_y() + bar.get_height()/2, 
+                f'${value}M', ha='left', va='center', fontweight='bold')
+    
+    fig.tight_layout()
+    fig.savefig(path, dpi=dpi or 'figure', format=fmt, bbox_inches='tight')
+
+
+# Rendered charts kept in CACHE_DIR/charts; the least recently used go first
+CHART_CACHE_ENTRIES = 64
+
+
+def _prune_chart_cache(cache_dir, keep):
+    """Delete all but the `keep` most recently used renders in cache_dir"""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            with contextlib.suppress(OSError):
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+def render_valuation_chart(labels, values, path, dpi=300, fmt='png'):
+    """Render the valuation chart to `path`, reusing a cached render when possible"""
+    key = hashlib.sha256(json.dumps([labels, values, dpi, fmt]).encode()).hexdigest()[:16]
+    cache_dir = os.path.join(CACHE_DIR, "charts")
+    cached_path = os.path.join(cache_dir, f"{key}.{fmt}")
+    cached = os.path.exists(cached_path)
+    
+    if cached:
+        with contextlib.suppress(OSError):
+            os.utime(cached_path)  # mark as recently used
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cached_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        _draw_valuation_chart(labels, values, tmp_path, dpi, fmt)
+        os.replace(tmp_path, cached_path)
+        _prune_chart_cache(cache_dir, max(CHART_CACHE_ENTRIES, 1))
+    
+    shutil.copyfile(cached_path, path)
+    return path, cached
+
+
+async def run_billion_dollar_demo(chart_preview=False, history_path=None, live_metrics=True,
+                                  file_scan_root=None, crypto_key_size=None, audit_path=None,
+                                  port_scan_target=None, agent_tasks=0, market_data=None,
+                                  scenario_cache_path=None):
+    """Run the billion-dollar demo; records to history_path, samples /proc when live_metrics"""
+    with contextlib.ExitStack() as stack:
+        run_history = stack.enter_context(history.RunHistoryStore(history_path)) if history_path else None
+        metrics_sampler = None
+        if live_metrics and metrics.SystemMetricsSampler.available():
+            metrics_sampler = stack.enter_context(metrics.SystemMetricsSampler(interval=0.25))
+        crypto_service = None
+        if crypto_key_size:
+            crypto_service = crypto.CryptoService(key_size=crypto_key_size, key_pool_size=2)
+            stack.callback(crypto_service.close)
+        audit_log = stack.enter_context(audit.AuditLog(audit_path)) if audit_path else None
+        scenario_cache = None
+        if scenario_cache_path:
+            # Memoization stays on or off as it is for the shared cache (run --memo)
+            scenario_cache = ScenarioCache(scenario_cache_path)
+            scenario_cache.enabled = SCENARIO_CACHE.enabled
+        demo = VisionMindBillionDollarDemo(chart_preview=chart_preview,
+                                           metrics_sampler=metrics_sampler,
+                                           file_scan_root=file_scan_root,
+                                           crypto_service=crypto_service, audit_log=audit_log,
+                                           port_scan_target=port_scan_target,
+                                           agent_tasks=agent_tasks, run_history=run_history, market_data=market_data,
+                                           scenario_cache=scenario_cache)
+        await demo.run_complete_demo()
+
+
+def quick_demo():
+    """Run a 2-minute quick demo"""
+    emit("🚀 VisionMind AI v3.0 - Quick Demo")
+    emit("✅ Universal OS Control - Manage any system")
+    emit("✅ Advanced AI Memory - Context-aware conversations") 
+    emit("✅ Enterprise Security - Military-grade encryption")
+    emit("✅ Autonomous Agents - Scalable AI workforce")
+    emit("✅ Real-time Analytics - Live system intelligence")
+    emit("\n💼 Enterprise Value: $50M+")
+    emit("💰 Investment Opportunity: $15M Series A")
+    emit("🎯 Target Valuation: $150M")
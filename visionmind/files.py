@@ -0,0 +1,306 @@
+"""Parallel file intelligence scanning"""
+
+import concurrent.futures
+import hashlib
+import json
+import mmap
+import os
+import re
+import time
+import zipfile
+
+from .core import CACHE_DIR
+
+
+# Leading bytes -> detected file type
+_MAGIC_TYPES = [
+    (b"%PDF-", "pdf"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"PK\x03\x04", "zip"),
+    (b"\x1f\x8b", "gzip"),
+    (b"ID3", "mp3"),
+    (b"OggS", "ogg"),
+    (b"fLaC", "flac"),
+    (b"\x7fELF", "elf"),
+    (b"SQLite format 3\x00", "sqlite"),
+]
+
+
+# Extension -> type for files whose content decodes as text
+_TEXT_TYPES = {
+    "code": {".py", ".pyi", ".js", ".ts", ".java", ".c", ".h", ".cpp", ".hpp", ".go", ".rs", ".rb",
+             ".php", ".sh", ".cs", ".swift", ".kt", ".scala", ".sql"},
+    "markup": {".md", ".rst", ".html", ".htm", ".xml", ".tex"},
+    "data": {".json", ".jsonl", ".csv", ".tsv", ".yaml", ".yml", ".toml", ".ini", ".cfg"},
+}
+
+
+# Files at least this large are read through mmap instead of read()
+_MMAP_THRESHOLD = 1 << 20
+
+
+_HASH_CHUNK = 1 << 22
+
+
+_WORD_RE = re.compile(rb"\S+")
+
+
+def _detect_type(path, head):
+    """File type from magic bytes, falling back to a text/binary check"""
+    for magic, file_type in _MAGIC_TYPES:
+        if head.startswith(magic):
+            return file_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if b"\x00" in head:
+        return "binary"
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # A multi-byte character cut off at the end of the sample is still text
+        if exc.start < len(head) - 3:
+            return "binary"
+    extension = os.path.splitext(path)[1].lower()
+    for file_type, extensions in _TEXT_TYPES.items():
+        if extension in extensions:
+            return file_type
+    return "text"
+
+
+def _text_metadata(data):
+    lines = data.count(b"\n")
+    words = 0
+    previous_ended_in_word = False
+    # Count words chunk by chunk so huge files never need a decoded copy
+    for start in range(0, len(data), _HASH_CHUNK):
+        chunk = data[start:start + _HASH_CHUNK]
+        words += len(_WORD_RE.findall(chunk))
+        if previous_ended_in_word and chunk[:1].strip():
+            words -= 1
+        previous_ended_in_word = bool(chunk[-1:].strip())
+    first_line = bytes(data[:data.find(b"\n") if 0 <= data.find(b"\n") < 200 else 200])
+    return {"lines": lines + (1 if len(data) and data[-1:] != b"\n" else 0), "words": words,
+            "preview": first_line.decode("utf-8", "replace").strip()[:120]}
+
+
+def _jpeg_size(data):
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset] != 0xFF:
+            return {}
+        marker = data[offset + 1]
+        length = int.from_bytes(data[offset + 2:offset + 4], "big")
+        if marker in (0xC0, 0xC1, 0xC2):
+            return {"height": int.from_bytes(data[offset + 5:offset + 7], "big"),
+                    "width": int.from_bytes(data[offset + 7:offset + 9], "big")}
+        offset += 2 + length
+    return {}
+
+
+def _extract_metadata(path, file_type, data):
+    """Type-specific text statistics or metadata"""
+    if file_type in ("text", "code", "markup", "data"):
+        return _text_metadata(data)
+    if file_type == "pdf":
+        return {"pages": len(re.findall(rb"/Type\s*/Page[^s]", data))}
+    if file_type == "png" and len(data) >= 24:
+        return {"width": int.from_bytes(data[16:20], "big"),
+                "height": int.from_bytes(data[20:24], "big")}
+    if file_type == "gif" and len(data) >= 10:
+        return {"width": int.from_bytes(data[6:8], "little"),
+                "height": int.from_bytes(data[8:10], "little")}
+    if file_type == "jpeg":
+        return _jpeg_size(data)
+    if file_type == "wav" and len(data) >= 44:
+        channels = int.from_bytes(data[22:24], "little")
+        sample_rate = int.from_bytes(data[24:28], "little")
+        byte_rate = int.from_bytes(data[28:32], "little")
+        return {"channels": channels, "sample_rate": sample_rate,
+                "duration_seconds": round((len(data) - 44) / byte_rate, 3) if byte_rate else None}
+    if file_type == "zip":
+        with zipfile.ZipFile(path) as archive:
+            infos = archive.infolist()
+        return {"entries": len(infos), "uncompressed_bytes": sum(info.file_size for info in infos)}
+    return {}
+
+
+def _analyze_file(path, known=()):
+    """Hash, type-detect and extract one file (runs in a worker process)
+
+    A file whose hash is in `known` is only hashed; its analysis is reused.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+        try:
+            digest = hashlib.sha256()
+            view = memoryview(data)
+            for start in range(0, size, _HASH_CHUNK):
+                digest.update(view[start:start + _HASH_CHUNK])
+            view.release()
+            if digest.hexdigest() in known:
+                return {"sha256": digest.hexdigest(), "type": None, "size": size, "metadata": None}
+            file_type = _detect_type(path, bytes(data[:4096]))
+            metadata = _extract_metadata(path, file_type, data)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    return {"sha256": digest.hexdigest(), "type": file_type, "size": size, "metadata": metadata}
+
+
+def _analyze_batch(items):
+    results = []
+    for path, known in items:
+        try:
+            results.append((path, _analyze_file(path, known), None))
+        except Exception as exc:
+            results.append((path, None, f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+class FileIntelligencePipeline:
+    """Walk a directory tree and analyze its files on a process pool"""
+
+    def __init__(self, workers=None, batch_files=64, batch_bytes=64 << 20,
+                 cache_path=None, use_cache=True):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_files = batch_files
+        self.batch_bytes = batch_bytes
+        self.cache_path = (cache_path or os.path.join(CACHE_DIR, "file_intelligence.json")
+                           if use_cache else None)
+        self.index = {}
+        self.analyses = {}
+        self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        with open(self.cache_path) as f:
+            cache = json.load(f)
+        self.index = cache.get("index", {})
+        self.analyses = cache.get("analyses", {})
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"index": self.index, "analyses": self.analyses}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    @staticmethod
+    def walk(root):
+        """Yield (path, stat) for every regular file under root"""
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path, entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+    def _batches(self, root, report, seen):
+        """Changed files grouped into batches; unchanged files are counted and skipped"""
+        # Hashes already analyzed, by file size: a renamed or touched copy is only re-hashed
+        by_size = {}
+        for known in self.index.values():
+            if known["sha256"] in self.analyses:
+                by_size.setdefault(known["size"], set()).add(known["sha256"])
+        batch, batch_size = [], 0
+        for path, stat in self.walk(root):
+            seen.add(path)
+            report["files"] += 1
+            report["bytes"] += stat.st_size
+            known = self.index.get(path)
+            if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns \
+                    and known["sha256"] in self.analyses:
+                report["cached"] += 1
+                file_type = self.analyses[known["sha256"]]["type"]
+                report["types"][file_type] = report["types"].get(file_type, 0) + 1
+                continue
+            self.index[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": None}
+            batch.append((path, tuple(by_size.get(stat.st_size, ()))))
+            batch_size += stat.st_size
+            if len(batch) >= self.batch_files or batch_size >= self.batch_bytes:
+                yield batch
+                batch, batch_size = [], 0
+        if batch:
+            yield batch
+
+    def _collect(self, results, report):
+        for path, analysis, error in results:
+            if error:
+                report["errors"].append({"path": path, "error": error})
+                self.index.pop(path, None)
+                continue
+            self.index[path]["sha256"] = analysis["sha256"]
+            if analysis["type"] is None:
+                report["reused"] += 1
+                file_type = self.analyses[analysis["sha256"]]["type"]
+                report["types"][file_type] = report["types"].get(file_type, 0) + 1
+                continue
+            report["analyzed"] += 1
+            report["analyzed_bytes"] += analysis["size"]
+            report["types"][analysis["type"]] = report["types"].get(analysis["type"], 0) + 1
+            self.analyses[analysis["sha256"]] = {"type": analysis["type"],
+                                                 "metadata": analysis["metadata"]}
+
+    def _prune(self, root, seen):
+        """Forget files under root that are gone, then analyses no file refers to"""
+        prefix = os.path.join(root, "")
+        for path in [path for path in self.index if path.startswith(prefix) and path not in seen]:
+            del self.index[path]
+        referenced = {known["sha256"] for known in self.index.values()}
+        for digest in [digest for digest in self.analyses if digest not in referenced]:
+            del self.analyses[digest]
+
+    def scan(self, root):
+        """Analyze every changed file under root; returns a throughput report"""
+        root = os.path.abspath(root)
+        report = {"root": root, "files": 0, "bytes": 0, "cached": 0, "reused": 0, "analyzed": 0,
+                  "analyzed_bytes": 0, "types": {}, "errors": []}
+        seen = set()
+        start = time.perf_counter()
+        max_in_flight = self.workers * 2
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as pool:
+            pending = set()
+            for batch in self._batches(root, report, seen):
+                pending.add(pool.submit(_analyze_batch, batch))
+                if len(pending) >= max_in_flight:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        self._collect(future.result(), report)
+            for future in concurrent.futures.as_completed(pending):
+                self._collect(future.result(), report)
+        elapsed = time.perf_counter() - start
+        self._prune(root, seen)
+        self._save_cache()
+
+        report["elapsed_seconds"] = round(elapsed, 3)
+        report["megabytes"] = round(report["bytes"] / 1e6, 3)
+        report["files_per_second"] = round(report["files"] / elapsed, 1) if elapsed else None
+        report["mb_per_second"] = round(report["bytes"] / 1e6 / elapsed, 1) if elapsed else None
+        report["analyzed_mb_per_second"] = (round(report["analyzed_bytes"] / 1e6 / elapsed, 1)
+                                            if elapsed else None)
+        return report
+
+    def analysis(self, path):
+        """Cached analysis for a scanned path, or None"""
+        known = self.index.get(os.path.abspath(path))
+        return self.analyses.get(known["sha256"]) if known else None
@@ -0,0 +1,103 @@
+"""Headless scenario runner for repeated, timed runs"""
+
+import asyncio
+import functools
+import time
+
+from .demo import VisionMindBillionDollarDemo, quick_demo, run_billion_dollar_demo
+from .live_api import run_live_api_demo
+from .pitch import run_investment_pitch
+
+
+async def _run_single_scenario(key, method):
+    """Run one billion-dollar demo scenario on a fresh demo instance"""
+    demo = VisionMindBillionDollarDemo()
+    await demo._run_scenario(key, method, None)
+
+
+# Scenario name -> runner; menu option 5 ("all") expands to the first four
+HEADLESS_SCENARIOS = {
+    "billion-dollar": run_billion_dollar_demo,
+    "live-api": run_live_api_demo,
+    "pitch": run_investment_pitch,
+    "quick": quick_demo,
+}
+
+
+for _key, _method in VisionMindBillionDollarDemo.SCENARIOS:
+    HEADLESS_SCENARIOS[_key] = functools.partial(_run_single_scenario, _key, _method)
+
+
+HEADLESS_ALL = ["billion-dollar", "live-api", "pitch", "quick"]
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _latency_summary(latencies):
+    """Latency statistics in milliseconds"""
+    values = sorted(latency * 1000 for latency in latencies)
+    if not values:
+        return {}
+    summary = {"min": values[0], "mean": sum(values) / len(values)}
+    for pct in (50, 90, 95, 99):
+        summary[f"p{pct}"] = _percentile(values, pct)
+    summary["max"] = values[-1]
+    return {name: round(value, 3) for name, value in summary.items()}
+
+
+async def run_headless(names, repeat=1, duration=None, warmup=0, options=None):
+    """Run the named scenarios repeatedly; `options` maps a name to its runner's kwargs"""
+    options = options or {}
+    latencies = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+
+    async def run_once(name, record):
+        start = time.perf_counter()
+        try:
+            result = HEADLESS_SCENARIOS[name](**options.get(name, {}))
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:
+            if record:
+                errors[name] += 1
+        if record:
+            latencies[name].append(time.perf_counter() - start)
+
+    for _ in range(warmup):
+        for name in names:
+            await run_once(name, record=False)
+
+    iterations = 0
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+    while (time.perf_counter() < deadline) if deadline else (iterations < repeat):
+        for name in names:
+            await run_once(name, record=True)
+        iterations += 1
+    elapsed = time.perf_counter() - start
+
+    runs = sum(len(values) for values in latencies.values())
+    return {
+        "scenarios": list(names),
+        "iterations": iterations,
+        "runs": runs,
+        "errors": sum(errors.values()),
+        "elapsed_seconds": round(elapsed, 6),
+        "runs_per_second": round(runs / elapsed, 3) if elapsed else None,
+        "latency_ms": _latency_summary(
+            [value for values in latencies.values() for value in values]),
+        "per_scenario": {
+            name: {
+                "runs": len(latencies[name]),
+                "errors": errors[name],
+                "latency_ms": _latency_summary(latencies[name]),
+            }
+            for name in names
+        },
+    }
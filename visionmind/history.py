@@ -0,0 +1,265 @@
+"""SQLite run history for billion-dollar demo runs"""
+
+import contextlib
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from .core import RUN_HISTORY_PATH, pd
+from .money import component_value
+
+
+
+_RUN_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    total_seconds REAL,
+    total_value REAL NOT NULL,
+    label TEXT,
+    cached INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL,
+    component TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    status TEXT,
+    value REAL NOT NULL,
+    annual INTEGER NOT NULL,
+    seconds REAL,
+    details TEXT NOT NULL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, component)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+CREATE INDEX IF NOT EXISTS results_component_started_at
+    ON results (component, started_at, value, seconds);
+"""
+
+
+class RunHistoryStore:
+    """SQLite history of demo_results across runs, queried as pandas DataFrames"""
+
+    def __init__(self, path=RUN_HISTORY_PATH, batch_size=1000):
+        self.path = path
+        self.batch_size = batch_size
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA temp_store=MEMORY")
+        self.db.executescript(_RUN_HISTORY_SCHEMA)
+        for table in ("runs", "results"):  # histories written before the cached columns
+            columns = {row[1] for row in self.db.execute(f"PRAGMA table_info({table})")}
+            if "cached" not in columns:
+                self.db.execute(
+                    f"ALTER TABLE {table} ADD COLUMN cached INTEGER NOT NULL DEFAULT 0")
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def record(self, results, timings=None, started_at=None, total_seconds=None, label=None,
+               cached=()):
+        """Buffer one run's demo_results (plus optional per-component seconds)"""
+        with self._lock:
+            self._pending.append((results, timings or {}, started_at or time.time(),
+                                  total_seconds, label, frozenset(cached)))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def record_demo(self, demo, label=None):
+        """Buffer a finished VisionMindBillionDollarDemo run"""
+        self.record(demo.demo_results, demo.scenario_timings, demo.start_time.timestamp(),
+                    demo.total_run_time, label, demo.cached_scenarios)
+
+    def flush(self):
+        """Write all buffered runs in a single transaction"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                # ids are assigned inside the write lock so concurrent writers cannot clash
+                next_id = self.db.execute("SELECT COALESCE(MAX(run_id), 0) FROM runs").fetchone()[0]
+                runs, rows = [], []
+                for run_id, (results, timings, started_at, total_seconds, label,
+                             cached) in enumerate(pending, next_id + 1):
+                    total = 0.0
+                    for component, details in results.items():
+                        value = component_value(details)
+                        total += value.amount
+                        replayed = component in cached
+                        rows.append((run_id, component, started_at, details.get("status"),
+                                     value.amount, value.annual,
+                                     None if replayed else timings.get(component),
+                                     json.dumps(details), replayed))
+                    runs.append((run_id, started_at, total_seconds, total, label,
+                                 len(cached & results.keys())))
+                self.db.executemany(
+                    "INSERT INTO runs (run_id, started_at, total_seconds, total_value, label, "
+                    "cached) VALUES (?, ?, ?, ?, ?, ?)", runs)
+                self.db.executemany(
+                    "INSERT INTO results (run_id, component, started_at, status, value, annual, "
+                    "seconds, details, cached) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _time_filter(column, since, until):
+        clauses, params = [], []
+        if since is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append(f"{column} < ?")
+            params.append(_timestamp(until))
+        return clauses, params
+
+    def _frame(self, sql, params, time_columns=("started_at",)):
+        frame = pd.read_sql_query(sql, self.db, params=params)
+        for column in time_columns:
+            if column in frame:
+                frame[column] = pd.to_datetime(frame[column], unit="s")
+        return frame
+
+    def runs(self, since=None, until=None, last=None):
+        """One row per run, oldest first; `last` keeps only the most recent N"""
+        clauses, params = self._time_filter("started_at", since, until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM runs {where} ORDER BY started_at DESC, run_id DESC"
+        if last is not None:
+            sql += " LIMIT ?"
+            params.append(last)
+        return self._frame(f"SELECT * FROM ({sql}) ORDER BY started_at, run_id", params)
+
+    def results(self, component=None, since=None, until=None, last=None):
+        """One row per (run, component), oldest first, details decoded"""
+        clauses, params = self._time_filter("started_at", since, until)
+        if component is not None:
+            clauses.insert(0, "component = ?")
+            params.insert(0, component)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM results {where} ORDER BY started_at DESC, run_id DESC"
+        if last is not None:
+            sql += " LIMIT ?"
+            params.append(last)
+        frame = self._frame(f"SELECT * FROM ({sql}) ORDER BY started_at, run_id", params)
+        frame["annual"] = frame["annual"].astype(bool)
+        frame["cached"] = frame["cached"].astype(bool)
+        frame["details"] = frame["details"].map(json.loads)
+        return frame
+
+    def compare(self, run_ids=None, last=5, field="value"):
+        """Components x runs table of `field` (value, seconds or status)"""
+        if field not in ("value", "seconds", "status"):
+            raise ValueError(f"cannot compare on {field!r}")
+        if run_ids is None:
+            run_ids = [row[0] for row in self.db.execute(
+                "SELECT run_id FROM runs ORDER BY started_at DESC, run_id DESC LIMIT ?", (last,))]
+        run_ids = sorted(run_ids)
+        if not run_ids:
+            return pd.DataFrame()
+        marks = ", ".join("?" * len(run_ids))
+        frame = pd.read_sql_query(
+            f"SELECT run_id, component, {field} FROM results WHERE run_id IN ({marks})",
+            self.db, params=run_ids)
+        return frame.pivot(index="component", columns="run_id", values=field)
+
+    def trend(self, component=None, bucket="day", since=None, until=None):
+        """Per time bucket: runs, mean/min/max value and mean seconds"""
+        width = {"minute": 60, "hour": 3600, "day": 86400, "week": 604800}[bucket]
+        clauses, params = self._time_filter("started_at", since, until)
+        if component is None:
+            table, value = "runs", "total_value"
+            seconds = "CASE WHEN cached = 0 THEN total_seconds END"
+        else:
+            table, value, seconds = "results", "value", "seconds"
+            clauses.insert(0, "component = ?")
+            params.insert(0, component)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._frame(
+            f"SELECT CAST(started_at / {width} AS INTEGER) * {width} AS started_at, "
+            f"COUNT(*) AS runs, AVG({value}) AS mean_value, MIN({value}) AS min_value, "
+            f"MAX({value}) AS max_value, AVG({seconds}) AS mean_seconds "
+            f"FROM {table} {where} GROUP BY 1 ORDER BY 1", params)
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def _timestamp(value):
+    """Unix seconds from a number, datetime or ISO date string"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+def benchmark_run_history(runs=100000, path=None, batch_size=10000, seed=0):
+    """Bulk-insert synthetic runs, then time the query API against the full history"""
+    rng = random.Random(seed)
+    template = {
+        "business_analyst": {"status": "SUCCESS", "cost_savings": "$2.4M/year"},
+        "universal_control": {"status": "SUCCESS", "cost_savings": "$800K/year"},
+        "security_suite": {"status": "SUCCESS", "cost_savings": "$1.2M/year"},
+        "ai_agents": {"status": "SUCCESS", "cost_savings": "$3.1M/year"},
+        "system_monitoring": {"status": "SUCCESS", "cost_savings": "$650K/year"},
+        "file_intelligence": {"status": "SUCCESS", "cost_savings": "$1.5M/year"},
+        "crypto_framework": {"status": "SUCCESS", "cost_savings": "$900K/year"},
+    }
+    with contextlib.ExitStack() as stack:
+        if path is None:
+            path = os.path.join(stack.enter_context(tempfile.TemporaryDirectory()), "history.db")
+        store = stack.enter_context(RunHistoryStore(path, batch_size))
+        existing = store.count()
+        now = time.time()
+        start = time.perf_counter()
+        for i in range(runs):
+            timings = {component: rng.uniform(0.1, 2.0) for component in template}
+            store.record(template, timings, now - (runs - i) * 60, sum(timings.values()))
+        store.flush()
+        insert_seconds = time.perf_counter() - start
+        database_mb = round(os.path.getsize(path) / 1e6, 1)
+
+        pd.DataFrame()  # import pandas before timing queries
+        queries = {
+            "last_20_runs": lambda: store.runs(last=20),
+            "component_last_day": lambda: store.results("ai_agents", since=now - 86400),
+            "compare_last_5": lambda: store.compare(last=5),
+            "trend_by_day_component": lambda: store.trend("security_suite", "day"),
+        }
+        timings = {}
+        for name, query in queries.items():
+            start = time.perf_counter()
+            rows = len(query())
+            timings[name] = {"ms": round((time.perf_counter() - start) * 1000, 3), "rows": rows}
+        total = store.count()
+    return {
+        "runs_inserted": runs,
+        "runs_stored": total,
+        "existing_runs": existing,
+        "inserts_per_second": round(runs / insert_seconds, 1),
+        "result_rows_per_second": round(runs * len(template) / insert_seconds, 1),
+        "database_mb": database_mb,
+        "queries": timings,
+    }
@@ -0,0 +1,306 @@
+"""Asyncio HTTP load generator with latency histograms"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import urllib.parse
+
+from .config import DEMO_CONFIG
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram over integer microseconds"""
+
+    def __init__(self, sub_bucket_bits=7, max_value_bits=40):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self.counts = [0] * ((1 << sub_bucket_bits) + (max_value_bits - sub_bucket_bits) * self._half)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        return (1 << self.sub_bucket_bits) + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _value(self, index):
+        """Highest value that falls into bucket `index`"""
+        if index < (1 << self.sub_bucket_bits):
+            return index
+        shift, offset = divmod(index - (1 << self.sub_bucket_bits), self._half)
+        shift += 1
+        return ((offset + self._half + 1) << shift) - 1
+
+    def record(self, microseconds):
+        value = max(0, int(microseconds))
+        self.counts[min(self._index(value), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct):
+        """Value at percentile `pct`, in microseconds"""
+        if not self.count:
+            return None
+        target = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def summary(self):
+        """Latency statistics in milliseconds"""
+        if not self.count:
+            return {"count": 0}
+        summary = {"count": self.count, "min": self.min / 1000,
+                   "mean": self.total / self.count / 1000}
+        for pct in (50, 95, 99, 99.9):
+            summary[f"p{pct:g}"] = self.percentile(pct) / 1000
+        summary["max"] = self.max / 1000
+        return {name: round(value, 3) if name != "count" else value
+                for name, value in summary.items()}
+
+
+async def read_chunked_body(reader):
+    """Body of a Transfer-Encoding: chunked message on a StreamReader, trailers skipped"""
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise ConnectionError("connection closed inside a chunked body")
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            break
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)  # CRLF after the chunk data
+    while await reader.readline() not in (b"\r\n", b"\n", b""):
+        pass
+    return b"".join(chunks)
+
+
+class _AsyncHTTPConnection:
+    """One keep-alive HTTP/1.1 connection on asyncio streams"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    async def request(self, method, target, headers, body):
+        head = [f"{method} {target} HTTP/1.1"]
+        head += [f"{name}: {value}" for name, value in headers.items()]
+        head.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+        length, chunked = None, False
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding":
+                chunked = value.strip().lower().endswith("chunked")
+            elif name == "connection" and value.strip().lower() == "close":
+                self.reusable = False
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return status, b""
+        if chunked:
+            return status, await read_chunked_body(self.reader)
+        if length is None:
+            # No framing: the body runs until the server closes the connection
+            self.reusable = False
+            return status, await self.reader.read()
+        return status, await self.reader.readexactly(length)
+
+    def close(self):
+        self.reusable = False
+        self.writer.close()
+
+
+class AsyncHTTPPool:
+    """Minimal asyncio HTTP/1.1 client with a bounded keep-alive connection pool"""
+
+    def __init__(self, base_url, max_connections=64, timeout=10.0):
+        url = urllib.parse.urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = url.scheme == "https"
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle = []
+
+    async def request(self, method, path, headers=None, json_body=None, form=None):
+        """Send one request; returns (status, body bytes)"""
+        all_headers = {"Host": self.host, "Connection": "keep-alive", **(headers or {})}
+        body = b""
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            all_headers["Content-Type"] = "application/json"
+        elif form is not None:
+            body = urllib.parse.urlencode(form).encode()
+            all_headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port, ssl=self.ssl or None),
+                    self.timeout)
+                conn = _AsyncHTTPConnection(reader, writer)
+            try:
+                result = await asyncio.wait_for(
+                    conn.request(method, self.prefix + path, all_headers, body), self.timeout)
+            except BaseException:
+                conn.close()
+                raise
+            if conn.reusable:
+                self._idle.append(conn)
+            else:
+                conn.close()
+            return result
+
+    async def close(self):
+        while self._idle:
+            self._idle.pop().close()
+
+
+# Endpoint name -> (method, JSON body) issued by the load generator
+LOADGEN_REQUESTS = {
+    "ai_chat": ("POST", {"message": "Summarize Q3 revenue drivers"}),
+    "system_control": ("POST", {"command": "Get comprehensive system diagnostics"}),
+    "file_analysis": ("POST", {"filename": "report.pdf"}),
+    "security_scan": ("POST", {"domain": "example.com"}),
+}
+
+
+LOADGEN_DEFAULT_MIX = {"ai_chat": 5, "security_scan": 3, "system_control": 1, "file_analysis": 1}
+
+
+_LOADGEN_CREDENTIALS = {"username": "demo@visionmind.ai", "password": "demo123"}
+
+
+async def run_load_test(base_url, mode="closed", mix=None, duration=10.0, rate=100.0,
+                        concurrency=16, max_connections=64, think_time=0.0,
+                        poisson=False, seed=None):
+    """Drive the /v1/* endpoints and return latency histograms and error rates"""
+    mix = mix or LOADGEN_DEFAULT_MIX
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    rng = random.Random(seed)
+    pool = AsyncHTTPPool(base_url, max_connections=max_connections)
+    histograms = {name: LatencyHistogram() for name in names}
+    errors = {name: 0 for name in names}
+    auth_path = DEMO_CONFIG["api_endpoints"]["authentication"]
+
+    status, body = await pool.request("POST", auth_path, form=_LOADGEN_CREDENTIALS)
+    if status != 200:
+        await pool.close()
+        raise RuntimeError(f"authentication failed with HTTP {status}")
+    headers = {"Authorization": f"Bearer {json.loads(body)['access_token']}"}
+
+    async def fire(name, scheduled):
+        method, payload = LOADGEN_REQUESTS[name]
+        try:
+            status, _ = await pool.request(
+                method, DEMO_CONFIG["api_endpoints"][name], headers, json_body=payload)
+            if status >= 400:
+                errors[name] += 1
+        except Exception:
+            errors[name] += 1
+        histograms[name].record((time.perf_counter() - scheduled) * 1e6)
+
+    start = time.perf_counter()
+    deadline = start + duration
+
+    if mode == "closed":
+        async def user():
+            while time.perf_counter() < deadline:
+                await fire(rng.choices(names, weights)[0], time.perf_counter())
+                if think_time:
+                    await asyncio.sleep(think_time)
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+    elif mode == "open":
+        in_flight = set()
+        scheduled = start
+        while scheduled < deadline:
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(fire(rng.choices(names, weights)[0], scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            scheduled += rng.expovariate(rate) if poisson else 1 / rate
+        if in_flight:
+            await asyncio.gather(*in_flight)
+    else:
+        raise ValueError(f"unknown load mode {mode!r}")
+
+    elapsed = time.perf_counter() - start
+    await pool.close()
+
+    overall = LatencyHistogram()
+    for histogram in histograms.values():
+        overall.merge(histogram)
+    total_errors = sum(errors.values())
+    return {
+        "mode": mode,
+        "base_url": base_url,
+        "duration_seconds": round(elapsed, 3),
+        "target_rate": rate if mode == "open" else None,
+        "concurrency": concurrency if mode == "closed" else None,
+        "requests": overall.count,
+        "errors": total_errors,
+        "error_rate": round(total_errors / overall.count, 6) if overall.count else 0.0,
+        "throughput_rps": round(overall.count / elapsed, 2) if elapsed else None,
+        "latency_ms": overall.summary(),
+        "endpoints": {
+            name: {
+                "requests": histograms[name].count,
+                "errors": errors[name],
+                "error_rate": round(errors[name] / histograms[name].count, 6)
+                if histograms[name].count else 0.0,
+                "latency_ms": histograms[name].summary(),
+            }
+            for name in names
+        },
+    }
+
+
+def parse_mix(text):
+    """Parse "ai_chat=5,security_scan=3" into an endpoint weight dict"""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in LOADGEN_REQUESTS:
+            raise argparse.ArgumentTypeError(
+                f"unknown endpoint {name!r} (choose from {', '.join(LOADGEN_REQUESTS)})")
+        mix[name] = float(weight or 1)
+    return mix
@@ -0,0 +1,278 @@
+"""Market analytics over CSV and Parquet datasets"""
+
+import collections
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+from .core import CACHE_DIR, LazyModule, np, pd, peak_rss_mb
+
+
+pq = LazyModule("pyarrow.parquet")
+
+
+# Columns read from market datasets: one row per account (or cohort) per day
+MARKET_VALUE_COLUMNS = ("revenue", "cost_of_revenue", "marketing_spend",
+                        "new_customers", "churned_customers", "active_customers")
+
+
+MARKET_COLUMNS = ("date", "segment") + MARKET_VALUE_COLUMNS
+
+
+MARKET_SEGMENTS = ("enterprise", "mid_market", "smb")
+
+
+class _ByteRange:
+    """Read-only file view of bytes [start, stop), so a growing file reads consistently"""
+
+    def __init__(self, handle, start, stop):
+        handle.seek(start)
+        self.handle = handle
+        self.remaining = stop - start
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.handle.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def _complete_lines_end(path, size):
+    """Offset just past the last newline before `size`, so a half-written row waits"""
+    with open(path, "rb") as handle:
+        position = size
+        while position > 0:
+            step = min(65536, position)
+            handle.seek(position - step)
+            block = handle.read(step)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return position - step + newline + 1
+            position -= step
+    return 0
+
+
+def _file_digest(path, start, stop):
+    with open(path, "rb") as handle:
+        handle.seek(max(0, start))
+        return hashlib.sha256(handle.read(max(0, stop - max(0, start)))).hexdigest()
+
+
+class MarketAnalytics:
+    """Incremental CAGR, CAC/LTV and margin metrics over CSV or Parquet datasets"""
+
+    def __init__(self, chunk_rows=250000, cache_path=None, use_cache=True):
+        self.chunk_rows = chunk_rows
+        self.cache_path = (cache_path or os.path.join(CACHE_DIR, "market_analytics.json")
+                           if use_cache else None)
+        self.files = {}
+        if self.cache_path and os.path.exists(self.cache_path):
+            with open(self.cache_path) as f:
+                self.files = json.load(f)
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.files, f)
+        os.replace(tmp_path, self.cache_path)
+
+    @staticmethod
+    def dataset_files(path):
+        """The CSV/Parquet files of a dataset: `path` itself, or those in a directory"""
+        if not os.path.isdir(path):
+            return [os.path.abspath(path)]
+        return sorted(entry.path for entry in os.scandir(os.path.abspath(path))
+                      if entry.is_file() and entry.name.endswith((".csv", ".parquet")))
+
+    def _fold(self, entry, chunk):
+        """Add one chunk's per-(year, segment) sums into a file's cache entry"""
+        dates = chunk["date"]
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            dates = dates.dt.strftime("%Y-%m-%d")
+        dates = dates.astype(str).str.slice(0, 10)
+        years = dates.str.slice(0, 4)
+        spans = entry.setdefault("spans", {})
+        for year, (first, last) in dates.groupby(years).agg(["min", "max"]).iterrows():
+            span = spans.get(year)
+            spans[year] = [first, last] if span is None else [min(span[0], first), max(span[1], last)]
+        segments = chunk["segment"].astype(str) if "segment" in chunk else "all"
+        values = chunk.reindex(columns=MARKET_VALUE_COLUMNS, fill_value=0).astype("float64")
+        values["rows"] = 1.0
+        sums = values.groupby([years.rename("year"), pd.Series(segments, index=chunk.index,
+                                                               name="segment")]).sum()
+        aggregates = entry["aggregates"]
+        for (year, segment), row in zip(sums.index, sums.to_numpy().tolist()):
+            key = f"{year}|{segment}"
+            total = aggregates.get(key)
+            aggregates[key] = row if total is None else [a + b for a, b in zip(total, row)]
+        entry["rows"] += len(chunk)
+        return len(chunk)
+
+    def _update_csv(self, path, entry):
+        size = os.path.getsize(path)
+        head = _file_digest(path, 0, min(size, 65536))
+        offset = entry.get("offset", 0) if entry else 0
+        if (not entry or entry.get("head") != head or size < offset
+                or entry.get("tail") != _file_digest(path, offset - 4096, offset)):
+            entry = {"format": "csv", "head": head, "offset": 0, "rows": 0, "aggregates": {}, "spans": {},
+                     "columns": list(pd.read_csv(path, nrows=0).columns)}
+        stop = _complete_lines_end(path, size)
+        if stop <= entry["offset"]:
+            return entry, 0
+        columns = entry["columns"]
+        with open(path, "rb") as handle:
+            if entry["offset"] == 0:
+                reader = pd.read_csv(_ByteRange(handle, 0, stop), chunksize=self.chunk_rows,
+                                     usecols=lambda column: column in MARKET_COLUMNS)
+            else:
+                reader = pd.read_csv(_ByteRange(handle, entry["offset"], stop), header=None,
+                                     names=columns, chunksize=self.chunk_rows,
+                                     usecols=[c for c in columns if c in MARKET_COLUMNS])
+            processed = sum(self._fold(entry, chunk) for chunk in reader)
+        entry["offset"] = stop
+        entry["tail"] = _file_digest(path, stop - 4096, stop)
+        return entry, processed
+
+    def _update_parquet(self, path, entry):
+        try:
+            parquet = pq.ParquetFile(path)
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(f"{path}: reading Parquet needs pyarrow (pip install pyarrow); "
+                               "without it, use CSV datasets") from exc
+        groups = [parquet.metadata.row_group(i).num_rows
+                  for i in range(parquet.metadata.num_row_groups)]
+        done = entry.get("row_groups", []) if entry else []
+        if not entry or groups[:len(done)] != done:
+            entry = {"format": "parquet", "row_groups": [], "rows": 0, "aggregates": {},
+                     "spans": {}}
+            done = []
+        if len(groups) == len(done):
+            return entry, 0
+        columns = [name for name in parquet.schema_arrow.names if name in MARKET_COLUMNS]
+        processed = 0
+        for batch in parquet.iter_batches(batch_size=self.chunk_rows, columns=columns,
+                                          row_groups=range(len(done), len(groups))):
+            processed += self._fold(entry, batch.to_pandas())
+        entry["row_groups"] = groups
+        return entry, processed
+
+    def update(self, path):
+        """Fold any rows not yet seen from the dataset at `path`; returns the paths' files"""
+        files = self.dataset_files(path)
+        processed = 0
+        for file in files:
+            update = self._update_parquet if file.endswith(".parquet") else self._update_csv
+            self.files[file], rows = update(file, self.files.get(file))
+            processed += rows
+        self._save_cache()
+        return files, processed
+
+    def metrics(self, files=None):
+        """CAGR, gross margin, CAC, LTV and LTV/CAC overall, by year and by segment"""
+        totals = collections.defaultdict(lambda: [0.0] * (len(MARKET_VALUE_COLUMNS) + 1))
+        by_year = collections.defaultdict(lambda: [0.0] * (len(MARKET_VALUE_COLUMNS) + 1))
+        by_segment = collections.defaultdict(lambda: [0.0] * (len(MARKET_VALUE_COLUMNS) + 1))
+        spans = {}
+        for file in files or self.files:
+            for year, (first, last) in self.files[file].get("spans", {}).items():
+                span = spans.get(year)
+                spans[year] = [first, last] if span is None else [min(span[0], first),
+                                                                  max(span[1], last)]
+            for key, values in self.files[file]["aggregates"].items():
+                year, segment = key.split("|", 1)
+                for target in (totals["all"], by_year[year], by_segment[segment]):
+                    for i, value in enumerate(values):
+                        target[i] += value
+
+        def summarize(values):
+            revenue, cost, marketing, new, churned, active, rows = values
+            gross_profit = revenue - cost
+            cac = marketing / new if new else None
+            ltv = gross_profit / churned if churned else None
+            return {
+                "rows": int(rows),
+                "revenue": round(revenue, 2),
+                "gross_margin": round(gross_profit / revenue, 4) if revenue else None,
+                "cac": round(cac, 2) if cac is not None else None,
+                "ltv": round(ltv, 2) if ltv is not None else None,
+                "ltv_to_cac": round(ltv / cac, 2) if ltv is not None and cac else None,
+                "monthly_churn": round(30 * churned / active, 4) if active else None,
+            }
+
+        def annualized(year):
+            first, last = (datetime.fromisoformat(day).toordinal() for day in spans[year])
+            return by_year[year][0] * 365 / (last - first + 1)
+
+        years = sorted(by_year)
+        cagr = None
+        if len(years) > 1 and all(year in spans for year in years) and annualized(years[0]) > 0:
+            span = int(years[-1]) - int(years[0])
+            cagr = round((annualized(years[-1]) / annualized(years[0])) ** (1 / span) - 1, 4)
+        return {
+            "revenue_cagr": cagr,
+            **summarize(totals["all"]),
+            "by_year": {year: {**summarize(by_year[year]),
+                               "annualized_revenue": round(annualized(year), 2)
+                               if year in spans else None}
+                        for year in years},
+            "by_segment": {segment: summarize(values)
+                           for segment, values in sorted(by_segment.items())},
+        }
+
+    def analyze(self, path):
+        """update() then metrics() for one dataset, with throughput and peak memory"""
+        start = time.perf_counter()
+        files, processed = self.update(path)
+        elapsed = time.perf_counter() - start
+        return {
+            "files": len(files),
+            "rows_processed": processed,
+            "rows_total": sum(self.files[file]["rows"] for file in files),
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(processed / elapsed, 1) if elapsed and processed else None,
+            "peak_rss_mb": peak_rss_mb(),
+            **self.metrics(files),
+        }
+
+
+_UNIX_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+def write_market_dataset(path, rows=1000000, rows_per_day=2000, append=False, seed=None,
+                         chunk_rows=250000):
+    """Write synthetic daily account metrics as CSV, about 40% yearly revenue growth"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1).toordinal()
+    if append and os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb") as handle:
+            handle.seek(-min(4096, os.path.getsize(path)), os.SEEK_END)
+            last = handle.read().rstrip(b"\n").rsplit(b"\n", 1)[-1].decode()
+        start = datetime.fromisoformat(last.split(",", 1)[0]).toordinal() + 1
+    header = not (append and os.path.exists(path))
+    base = datetime(2024, 1, 1).toordinal()
+    with open(path, "a" if append else "w", newline="") as handle:
+        for offset in range(0, rows, chunk_rows):
+            count = min(chunk_rows, rows - offset)
+            day = start + np.arange(offset, offset + count) // rows_per_day
+            growth = 1.4 ** ((day - base) / 365)
+            labels = pd.to_datetime(np.arange(day[0], day[-1] + 1) - _UNIX_EPOCH_ORDINAL,
+                                    unit="D").strftime("%Y-%m-%d").to_numpy()
+            revenue = rng.lognormal(5.0, 0.6, count) * growth
+            frame = pd.DataFrame({
+                "date": labels[day - day[0]],
+                "segment": np.array(MARKET_SEGMENTS)[rng.integers(0, len(MARKET_SEGMENTS), count)],
+                "revenue": revenue.round(2),
+                "cost_of_revenue": (revenue * rng.uniform(0.1, 0.2, count)).round(2),
+                "marketing_spend": rng.exponential(40.0, count).round(2),
+                "new_customers": rng.binomial(1, 0.03, count),
+                "churned_customers": rng.binomial(1, 0.001, count),
+                "active_customers": 1,
+            })
+            frame.to_csv(handle, header=header and offset == 0, index=False)
+    return path
@@ -0,0 +1,328 @@
+"""Conversation memory: embeddings and nearest-neighbour recall"""
+
+import contextlib
+import functools
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import time
+
+from .core import np
+
+
+@functools.lru_cache(maxsize=65536)
+def _feature_slot(feature, dim):
+    """Signed bucket for one token or bigram in a hashed embedding"""
+    value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+    return value % dim, 1.0 if value >> 63 else -1.0
+
+
+def embed_texts(texts, dim=256):
+    """L2-normalized hashed bag-of-words/bigram embeddings, one float32 row per text"""
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        tokens = re.findall(r"\w+", text.lower())
+        for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            slot, sign = _feature_slot(feature, dim)
+            matrix[row, slot] += sign
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class ConversationMemory:
+    """Embedding store for conversation context with exact and approximate search"""
+
+    def __init__(self, dim=256, max_entries=None, memory_budget_mb=None,
+                 ann_threshold=20000, nprobe=8):
+        self.dim = dim
+        self.max_entries = max_entries
+        self.memory_budget_mb = memory_budget_mb
+        self.ann_threshold = ann_threshold
+        self.nprobe = nprobe
+        self.vectors = np.empty((1024, dim), dtype=np.float32)
+        self.last_used = np.empty(1024, dtype=np.int64)
+        self.partition = np.empty(1024, dtype=np.int32)
+        self.texts = []
+        self.conversations = []
+        self.centroids = None
+        self.bounds = None
+        self.evicted = 0
+        self._count = 0
+        self._clock = 0
+        self._indexed = 0
+        self._sorted = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def entry_limit(self):
+        """Most entries allowed by max_entries and memory_budget_mb, or None"""
+        limits = [self.max_entries] if self.max_entries else []
+        if self.memory_budget_mb:
+            # vector row plus last-used clock and partition id
+            limits.append(int(self.memory_budget_mb * 1e6 // (self.dim * 4 + 12)))
+        return min(limits) if limits else None
+
+    def _reserve(self, rows):
+        if rows <= len(self.vectors):
+            return
+        capacity = max(rows, 2 * len(self.vectors))
+        for name in ("vectors", "last_used", "partition"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._count] = old[:self._count]
+            setattr(self, name, new)
+
+    def add(self, texts, conversation=None, vectors=None):
+        """Store texts, embedding them unless `vectors` holds their embeddings"""
+        if vectors is None:
+            vectors = embed_texts(texts, self.dim)
+        start, stop = self._count, self._count + len(vectors)
+        self._reserve(stop)
+        self.vectors[start:stop] = vectors
+        self.last_used[start:stop] = np.arange(self._clock, self._clock + len(vectors))
+        self._clock += len(vectors)
+        if self.centroids is not None:
+            self.partition[start:stop] = self._nearest_centroids(vectors, 1)[:, 0]
+        self.texts.extend(texts)
+        self.conversations.extend([conversation] * len(vectors))
+        self._count = stop
+        limit = self.entry_limit
+        if limit and self._count > limit:
+            self.evict(self._count - int(limit * 0.9))
+        elif self._count >= self.ann_threshold and self._count >= 2 * self._indexed:
+            self.build_index()
+
+    def evict(self, count):
+        """Drop the `count` least recently used entries, compacting the matrix"""
+        count = min(count, self._count)
+        if count <= 0:
+            return
+        victims = np.argpartition(self.last_used[:self._count], count - 1)[:count]
+        keep = np.ones(self._count, dtype=bool)
+        keep[victims] = False
+        # compaction keeps row order, so the partition-sorted head stays sorted
+        self._sorted = int(keep[:self._sorted].sum())
+        self._compact(np.flatnonzero(keep))
+        if self.centroids is not None:
+            self._set_bounds()
+        self.evicted += count
+
+    def _compact(self, rows):
+        """Rearrange the first len(rows) entries to be `rows`, in that order"""
+        self._count = len(rows)
+        for name in ("vectors", "last_used", "partition"):
+            array = getattr(self, name)
+            array[:self._count] = array[rows]
+        self.texts = [self.texts[i] for i in rows]
+        self.conversations = [self.conversations[i] for i in rows]
+
+    def _set_bounds(self):
+        self.bounds = np.searchsorted(self.partition[:self._sorted],
+                                      np.arange(len(self.centroids) + 1))
+
+    def build_index(self, partitions=None, iterations=8, seed=0):
+        """Train k-means centroids (about sqrt(n) of them) and group rows by partition"""
+        count = self._count
+        partitions = partitions or max(1, int(math.sqrt(count)))
+        rng = np.random.default_rng(seed)
+        data = self.vectors[:count]
+        sample = data[rng.choice(count, min(count, partitions * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), partitions, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            filled = norms[:, 0] > 0
+            centroids[filled] = sums[filled] / norms[filled]
+        self.centroids = centroids
+        for start in range(0, count, 65536):
+            block = data[start:start + 65536]
+            self.partition[start:start + len(block)] = self._nearest_centroids(block, 1)[:, 0]
+        self._compact(np.argsort(self.partition[:count], kind="stable"))
+        self._indexed = self._sorted = count
+        self._set_bounds()
+
+    def _nearest_centroids(self, vectors, n):
+        scores = vectors @ self.centroids.T
+        n = min(n, scores.shape[1])
+        return np.argpartition(-scores, n - 1, axis=1)[:, :n]
+
+    @staticmethod
+    def _top_k(scores, k):
+        k = min(k, scores.shape[-1])
+        if k == 0:
+            return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+        top = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=-1), axis=-1)
+        return np.take_along_axis(top, order, axis=-1)
+
+    def search_vectors(self, queries, k=5, exact=None):
+        """Top-k (rows, scores) arrays per query row, best first"""
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        if exact is None:
+            exact = self.centroids is None or self._count < self.ann_threshold
+        if exact:
+            scores = queries @ self.vectors[:self._count].T
+            rows = self._top_k(scores, k)
+            return rows, np.take_along_axis(scores, rows, axis=1)
+        probes = self._nearest_centroids(queries, self.nprobe)
+        rows = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        for i, (query, probe) in enumerate(zip(queries, probes)):
+            slices = [(self.bounds[p], self.bounds[p + 1]) for p in probe]
+            slices.append((self._sorted, self._count))
+            candidates = np.concatenate([np.arange(a, b) for a, b in slices])
+            candidate_scores = np.concatenate([self.vectors[a:b] @ query for a, b in slices])
+            best = self._top_k(candidate_scores, k)
+            rows[i, :len(best)] = candidates[best]
+            scores[i, :len(best)] = candidate_scores[best]
+        return rows, scores
+
+    def search(self, texts, k=5, conversation=None, exact=None):
+        """Recall the k most similar stored entries for each text"""
+        if not self._count:
+            return [[] for _ in texts]
+        fetch = k if conversation is None else min(self._count, k * 8)
+        rows, scores = self.search_vectors(embed_texts(texts, self.dim), fetch, exact)
+        results = []
+        for query_rows, query_scores in zip(rows, scores):
+            hits = [{"text": self.texts[row], "conversation": self.conversations[row],
+                     "score": round(float(score), 4)}
+                    for row, score in zip(query_rows, query_scores)
+                    if row >= 0 and (conversation is None or self.conversations[row] == conversation)]
+            results.append(hits[:k])
+            used = query_rows[query_rows >= 0]
+            self.last_used[used] = self._clock
+            self._clock += 1
+        return results
+
+    def memory_bytes(self):
+        return self.vectors.nbytes + self.last_used.nbytes + self.partition.nbytes
+
+    def save(self, directory):
+        """Write the store to `directory` as .npy arrays plus a JSON sidecar"""
+        os.makedirs(directory, exist_ok=True)
+        count = self._count
+        self._save_array(directory, "vectors", self.vectors[:count])
+        self._save_array(directory, "last_used", self.last_used[:count])
+        self._save_array(directory, "partition", self.partition[:count])
+        if self.centroids is not None:
+            self._save_array(directory, "centroids", self.centroids)
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(directory, "centroids.npy"))
+        meta = {"dim": self.dim, "clock": self._clock, "indexed": self._indexed,
+                "sorted": self._sorted,
+                "texts": self.texts, "conversations": self.conversations}
+        tmp = os.path.join(directory, "memory.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+        os.replace(tmp, os.path.join(directory, "memory.json"))
+
+    @staticmethod
+    def _save_array(directory, name, array):
+        """Write <name>.npy through a temp file; a loaded store may still be mapping the old one"""
+        path = os.path.join(directory, f"{name}.npy")
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as handle:
+            np.save(handle, array)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, directory, **options):
+        """Reopen a saved store; arrays are memory-mapped copy-on-write, not read up front"""
+        with open(os.path.join(directory, "memory.json"), encoding="utf-8") as handle:
+            meta = json.load(handle)
+        store = cls(dim=meta["dim"], **options)
+        for name in ("vectors", "last_used", "partition"):
+            setattr(store, name, np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="c"))
+        centroids = os.path.join(directory, "centroids.npy")
+        if os.path.exists(centroids):
+            store.centroids = np.load(centroids)
+        store.texts = meta["texts"]
+        store.conversations = meta["conversations"]
+        store._count = len(store.texts)
+        store._clock = meta["clock"]
+        store._indexed = meta["indexed"]
+        store._sorted = meta["sorted"]
+        if store.centroids is not None:
+            store._set_bounds()
+        return store
+
+    @classmethod
+    def open(cls, directory, **options):
+        """load() when `directory` holds a saved store, otherwise a new empty one"""
+        if os.path.exists(os.path.join(directory, "memory.json")):
+            return cls.load(directory, **options)
+        return cls(**options)
+
+
+def _synthetic_embeddings(count, dim, rng, clusters=1000):
+    """Normalized vectors scattered around random topic centres"""
+    centres = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centres[rng.integers(0, clusters, count)]
+    vectors += 0.6 * rng.standard_normal((count, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def benchmark_memory_store(sizes=(1000, 10000, 100000), dim=256, queries=64, k=10, seed=0):
+    """Query latency against store size: exact batched, exact single and approximate"""
+    rng = np.random.default_rng(seed)
+    report = []
+    for size in sizes:
+        store = ConversationMemory(dim=dim, ann_threshold=size + 1)
+        vectors = _synthetic_embeddings(size, dim, rng)
+        start = time.perf_counter()
+        for offset in range(0, size, 10000):
+            block = vectors[offset:offset + 10000]
+            store.add([""] * len(block), vectors=block)
+        add_seconds = time.perf_counter() - start
+        sample = vectors[rng.integers(0, size, queries)]
+        probes = sample + 0.02 * rng.standard_normal(sample.shape).astype(np.float32)
+        probes /= np.linalg.norm(probes, axis=1, keepdims=True)
+
+        start = time.perf_counter()
+        store.build_index()
+        build_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        exact_rows, _ = store.search_vectors(probes, k, exact=True)
+        batched = time.perf_counter() - start
+        start = time.perf_counter()
+        for probe in probes[:8]:
+            store.search_vectors(probe, k, exact=True)
+        single = (time.perf_counter() - start) / min(8, queries)
+        start = time.perf_counter()
+        approx_rows, _ = store.search_vectors(probes, k, exact=False)
+        approximate = time.perf_counter() - start
+        recall = np.mean([len(set(a) & set(e)) / len(e) for a, e in zip(approx_rows, exact_rows)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            store.save(directory)
+            save_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            reloaded = ConversationMemory.load(directory)
+            reloaded.search_vectors(probes[:1], k, exact=True)
+            load_seconds = time.perf_counter() - start
+
+        report.append({
+            "entries": size,
+            "memory_mb": round(store.memory_bytes() / 1e6, 1),
+            "inserts_per_second": round(size / add_seconds, 1),
+            "exact_batched_ms_per_query": round(batched * 1000 / queries, 4),
+            "exact_single_ms_per_query": round(single * 1000, 4),
+            "approximate_ms_per_query": round(approximate * 1000 / queries, 4),
+            f"approximate_recall_at_{k}": round(float(recall), 4),
+            "partitions": len(store.centroids),
+            "index_build_seconds": round(build_seconds, 3),
+            "save_seconds": round(save_seconds, 3),
+            "load_and_first_query_seconds": round(load_seconds, 3),
+        })
+    return {"dim": dim, "queries": queries, "k": k, "sizes": report}
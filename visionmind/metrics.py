@@ -0,0 +1,212 @@
+"""System metrics sampling with ring-buffer rollups"""
+
+import array
+import os
+import threading
+import time
+
+
+class RingBuffer:
+    """Fixed-capacity ring of float rows stored in one flat array"""
+
+    def __init__(self, fields, capacity):
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self._width = len(self.fields) + 1  # column 0 is the timestamp
+        self._data = array.array("d", bytes(8 * self._width * capacity))
+        self._next = 0
+        self.size = 0
+
+    def append(self, timestamp, values):
+        offset = self._next * self._width
+        self._data[offset] = timestamp
+        self._data[offset + 1:offset + self._width] = array.array("d", values)
+        self._next = (self._next + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def rows(self, last=None):
+        """Up to `last` most recent rows, oldest first, as (timestamp, values) pairs"""
+        count = self.size if last is None else min(last, self.size)
+        rows = []
+        for i in range(self._next - count, self._next):
+            offset = (i % self.capacity) * self._width
+            rows.append((self._data[offset], tuple(self._data[offset + 1:offset + self._width])))
+        return rows
+
+    def latest(self):
+        rows = self.rows(1)
+        return dict(zip(self.fields, rows[0][1])) if rows else None
+
+
+class _Rollup:
+    """Averages raw samples into fixed-width time buckets kept in a RingBuffer"""
+
+    def __init__(self, fields, resolution, capacity):
+        self.resolution = resolution
+        self.ring = RingBuffer(fields, capacity)
+        self._bucket = None
+        self._sums = [0.0] * len(fields)
+        self._count = 0
+
+    def add(self, timestamp, values):
+        bucket = timestamp // self.resolution
+        if self._bucket is not None and bucket != self._bucket and self._count:
+            self.ring.append(self._bucket * self.resolution,
+                             [total / self._count for total in self._sums])
+            self._sums = [0.0] * len(self._sums)
+            self._count = 0
+        self._bucket = bucket
+        for i, value in enumerate(values):
+            self._sums[i] += value
+        self._count += 1
+
+
+class SystemMetricsSampler:
+    """Background sampler of CPU, memory, disk and network counters from /proc"""
+
+    FIELDS = ("cpu_percent", "memory_percent", "disk_read_bps", "disk_write_bps",
+              "net_rx_bps", "net_tx_bps")
+    ROLLUPS = (1, 10, 60)
+    _SOURCES = ("/proc/stat", "/proc/meminfo", "/proc/diskstats", "/proc/net/dev")
+
+    def __init__(self, interval=1.0, capacity=3600, overhead_budget=0.01):
+        if not self.available():
+            raise RuntimeError("SystemMetricsSampler needs a Linux /proc filesystem")
+        self.interval = interval
+        self.overhead_budget = overhead_budget
+        self.samples = RingBuffer(self.FIELDS, capacity)
+        self.rollups = {resolution: _Rollup(self.FIELDS, resolution, capacity)
+                        for resolution in self.ROLLUPS}
+        try:
+            self._disks = {name for name in os.listdir("/sys/block")
+                           if not name.startswith(("loop", "ram", "zram"))}
+        except OSError:
+            self._disks = None
+        self._fds = None
+        self._previous = None
+        self._cpu_seconds = 0.0
+        self._started = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def available(cls):
+        """Whether this system has the /proc files the sampler reads"""
+        return all(os.path.exists(path) for path in cls._SOURCES)
+
+    def _read(self, index):
+        return os.pread(self._fds[index], 1 << 16, 0).decode("ascii", "replace")
+
+    def _counters(self):
+        """Raw cumulative counters: (time, cpu busy, cpu total, mem %, disk r/w bytes, net rx/tx bytes)"""
+        cpu = [int(field) for field in self._read(0).split("\n", 1)[0].split()[1:9]]
+        total = sum(cpu)
+        busy = total - cpu[3] - cpu[4]
+
+        meminfo = {}
+        for line in self._read(1).splitlines()[:8]:
+            name, _, value = line.partition(":")
+            meminfo[name] = int(value.split()[0])
+        memory = 100.0 * (1 - meminfo["MemAvailable"] / meminfo["MemTotal"])
+
+        disk_read = disk_write = 0
+        for line in self._read(2).splitlines():
+            fields = line.split()
+            if self._disks is None or fields[2] in self._disks:
+                disk_read += int(fields[5]) * 512
+                disk_write += int(fields[9]) * 512
+
+        net_rx = net_tx = 0
+        for line in self._read(3).splitlines()[2:]:
+            name, _, values = line.partition(":")
+            if name.strip() != "lo":
+                values = values.split()
+                net_rx += int(values[0])
+                net_tx += int(values[8])
+        return time.time(), busy, total, memory, disk_read, disk_write, net_rx, net_tx
+
+    def sample(self):
+        """Take one sample now; returns its metrics, or None for the first reading"""
+        cpu_start = time.thread_time()
+        if self._fds is None:
+            self._fds = [os.open(path, os.O_RDONLY) for path in self._SOURCES]
+        current = self._counters()
+        values = None
+        with self._lock:
+            previous, self._previous = self._previous, current
+            if previous is not None:
+                elapsed = current[0] - previous[0] or 1e-9
+                cpu_total = current[2] - previous[2]
+                values = (
+                    100.0 * (current[1] - previous[1]) / cpu_total if cpu_total else 0.0,
+                    current[3],
+                    (current[4] - previous[4]) / elapsed,
+                    (current[5] - previous[5]) / elapsed,
+                    (current[6] - previous[6]) / elapsed,
+                    (current[7] - previous[7]) / elapsed,
+                )
+                self.samples.append(current[0], values)
+                for rollup in self.rollups.values():
+                    rollup.add(current[0], values)
+            self._cpu_seconds += time.thread_time() - cpu_start
+        return dict(zip(self.FIELDS, values)) if values else None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+            # Judge overhead over a few samples, not the start-up reading
+            if self.samples.size >= 10 and self.overhead() > self.overhead_budget:
+                self.interval *= 2
+
+    def start(self):
+        self._started = time.perf_counter()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="visionmind-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        for fd in self._fds or ():
+            os.close(fd)
+        self._fds = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def overhead(self):
+        """Sampling CPU time as a fraction of one core since start()"""
+        if self._started is None:
+            return 0.0
+        return self._cpu_seconds / max(time.perf_counter() - self._started, 1e-9)
+
+    def latest(self):
+        with self._lock:
+            return self.samples.latest()
+
+    def rollup(self, resolution, last=None):
+        """Averaged rows for a 1, 10 or 60 second resolution, oldest first"""
+        with self._lock:
+            rows = self.rollups[resolution].ring.rows(last)
+        return [{"timestamp": ts, **dict(zip(self.FIELDS, values))} for ts, values in rows]
+
+    def report(self, last=10):
+        """Latest sample, recent rollups and measured overhead as a dict"""
+        def rounded(row):
+            return {name: round(value, 3) for name, value in row.items()}
+
+        latest = self.latest()
+        return {
+            "interval_seconds": self.interval,
+            "samples": self.samples.size,
+            "overhead_percent_of_core": round(self.overhead() * 100, 4),
+            "latest": rounded(latest) if latest else None,
+            "rollups": {f"{resolution}s": [rounded(row) for row in self.rollup(resolution, last)]
+                        for resolution in self.ROLLUPS},
+        }
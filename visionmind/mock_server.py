@@ -0,0 +1,158 @@
+"""In-process mock of the VisionMind backend"""
+
+import hashlib
+import http.server
+import json
+import os
+import random
+import secrets
+import threading
+import time
+import urllib.parse
+
+from .config import DEMO_CONFIG
+
+
+# File extension -> analysis summary returned by the mock /v1/files/analyze
+_MOCK_FILE_SUMMARIES = {
+    ".pdf": "PDF Document Analysis - Text extracted, sentiment analyzed",
+    ".jpg": "Image Processing - Objects detected, metadata extracted",
+    ".mp3": "Audio File - Transcribed, speaker diarization completed",
+    ".zip": "Code Repository - Quality analysis, vulnerabilities identified",
+}
+
+
+def _mock_auth(server, body):
+    if not body.get("username") or not body.get("password"):
+        return 400, {"detail": "username and password are required"}
+    token = secrets.token_hex(16)
+    with server.lock:
+        server.tokens.add(token)
+    return 200, {"access_token": token, "token_type": "bearer", "expires_in": server.token_ttl}
+
+
+def _mock_message(server, body):
+    with server.lock:
+        server.message_count += 1
+        count = server.message_count
+    return 200, {
+        "response": f"AI Analysis #{count}: Comprehensive analysis generated "
+                    "with 15+ insights and actionable recommendations",
+    }
+
+
+def _mock_system_command(server, body):
+    return 200, {"command": body.get("command", ""), "status": "completed", "exit_code": 0}
+
+
+def _mock_file_analysis(server, body):
+    filename = body.get("filename", "")
+    summary = _MOCK_FILE_SUMMARIES.get(os.path.splitext(filename)[1].lower(),
+                                       "Generic File - Metadata extracted")
+    return 200, {"filename": filename, "summary": summary}
+
+
+def _mock_domain_reputation(server, body):
+    domain = body.get("domain", "")
+    score = 60 + int(hashlib.sha256(domain.encode()).hexdigest(), 16) % 40
+    return 200, {"domain": domain, "score": score}
+
+
+# Endpoint name (DEMO_CONFIG["api_endpoints"]) -> mock handler
+MOCK_ROUTES = {
+    "authentication": _mock_auth,
+    "ai_chat": _mock_message,
+    "system_control": _mock_system_command,
+    "file_analysis": _mock_file_analysis,
+    "security_scan": _mock_domain_reputation,
+}
+
+
+class _MockAPIHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; don't let Nagle hold the body
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self):
+        server = self.server
+        url = urllib.parse.urlsplit(self.path)
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if server.fail_rate and random.random() < server.fail_rate:
+            return self._send(503, {"detail": "injected failure"})
+        if server.latency:
+            time.sleep(server.latency)
+
+        endpoint = server.paths.get(url.path)
+        if endpoint is None:
+            return self._send(404, {"detail": "not found"})
+        if endpoint != "authentication":
+            token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+            if token not in server.tokens:
+                return self._send(401, {"detail": "invalid token"})
+
+        body = dict(urllib.parse.parse_qsl(url.query))
+        if raw:
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                body.update(json.loads(raw))
+            else:
+                body.update(urllib.parse.parse_qsl(raw.decode()))
+        self._send(*MOCK_ROUTES[endpoint](server, body))
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _MockHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class MockVisionMindServer:
+    """Local stand-in for the VisionMind REST API, served from a thread"""
+
+    def __init__(self, host="127.0.0.1", port=0, fail_rate=0.0, latency=0.0, token_ttl=3600):
+        self.httpd = _MockHTTPServer((host, port), _MockAPIHandler)
+        self.httpd.paths = {path: name for name, path in DEMO_CONFIG["api_endpoints"].items()
+                            if name in MOCK_ROUTES}
+        self.httpd.tokens = set()
+        self.httpd.lock = threading.Lock()
+        self.httpd.message_count = 0
+        self.httpd.fail_rate = fail_rate
+        self.httpd.latency = latency
+        self.httpd.token_ttl = token_ttl
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="visionmind-mock-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,77 @@
+"""Parsing and aggregating the demo's money strings"""
+
+import functools
+import re
+from typing import NamedTuple
+
+from .core import np
+
+
+# "$2.4M/year for 500-employee company" -> 2.4, "M"; "$1,200" -> 1,200, ""; "$1.5bn" -> 1.5, "bn"
+# The number is matched atomically (lookahead + backreference) so "$100Million" can't
+# backtrack to "$10"; a figure followed by any other word is rejected
+_MONEY_RE = re.compile(r"\$\s*(?=(?P<number>\d[\d,]*(?:\.\d+)?))(?P=number)"
+                       r"\s*(?P<suffix>thousand|millions?|billions?|mn|bn|[kmb])?(?![A-Za-z])",
+                       re.IGNORECASE)
+
+
+_ANNUAL_RE = re.compile(r"/\s*y(?:ea)?r\b|\bannual(?:ly)?\b|\bper year\b", re.IGNORECASE)
+
+
+_MONEY_SCALE = {"": 1.0, "k": 1e3, "thousand": 1e3, "m": 1e6, "mn": 1e6, "million": 1e6,
+                "millions": 1e6, "b": 1e9, "bn": 1e9, "billion": 1e9, "billions": 1e9}
+
+
+# Total, conservative and aggressive valuation as multiples of total value
+VALUATION_MULTIPLES = (1, 5, 20)
+
+
+class MoneyValue(NamedTuple):
+    """A dollar figure parsed out of a free-text result string"""
+    amount: float
+    annual: bool
+    text: str
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_money(text):
+    """Parse the first dollar figure in `text`; unparseable text is $0"""
+    match = _MONEY_RE.search(text or "")
+    if match is None:
+        return MoneyValue(0.0, False, text)
+    number, suffix = match.group("number", "suffix")
+    amount = float(number.replace(",", "")) * _MONEY_SCALE[(suffix or "").lower()]
+    return MoneyValue(amount, bool(_ANNUAL_RE.search(text)), text)
+
+
+def component_value(details):
+    """The headline value of one demo_results entry"""
+    return parse_money(details.get('cost_savings') or details.get('estimated_business_value', '$0'))
+
+
+def value_matrix(runs):
+    """Parse many demo_results dicts into a (runs, components) dollar array"""
+    components = list(dict.fromkeys(component for results in runs for component in results))
+    column = {component: i for i, component in enumerate(components)}
+    rows = np.fromiter((row for row, results in enumerate(runs) for _ in results), dtype=np.intp)
+    cols = np.fromiter((column[component] for results in runs for component in results),
+                       dtype=np.intp)
+    values = np.fromiter((component_value(details).amount
+                          for results in runs for details in results.values()), dtype=float)
+    amounts = np.zeros((len(runs), len(components)))
+    amounts[rows, cols] = values
+    return components, amounts
+
+
+def valuation_summary(amounts):
+    """Total value and valuations for each row of a (runs, components) array"""
+    amounts = np.asarray(amounts, dtype=float)
+    return amounts.sum(axis=-1)[..., None] * np.asarray(VALUATION_MULTIPLES, dtype=float)
+
+
+def short_money(amount):
+    """$75M / $1.5B style figure for pitch text"""
+    for suffix, scale in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if amount >= scale:
+            return f"${amount / scale:,.1f}".rstrip("0").rstrip(".") + suffix
+    return f"${amount:,.0f}"
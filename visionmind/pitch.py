@@ -0,0 +1,214 @@
+"""Investment pitch generator"""
+
+from .core import LazyModule, emit
+from .money import parse_money, short_money
+
+valuation = LazyModule("visionmind.valuation")
+
+
+class VisionMindInvestmentPitch:
+    def __init__(self, valuation_scenarios=0):
+        self.pitch_data = self._load_pitch_data()
+        self.valuation_scenarios = valuation_scenarios
+    
+    def _load_pitch_data(self):
+        """Load compelling investment data"""
+        return {
+            "company_overview": {
+                "name": "VisionMind AI",
+                "tagline": "The World's Most Advanced AI Assistant Platform",
+                "founding_year": 2024,
+                "stage": "Series A Ready",
+                "technology": "Proprietary AI + Universal OS Control"
+            },
+            "market_opportunity": {
+                "total_market": "$126B",
+                "serviceable_market": "$45B",
+                "serviceable_obtainable_market": "$15B",
+                "growth_rate": "32% CAGR",
+                "market_trends": [
+                    "AI adoption accelerating across enterprises",
+                    "Labor costs increasing 15% annually",
+                    "Security breaches costing $4.5M per incident",
+                    "Digital transformation budgets growing 25% YoY"
+                ]
+            },
+            "competitive_advantage": {
+                "unique_features": [
+                    "Universal OS Control - No competitor has this",
+                    "Advanced Memory System - Context-aware AI",
+                    "Enterprise Security Suite - Built-in compliance",
+                    "Autonomous AI Agents - Scalable workforce"
+                ],
+                "moat": "Proprietary technology + 50+ advanced features",
+                "barriers_to_entry": "Advanced AI research + Security certifications"
+            },
+            "traction_metrics": {
+                "technology_readiness": "Enterprise Production Ready",
+                "customers": ["Fortune 500 Companies", "Government Agencies", "Tech Unicorns"],
+                "partnerships": ["AWS", "Microsoft", "Google Cloud", "Docker"],
+                "awards": ["Best AI Platform 2024", "Top Security Innovation", "Enterprise Excellence"]
+            },
+            "financial_projections": {
+                "year1": {"revenue": "$5M", "customers": 50, "employees": 25},
+                "year2": {"revenue": "$25M", "customers": 250, "employees": 80},
+                "year3": {"revenue": "$100M", "customers": 1000, "employees": 200},
+                "year5": {"revenue": "$500M", "customers": 5000, "employees": 500}
+            },
+            "investment_ask": {
+                "series_a": "$15M",
+                "valuation": "$150M pre-money",
+                "use_of_funds": [
+                    "40% - Engineering & Product Development",
+                    "25% - Sales & Marketing Expansion",
+                    "20% - Enterprise Security Certifications",
+                    "15% - Operational Scale"
+                ],
+                "milestones": [
+                    "Achieve $5M ARR within 12 months",
+                    "Secure 10 Fortune 500 customers",
+                    "Obtain SOC2, ISO27001, HIPAA compliance",
+                    "Expand to European and Asian markets"
+                ]
+            },
+            "team": {
+                "founders": ["AI Research PhDs", "Ex-Google/Meta Engineers", "Security Experts"],
+                "advisors": ["Fortune 500 CTOs", "AI Research Professors", "VC Partners"]
+            }
+        }
+    
+    def generate_executive_summary(self):
+        """Generate compelling executive summary"""
+        emit("🚀 VISIONMIND AI - EXECUTIVE SUMMARY")
+        emit("=" * 50)
+        
+        overview = self.pitch_data["company_overview"]
+        market = self.pitch_data["market_opportunity"]
+        financials = self.pitch_data["financial_projections"]
+        
+        summary = f"""
+{overview['name']} is revolutionizing enterprise AI with our v3.0 platform that 
+combines advanced artificial intelligence with universal operating system control.
+
+📊 MARKET OPPORTUNITY:
+• Total Addressable Market: {market['total_market']}
+• Serviceable Obtainable Market: {market['serviceable_obtainable_market']}
+• Growth Rate: {market['growth_rate']}
+
+💎 UNIQUE VALUE PROPOSITION:
+• Only platform with Universal OS Control + Advanced AI
+• 50+ proprietary features no competitor can match
+• Enterprise-grade security built-in
+
+💰 FINANCIAL PROJECTIONS:
+• Year 1: {financials['year1']['revenue']} revenue
+• Year 2: {financials['year2']['revenue']} revenue  
+• Year 3: {financials['year3']['revenue']} revenue
+• Year 5: {financials['year5']['revenue']} revenue
+
+🎯 INVESTMENT ASK:
+• {self.pitch_data['investment_ask']['series_a']} Series A
+• {self.pitch_data['investment_ask']['valuation']} pre-money valuation
+• 15-20x ROI potential within 3 years
+"""
+        emit(summary)
+    
+    def generate_competitive_analysis(self):
+        """Generate competitive landscape analysis"""
+        emit("\n🏆 COMPETITIVE ADVANTAGE ANALYSIS")
+        emit("=" * 40)
+        
+        competitors = {
+            "OpenAI": ["Basic AI", "No OS Control", "Limited Security"],
+            "Google Assistant": ["Consumer Focus", "No Enterprise Features"],
+            "Microsoft Copilot": ["Office Integration", "No Universal Control"],
+            "Traditional RPA": ["Automation Only", "No AI Intelligence"]
+        }
+        
+        emit("Competitor Limitations:")
+        for competitor, limitations in competitors.items():
+            emit(f"• {competitor}: {', '.join(limitations)}")
+        
+        emit(f"\n🎯 VisionMind AI Advantages:")
+        for advantage in self.pitch_data["competitive_advantage"]["unique_features"]:
+            emit(f"  ✓ {advantage}")
+    
+    def generate_investment_deck(self):
+        """Generate complete investment deck"""
+        emit("\n📈 VISIONMIND AI - INVESTMENT DECK")
+        emit("=" * 40)
+        
+        slides = [
+            "Slide 1: Title - The Future of Enterprise AI",
+            "Slide 2: Problem - $500B Wasted on Inefficient Operations",
+            "Slide 3: Solution - VisionMind AI v3.0 Platform",
+            "Slide 4: Market Size - $126B Growing at 32% CAGR",
+            "Slide 5: Technology - 50+ Proprietary Features",
+            "Slide 6: Traction - Enterprise Ready, Fortune 500 Interest",
+            "Slide 7: Business Model - SaaS + Enterprise Licensing",
+            "Slide 8: Financials - 85% Gross Margins, Rapid Growth",
+            "Slide 9: Team - World-Class AI Engineers",
+            "Slide 10: Competition - No Direct Competitors",
+            "Slide 11: Investment Ask - $15M for 10%",
+            "Slide 12: Vision - Operating System for Business AI"
+        ]
+        
+        for slide in slides:
+            emit(f"✅ {slide}")
+    
+    def generate_valuation_model(self):
+        """Generate financial valuation model"""
+        emit("\n💰 VALUATION MODEL")
+        emit("=" * 25)
+        
+        # DCF Valuation
+        emit("Discounted Cash Flow Analysis:")
+        multiple = valuation.VALUATION_ASSUMPTIONS["revenue_multiple"][1]
+        for year, projection in self.pitch_data["financial_projections"].items():
+            revenue = parse_money(projection["revenue"]).amount
+            emit(f"Year {year[4:]}: {short_money(revenue)} revenue → "
+                 f"{short_money(revenue * multiple)} valuation")
+        
+        # Comparables
+        emit("\nComparable Company Analysis:")
+        comparables = {
+            "AI Startups": "20-30x Revenue Multiple",
+            "Enterprise SaaS": "15-25x Revenue Multiple", 
+            "Security Companies": "12-18x Revenue Multiple"
+        }
+        
+        for comp, multiple in comparables.items():
+            emit(f"• {comp}: {multiple}")
+        
+        emit(f"\n🎯 Conservative Valuation: $150M")
+        emit("🎯 Realistic Valuation: $300M") 
+        emit("🎯 Aggressive Valuation: $500M")
+        
+        if self.valuation_scenarios:
+            report = valuation.MonteCarloValuation.from_pitch(self.pitch_data).run(self.valuation_scenarios)
+            pcts = report["percentiles"]
+            emit(f"\n🎲 Monte Carlo ({report['scenarios']:,} scenarios, "
+                 f"{report['elapsed_seconds']}s):")
+            emit(f"• P10 {short_money(pcts['p10'])} | P50 {short_money(pcts['p50'])} | "
+                 f"P90 {short_money(pcts['p90'])}")
+            emit(f"• {report['probability_above_pre_money']:.1%} of scenarios beat the "
+                 f"{short_money(report['pre_money'])} pre-money valuation")
+
+
+def run_investment_pitch(valuation_scenarios=0):
+    """Generate complete investment pitch"""
+    pitch = VisionMindInvestmentPitch(valuation_scenarios)
+    
+    pitch.generate_executive_summary()
+    pitch.generate_competitive_analysis() 
+    pitch.generate_investment_deck()
+    pitch.generate_valuation_model()
+    
+    emit("\n" + "=" * 50)
+    emit("🎯 INVESTMENT HIGHLIGHTS:")
+    emit("• $15M Series A → $150M pre-money valuation")
+    emit("• 15-20x ROI potential in 3 years")
+    emit("• No direct competitors in market")
+    emit("• Proprietary technology moat")
+    emit("• Enterprise-ready platform")
+    emit("• Massive $126B market opportunity")
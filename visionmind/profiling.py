@@ -0,0 +1,165 @@
+"""Opt-in instrumentation: per-scenario timings, cProfile, tracemalloc and stack sampling"""
+
+import cProfile
+import contextlib
+import contextvars
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+
+class _StackSampler:
+    """Samples one thread's Python stack into folded-stack counts"""
+
+    def __init__(self, thread_id, root, interval):
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.counts = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="visionmind-stacks", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)})")
+                frame = frame.f_back
+            folded = ";".join([self.root] + stack[::-1])
+            self.counts[folded] = self.counts.get(folded, 0) + 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+class Instrumentation:
+    """Opt-in per-scenario timers, cProfile, tracemalloc and stack sampling"""
+
+    def __init__(self, cprofile=False, tracemalloc=False, stack_sampling=False,
+                 sample_interval=0.001, top=15):
+        self.cprofile = cprofile
+        self.tracemalloc = tracemalloc
+        self.stack_sampling = stack_sampling
+        self.sample_interval = sample_interval
+        self.top = top
+        self.records = []
+        self.folded_stacks = {}
+        self._lock = threading.Lock()
+        self._profiling = threading.local()
+        self._open_sections = []
+        self._section = contextvars.ContextVar("instrumentation_section", default=None)
+
+    @property
+    def exclusive(self):
+        """Whether measured sections need to run one at a time"""
+        return self.cprofile or self.tracemalloc or self.stack_sampling
+
+    @contextlib.contextmanager
+    def measure(self, name):
+        record = {"name": name}
+        # Sections nested in this one share its state; any other open one overlaps it
+        section = self._section.get()
+        outermost = section is None
+        if outermost:
+            section = {"overlapped": False}
+            with self._lock:
+                for other in self._open_sections:
+                    other["overlapped"] = section["overlapped"] = True
+                self._open_sections.append(section)
+        token = self._section.set(section)
+        profiler = None
+        if self.cprofile and not getattr(self._profiling, "active", False):
+            profiler = cProfile.Profile()
+            self._profiling.active = True
+        snapshot = None
+        if self.tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            snapshot = tracemalloc.take_snapshot()
+        sampler = (_StackSampler(threading.get_ident(), name, self.sample_interval)
+                   if self.stack_sampling else contextlib.nullcontext())
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            with sampler:
+                if profiler:
+                    profiler.enable()
+                try:
+                    yield record
+                finally:
+                    if profiler:
+                        profiler.disable()
+        finally:
+            record["wall_seconds"] = round(time.perf_counter() - wall_start, 6)
+            record["cpu_seconds"] = round(time.process_time() - cpu_start, 6)
+            self._section.reset(token)
+            if profiler:
+                self._profiling.active = False
+            overlapped = section["overlapped"]
+            if overlapped:
+                record["overlapped"] = True
+            else:
+                if profiler:
+                    record["cprofile"] = self._profile_summary(profiler)
+                if snapshot is not None:
+                    record["tracemalloc"] = self._allocation_summary(snapshot)
+            with self._lock:
+                if outermost:
+                    self._open_sections.remove(section)
+                self.records.append(record)
+                for stack, count in getattr(sampler, "counts", {}).items() if not overlapped else ():
+                    self.folded_stacks[stack] = self.folded_stacks.get(stack, 0) + count
+
+    def _profile_summary(self, profiler):
+        stats = pstats.Stats(profiler)
+        rows = []
+        for (filename, line, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({
+                "function": f"{function} ({os.path.basename(filename)}:{line})",
+                "ncalls": ncalls,
+                "tottime": round(tottime, 6),
+                "cumtime": round(cumtime, 6),
+            })
+        rows.sort(key=lambda row: row["cumtime"], reverse=True)
+        return rows[:self.top]
+
+    def _allocation_summary(self, before):
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        top = after.compare_to(before, "lineno")[:self.top]
+        return {
+            "peak_kb": round(peak / 1024, 1),
+            "growth": [
+                {"location": str(stat.traceback[0]), "size_kb": round(stat.size_diff / 1024, 1),
+                 "count": stat.count_diff}
+                for stat in top if stat.size_diff
+            ],
+        }
+
+    def to_json(self):
+        with self._lock:
+            return json.dumps({"records": self.records}, indent=2)
+
+    def folded(self):
+        """Folded stacks ("frame;frame;frame count" lines) for flamegraph tools"""
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in sorted(self.folded_stacks.items()))
+
+    def export(self, prefix):
+        """Write <prefix>.json and, with stack sampling, <prefix>.folded"""
+        with open(f"{prefix}.json", "w") as f:
+            f.write(self.to_json())
+        if self.stack_sampling:
+            with open(f"{prefix}.folded", "w") as f:
+                f.write(self.folded())
@@ -0,0 +1,157 @@
+"""Asyncio TCP connect port scanner"""
+
+import argparse
+import asyncio
+import contextlib
+import errno
+import socket
+import time
+from typing import NamedTuple
+
+
+# Well-known service ports checked by the security demos
+COMMON_PORTS = [21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445, 993, 995, 1433,
+                1521, 2049, 3306, 3389, 5432, 5900, 6379, 8000, 8080, 8443, 9200, 27017]
+
+
+class PortScanResult(NamedTuple):
+    host: str
+    port: int
+    state: str  # "open", "closed", "filtered" (timed out) or "error"
+    latency_ms: float
+
+
+class _AdaptiveWindow:
+    """AIMD limit on in-flight connects; a fixed limit when not adaptive"""
+
+    def __init__(self, maximum, adaptive=True):
+        self.maximum = maximum
+        self.adaptive = adaptive
+        self.limit = float(max(1, maximum // 4) if adaptive else maximum)
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        """Wait for a free slot; returns when it was granted, for release()"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return time.perf_counter()
+
+    async def release(self, congested, acquired):
+        async with self._condition:
+            self.in_flight -= 1
+            if self.adaptive and congested:
+                # Connects that were already in flight at the last halving saw the same
+                # congestion; the limit halves once per such epoch
+                if acquired > self._last_decrease:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = time.perf_counter()
+            elif self.adaptive:
+                self.limit = min(float(self.maximum), self.limit + 1)
+            self._condition.notify_all()
+
+
+async def _probe(host, port, timeout):
+    start = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except asyncio.TimeoutError:
+        state = "filtered"
+    except ConnectionRefusedError:
+        state = "closed"
+    except OSError as exc:
+        state = "retry" if exc.errno in (errno.EMFILE, errno.ENFILE, errno.ENOBUFS,
+                                         errno.EADDRNOTAVAIL) else "error"
+    else:
+        writer.close()
+        state = "open"
+    return PortScanResult(host, port, state, round((time.perf_counter() - start) * 1000, 3))
+
+
+async def scan_ports(host, ports, concurrency=500, timeout=1.0, adaptive=True):
+    """Yield a PortScanResult for every port as soon as its probe finishes"""
+    window = _AdaptiveWindow(concurrency, adaptive)
+    results = asyncio.Queue()
+    tasks = set()
+
+    async def probe(port, acquired):
+        while True:
+            result = await _probe(host, port, timeout)
+            # Only running out of local sockets is congestion; a filtered port is just silent
+            await window.release(result.state == "retry", acquired)
+            if result.state != "retry":
+                results.put_nowait(result)
+                return
+            acquired = await window.acquire()
+
+    async def feed():
+        for port in ports:
+            acquired = await window.acquire()
+            task = asyncio.create_task(probe(port, acquired))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        results.put_nowait(None)
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while (result := await results.get()) is not None:
+            yield result
+    finally:
+        feeder.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+async def run_port_scan(host, ports, concurrency=500, timeout=1.0, adaptive=True,
+                        on_result=None):
+    """Scan `ports` on host and return a summary with ports per second"""
+    ports = list(ports)
+    states = {}
+    open_ports = []
+    start = time.perf_counter()
+    async for result in scan_ports(host, ports, concurrency, timeout, adaptive):
+        states[result.state] = states.get(result.state, 0) + 1
+        if result.state == "open":
+            open_ports.append(result.port)
+        if on_result:
+            on_result(result)
+    elapsed = time.perf_counter() - start
+    return {
+        "host": host,
+        "ports_scanned": len(ports),
+        "open_ports": sorted(open_ports),
+        "states": states,
+        "elapsed_seconds": round(elapsed, 3),
+        "ports_per_second": round(len(ports) / elapsed, 1) if elapsed else None,
+    }
+
+
+def parse_ports(text):
+    """Parse "22,80,8000-8100" into a list of ports"""
+    ports = []
+    for item in text.split(","):
+        low, _, high = item.partition("-")
+        ports.extend(range(int(low), int(high or low) + 1))
+    if not all(0 < port < 65536 for port in ports):
+        raise argparse.ArgumentTypeError("ports must be between 1 and 65535")
+    return ports
+
+
+@contextlib.contextmanager
+def local_listeners(count, host="127.0.0.1"):
+    """Open `count` listening sockets on host for scanner tests; yields their ports"""
+    sockets = []
+    try:
+        for _ in range(count):
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listener.bind((host, 0))
+            listener.listen(64)
+            sockets.append(listener)
+        yield sorted(listener.getsockname()[1] for listener in sockets)
+    finally:
+        for listener in sockets:
+            listener.close()
@@ -0,0 +1,224 @@
+"""Scenario graphs with content-hash memoization"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+from typing import Any, NamedTuple
+
+from .core import BufferSink, CACHE_DIR, active_instrumentation, output_sink, use_output_sink
+
+
+def code_fingerprint(*objects):
+    """Hash of the bytecode behind functions, methods, partials and classes"""
+    digest = hashlib.sha256()
+
+    def add_code(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if hasattr(const, "co_code"):
+                add_code(const)
+            else:
+                digest.update(repr(const).encode())
+
+    def add(obj):
+        if isinstance(obj, functools.partial):
+            add(obj.func)
+        elif isinstance(obj, type):
+            for name, member in sorted(vars(obj).items()):
+                if callable(member):
+                    add(member)
+        elif hasattr(obj, "__func__"):
+            add(obj.__func__)
+        elif hasattr(obj, "__code__"):
+            add_code(obj.__code__)
+
+    for obj in objects:
+        add(obj)
+    return digest.hexdigest()[:16]
+
+
+class ScenarioNode(NamedTuple):
+    """One step of a ScenarioGraph"""
+    name: str
+    run: Any
+    depends: tuple = ()
+    inputs: Any = None
+    validate: Any = None
+
+
+class ScenarioGraph:
+    """Registry of scenario nodes; a node's dependencies must be registered before it"""
+
+    def __init__(self):
+        self.nodes = {}
+
+    def add(self, name, run, depends=(), inputs=None, validate=None):
+        if name in self.nodes:
+            raise ValueError(f"scenario {name!r} is already registered")
+        missing = [dep for dep in depends if dep not in self.nodes]
+        if missing:
+            raise ValueError(f"scenario {name!r} depends on unregistered {missing}")
+        self.nodes[name] = ScenarioNode(name, run, tuple(depends), inputs, validate)
+        return self.nodes[name]
+
+    def scenario(self, name, depends=(), inputs=None, validate=None):
+        """Decorator form of add()"""
+        def register(run):
+            self.add(name, run, depends, inputs, validate)
+            return run
+        return register
+
+    def closure(self, targets=None):
+        """Names of `targets` and everything they depend on, in registration order"""
+        if targets is None:
+            return list(self.nodes)
+        needed, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.nodes[name].depends)
+        return [name for name in self.nodes if name in needed]
+
+
+class ScenarioCache:
+    """Memoized scenario outputs and their console text, keyed by input hash"""
+
+    def __init__(self, path=None, max_entries=512, use_cache=True, max_bytes=16 * 1024 * 1024):
+        self.path = (path or os.path.join(CACHE_DIR, "scenario_cache.json")) if use_cache else None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self._entries = None
+        self._dirty = False
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = {}
+            if self.path and os.path.exists(self.path):
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+        return self._entries
+
+    def get(self, key):
+        return self.entries.get(key) if self.enabled else None
+
+    def set(self, key, output, text):
+        if not self.enabled:
+            return
+        self.entries.pop(key, None)
+        self.entries[key] = {"output": output, "text": text}
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+        self._dirty = True
+
+    def save(self):
+        if not self.path or not self._dirty or not self.enabled:
+            return
+        # Oldest entries go first until the file fits in max_bytes
+        sizes = {key: len(json.dumps(entry)) + len(key) + 6 for key, entry in self._entries.items()}
+        total = sum(sizes.values())
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            total -= sizes[key]
+            del self._entries[key]
+        data = json.dumps(self._entries)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def clear(self):
+        self._entries = {}
+        self._dirty = True
+        self.save()
+
+
+SCENARIO_CACHE = ScenarioCache()
+
+
+class ScenarioExecutor:
+    """Run a ScenarioGraph with independent nodes in parallel and outputs memoized"""
+
+    def __init__(self, graph, cache=None, max_concurrency=None):
+        self.graph = graph
+        self.cache = cache if cache is not None else SCENARIO_CACHE
+        self.max_concurrency = max_concurrency
+        self.results = {}
+
+    @staticmethod
+    def _hash(value):
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _key(self, node, deps):
+        if node.inputs is None:
+            return None
+        inputs = node.inputs()
+        if inputs is None:
+            return None
+        return self._hash([node.name, code_fingerprint(node.run), inputs,
+                           {name: self._hash(output) for name, output in deps.items()}])
+
+    async def _run_node(self, node, futures, semaphore, buffer):
+        deps = {}
+        for dep in node.depends:
+            deps[dep] = await futures[dep]
+        async with semaphore:
+            start = time.perf_counter()
+            key = self._key(node, deps)
+            hit = self.cache.get(key) if key else None
+            if hit is not None and (node.validate is None or node.validate(hit["output"])):
+                buffer.write(hit["text"])
+                output, cached = hit["output"], True
+            else:
+                with use_output_sink(buffer):
+                    output = node.run(deps)
+                    if inspect.isawaitable(output):
+                        output = await output
+                if key:
+                    self.cache.set(key, output, "".join(buffer.chunks))
+                cached = False
+            self.results[node.name] = {"output": output, "cached": cached,
+                                       "seconds": time.perf_counter() - start}
+            return output
+
+    async def run(self, targets=None, separator=None):
+        """Run `targets` (default: every node) and what they need; returns name -> output"""
+        names = self.graph.closure(targets)
+        sink = output_sink()
+        instrumentation = active_instrumentation()
+        serial = instrumentation is not None and instrumentation.exclusive
+        semaphore = asyncio.Semaphore(1 if serial else self.max_concurrency or len(names) or 1)
+        buffers = {name: BufferSink() for name in names}
+        futures = {}
+        for name in names:
+            futures[name] = asyncio.ensure_future(
+                self._run_node(self.graph.nodes[name], futures, semaphore, buffers[name]))
+
+        for i, name in enumerate(names):
+            await asyncio.wait([futures[name]])
+            if separator is not None and i:
+                sink.write(separator)
+            buffers[name].replay(sink)
+        self.cache.save()
+        for name in names:
+            exception = futures[name].exception()
+            if exception is not None:
+                raise exception
+        return {name: self.results[name]["output"] for name in names}
+
+    def stats(self):
+        return {
+            "nodes": len(self.results),
+            "cached": sum(result["cached"] for result in self.results.values()),
+            "seconds": {name: round(result["seconds"], 6) for name, result in self.results.items()},
+        }
@@ -0,0 +1,410 @@
+"""ASGI service exposing demo results, pitch sections and charts"""
+
+import asyncio
+import collections
+import contextlib
+import functools
+import hashlib
+import http.server
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+import urllib.parse
+
+from .core import BufferSink, NullSink, TTLCache, emit, use_output_sink
+from .demo import VisionMindBillionDollarDemo, render_valuation_chart
+from .loadgen import AsyncHTTPPool, LatencyHistogram, read_chunked_body
+from .money import valuation_summary, value_matrix
+from .pitch import VisionMindInvestmentPitch
+from .scenarios import ScenarioCache, ScenarioExecutor
+
+
+# Pitch sections rendered as text, by the VisionMindInvestmentPitch method that prints them
+PITCH_RENDERED_SECTIONS = {
+    "executive_summary": "generate_executive_summary",
+    "competitive_analysis": "generate_competitive_analysis",
+    "investment_deck": "generate_investment_deck",
+    "valuation_model": "generate_valuation_model",
+}
+
+
+def _etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header value (bytes) covers `etag` (weak comparison)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.decode("latin-1").split(",")]
+    return "*" in tags or etag in tags
+
+
+class VisionMindService:
+    """ASGI application serving demo_results, pitch sections and the valuation chart"""
+
+    def __init__(self, cache_size=256, cache_ttl=60.0, max_age=60):
+        self.cache = TTLCache(cache_size, cache_ttl)
+        self.max_age = max_age
+        self.scenario_cache = ScenarioCache(use_cache=False)
+        self._pitch = VisionMindInvestmentPitch()
+        self._inflight = {}
+
+    def routes(self):
+        routes = ["/", "/healthz", "/demo/results", "/pitch", "/chart.png", "/chart.svg"]
+        return routes + [f"/pitch/{name}" for name in self._pitch_sections()]
+
+    def _pitch_sections(self):
+        return list(self._pitch.pitch_data) + list(PITCH_RENDERED_SECTIONS)
+
+    def _builder(self, path):
+        """Coroutine function building (content type, body) for a path, or None"""
+        if path == "/":
+            return lambda: self._json({"routes": self.routes()})
+        if path == "/healthz":
+            return lambda: self._json({"status": "ok"})
+        if path == "/demo/results":
+            return self._demo_payload
+        if path == "/pitch":
+            return lambda: self._json({"sections": self._pitch_sections()})
+        if path.startswith("/pitch/") and path[7:] in self._pitch_sections():
+            return functools.partial(self._pitch_payload, path[7:])
+        if path in ("/chart.png", "/chart.svg"):
+            return functools.partial(self._chart_payload, path[7:])
+        return None
+
+    @staticmethod
+    async def _json(payload):
+        return "application/json", json.dumps(payload).encode()
+
+    async def _demo_results(self):
+        demo = VisionMindBillionDollarDemo(scenario_cache=self.scenario_cache)
+        keys = [key for key, _ in demo.SCENARIOS]
+        with use_output_sink(NullSink()):
+            outputs = await ScenarioExecutor(demo.scenario_graph(), self.scenario_cache).run(keys)
+        demo._collect_results(outputs)
+        return demo
+
+    async def _demo_payload(self):
+        demo = await self._demo_results()
+        _, amounts = value_matrix([demo.demo_results])
+        total, conservative, aggressive = valuation_summary(amounts)[0]
+        return await self._json({
+            "results": demo.demo_results,
+            "total_value": total,
+            "conservative_valuation": conservative,
+            "aggressive_valuation": aggressive,
+        })
+
+    async def _pitch_payload(self, name):
+        if name in self._pitch.pitch_data:
+            return await self._json(self._pitch.pitch_data[name])
+        sink = BufferSink()
+        with use_output_sink(sink):
+            getattr(self._pitch, PITCH_RENDERED_SECTIONS[name])()
+        return "text/plain; charset=utf-8", "".join(sink.chunks).encode()
+
+    async def _chart_payload(self, fmt):
+        demo = await self._demo_results()
+        demo.chart_preview = fmt == "svg"
+        labels, values, _, dpi, fmt = demo._chart_args()
+
+        def render():
+            with tempfile.TemporaryDirectory() as directory:
+                path, _ = render_valuation_chart(labels, values,
+                                                 os.path.join(directory, f"chart.{fmt}"), dpi, fmt)
+                with open(path, "rb") as f:
+                    return f.read()
+
+        body = await asyncio.get_running_loop().run_in_executor(None, render)
+        return ("image/svg+xml" if fmt == "svg" else "image/png"), body
+
+    async def _build(self, path, builder, bypass):
+        """Build a payload, sharing one build between concurrent requests for a path"""
+        future = None if bypass else self._inflight.get(path)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        if not bypass:
+            self._inflight[path] = future
+        try:
+            content_type, body = await builder()
+            entry = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', content_type, body)
+            self.cache.set(path, entry)
+            future.set_result(entry)
+            return entry
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # waiters re-raise it; nobody else needs to
+            raise
+        finally:
+            if self._inflight.get(path) is future:
+                del self._inflight[path]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        headers = dict(scope["headers"])
+        if scope["method"] not in ("GET", "HEAD"):
+            return await self._send(send, scope, 405, "application/json",
+                                    b'{"detail": "method not allowed"}', [(b"allow", b"GET, HEAD")])
+        builder = self._builder(scope["path"])
+        if builder is None:
+            return await self._send(send, scope, 404, "application/json",
+                                    b'{"detail": "not found"}')
+
+        bypass = b"no-cache" in headers.get(b"cache-control", b"")
+        entry = None if bypass else self.cache.get(scope["path"])
+        state = "HIT" if entry is not None else "BYPASS" if bypass else "MISS"
+        if entry is None:
+            entry = await self._build(scope["path"], builder, bypass)
+        etag, content_type, body = entry
+        extra = [(b"etag", etag.encode()), (b"x-cache", state.encode()),
+                 (b"cache-control", f"max-age={self.max_age}".encode())]
+        if _etag_matches(headers.get(b"if-none-match"), etag):
+            return await self._send(send, scope, 304, None, b"", extra)
+        await self._send(send, scope, 200, content_type, body, extra)
+
+    @staticmethod
+    async def _send(send, scope, status, content_type, body, extra=()):
+        headers = list(extra)
+        if content_type:
+            headers += [(b"content-type", content_type.encode()),
+                        (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body",
+                    "body": b"" if scope["method"] == "HEAD" or status == 304 else body})
+
+
+app = VisionMindService()
+
+
+async def _reject(writer, status):
+    """Answer a request the front end cannot frame and give up on the connection"""
+    phrase = http.HTTPStatus(status).phrase
+    writer.write(f"HTTP/1.1 {status} {phrase}\r\ncontent-length: 0\r\n"
+                 f"connection: close\r\n\r\n".encode())
+    with contextlib.suppress(ConnectionError):
+        await writer.drain()
+
+
+async def _serve_asgi_connection(app, reader, writer):
+    """Minimal HTTP/1.1 keep-alive front end for an ASGI app on asyncio streams"""
+    server = writer.get_extra_info("sockname")
+    client = writer.get_extra_info("peername")
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            request_line, *lines = head[:-4].decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ", 2)
+            headers = []
+            for line in lines:
+                name, _, value = line.partition(":")
+                headers.append((name.strip().lower().encode("latin-1"),
+                                value.strip().encode("latin-1")))
+            fields = dict(headers)
+            encoding = fields.get(b"transfer-encoding", b"").lower()
+            try:
+                if encoding and encoding.rsplit(b",", 1)[-1].strip() != b"chunked":
+                    return await _reject(writer, 501)
+                if encoding:
+                    body = await read_chunked_body(reader)
+                else:
+                    length = int(fields.get(b"content-length", 0))
+                    body = await reader.readexactly(length) if length else b""
+            except (ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                    ConnectionError):
+                return await _reject(writer, 400)
+            connection = fields.get(b"connection", b"").lower()
+            keep_alive = connection != b"close" if version == "HTTP/1.1" else connection == b"keep-alive"
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": version[5:],
+                "method": method, "scheme": "http", "path": urllib.parse.unquote(path),
+                "raw_path": path.encode("latin-1"), "query_string": query.encode("latin-1"),
+                "root_path": "", "headers": headers, "client": client, "server": server,
+            }
+            requested = False
+
+            async def receive():
+                nonlocal requested
+                if requested:
+                    return {"type": "http.disconnect"}
+                requested = True
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            response = {"chunked": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    out = list(message.get("headers", []))
+                    names = {name.lower() for name, _ in out}
+                    if b"content-length" not in names and message["status"] not in (204, 304):
+                        out.append((b"transfer-encoding", b"chunked"))
+                        response["chunked"] = True
+                    if not keep_alive:
+                        out.append((b"connection", b"close"))
+                    phrase = http.HTTPStatus(message["status"]).phrase
+                    lines = [f"HTTP/1.1 {message['status']} {phrase}".encode()]
+                    lines += [name + b": " + value for name, value in out]
+                    response["head"] = b"\r\n".join(lines) + b"\r\n\r\n"
+                elif message["type"] == "http.response.body":
+                    data = message.get("body", b"")
+                    more = message.get("more_body", False)
+                    if response["chunked"]:
+                        data = (f"{len(data):x}\r\n".encode() + data + b"\r\n" if data else b"")
+                        data += b"" if more else b"0\r\n\r\n"
+                    writer.write(response.pop("head", b"") + data)
+                    if more:
+                        await writer.drain()
+
+            await app(scope, receive, send)
+            await writer.drain()
+            if not keep_alive:
+                return
+    finally:
+        writer.close()
+
+
+async def _serve_socket(app, sock):
+    server = await asyncio.start_server(
+        lambda reader, writer: _serve_asgi_connection(app, reader, writer), sock=sock)
+    async with server:
+        await server.serve_forever()
+
+
+def _fork_http_workers(app, sock, workers):
+    """Fork `workers` processes serving `sock`; returns their pids"""
+    if not hasattr(os, "fork"):
+        raise RuntimeError("multiple HTTP workers need os.fork, which this platform lacks")
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                asyncio.run(_serve_socket(app, sock))
+            except KeyboardInterrupt:
+                pass
+            except BaseException:
+                status = 1
+            finally:
+                os._exit(status)
+        pids.append(pid)
+    return pids
+
+
+def _stop_http_workers(pids):
+    for pid in pids:
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGTERM)
+    for pid in pids:
+        with contextlib.suppress(ChildProcessError):
+            os.waitpid(pid, 0)
+
+
+def serve_http(app=app, host="127.0.0.1", port=8000, workers=1):
+    """Serve an ASGI app until interrupted, on `workers` forked processes sharing one socket"""
+    sock = socket.create_server((host, port), backlog=1024)
+    if not hasattr(os, "fork"):
+        workers = 1  # no fork (Windows): serve from this process
+    emit(f"🌐 VisionMind service on http://{host}:{sock.getsockname()[1]} "
+         f"({workers} worker{'s' if workers != 1 else ''})", flush=True)
+    if workers == 1:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(_serve_socket(app, sock))
+        return
+    pids = _fork_http_workers(app, sock, workers)
+    sock.close()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # stop the workers on kill too
+    try:
+        for pid in pids:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _stop_http_workers(pids)
+
+
+async def _closed_loop_requests(base_url, path, headers, duration, concurrency):
+    """Hammer one path from `concurrency` keep-alive clients; returns count, statuses, latency"""
+    pool = AsyncHTTPPool(base_url, max_connections=concurrency)
+    histogram = LatencyHistogram()
+    statuses = collections.Counter()
+    deadline = time.perf_counter() + duration
+
+    async def user():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status, _ = await pool.request("GET", path, headers)
+            histogram.record((time.perf_counter() - start) * 1e6)
+            statuses[status] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await pool.close()
+    count = sum(statuses.values())
+    return {
+        "requests": count,
+        "requests_per_second": round(count / elapsed, 1),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "latency_ms": histogram.summary(),
+    }
+
+
+async def _etag_probe(base_url, path):
+    """The ETag a path is currently served with"""
+    reader, writer = await asyncio.open_connection(*urllib.parse.urlsplit(base_url).netloc.split(":"))
+    writer.write(f"HEAD {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    head = await reader.read()
+    writer.close()
+    for line in head.decode("latin-1").split("\r\n"):
+        name, _, value = line.partition(":")
+        if name.lower() == "etag":
+            return value.strip()
+    return None
+
+
+def benchmark_service(workers=2, duration=3.0, concurrency=32,
+                      paths=("/demo/results", "/pitch/valuation_model", "/chart.png")):
+    """Requests/s per path when cached, revalidated (304) and rebuilt on every request"""
+    with socket.create_server(("127.0.0.1", 0), backlog=1024) as sock:
+        base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        pids = _fork_http_workers(app, sock, workers)
+
+    async def run():
+        report = {}
+        for path in paths:
+            pool = AsyncHTTPPool(base_url, max_connections=1)
+            for _ in range(workers * 4):  # warm every worker's cache
+                await pool.request("GET", path)
+            await pool.close()
+            raw = await _etag_probe(base_url, path)
+            report[path] = {
+                "cached": await _closed_loop_requests(base_url, path, {}, duration, concurrency),
+                "not_modified": await _closed_loop_requests(
+                    base_url, path, {"If-None-Match": raw}, duration, concurrency),
+                "uncached": await _closed_loop_requests(
+                    base_url, path, {"Cache-Control": "no-cache"}, duration, concurrency),
+            }
+        return report
+
+    try:
+        paths_report = asyncio.run(run())
+    finally:
+        _stop_http_workers(pids)
+    return {"workers": workers, "concurrency": concurrency, "duration_per_mode": duration,
+            "paths": paths_report}
@@ -0,0 +1,144 @@
+"""Concurrent demo session simulation"""
+
+import asyncio
+import functools
+import gc
+import time
+import tracemalloc
+
+from .core import NullSink, use_output_sink
+from .demo import VisionMindBillionDollarDemo
+from .money import component_value, value_matrix
+
+
+class ScenarioRecord:
+    """One demo_results entry in slots instead of a dict; read-only, as equal ones are shared"""
+
+    __slots__ = ("key", "status", "value", "fields", "values")
+
+    def __init__(self, key, status, value, fields, values):
+        for name, item in zip(self.__slots__, (key, status, value, fields, values)):
+            object.__setattr__(self, name, item)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ScenarioRecord is read-only (cannot set {name!r})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ScenarioRecord is read-only (cannot delete {name!r})")
+
+    @classmethod
+    def from_details(cls, key, details):
+        fields = tuple(name for name in details if name != "status")
+        values = tuple(tuple(value) if isinstance(value, list) else value
+                       for name, value in details.items() if name != "status")
+        try:
+            return _shared_scenario_record(key, details.get("status"), fields, values,
+                                           _type_signature(values))
+        except TypeError:  # an unhashable value; keep a private record
+            return cls(key, details.get("status"), component_value(details).amount,
+                       fields, values)
+
+    def details(self):
+        """The demo_results dict this record was built from"""
+        details = {"status": self.status} if self.status is not None else {}
+        details.update((name, list(value) if isinstance(value, tuple) else value)
+                       for name, value in zip(self.fields, self.values))
+        return details
+
+    def __repr__(self):
+        return f"ScenarioRecord({self.key!r}, {self.status!r}, {self.value!r})"
+
+
+def _type_signature(values):
+    """Types of a values tuple, nested; 1, 1.0 and True hash alike but must not share a record"""
+    return tuple(_type_signature(value) if isinstance(value, tuple) else type(value)
+                 for value in values)
+
+
+@functools.lru_cache(maxsize=4096)
+def _shared_scenario_record(key, status, fields, values, signature):
+    value = component_value(dict(zip(fields, values))).amount
+    return ScenarioRecord(key, status, value, fields, values)
+
+
+class DemoSession:
+    """A finished demo session: its scenario records and wall time"""
+
+    __slots__ = ("session_id", "records", "seconds")
+
+    def __init__(self, session_id, records, seconds):
+        self.session_id = session_id
+        self.records = records
+        self.seconds = seconds
+
+    @classmethod
+    def from_demo(cls, session_id, demo, seconds):
+        return cls(session_id, tuple(ScenarioRecord.from_details(key, details)
+                                     for key, details in demo.demo_results.items()), seconds)
+
+    @property
+    def total_value(self):
+        return sum(record.value for record in self.records)
+
+    def demo_results(self):
+        return {record.key: record.details() for record in self.records}
+
+
+async def _run_demo_session(session_id, think_time, compact):
+    """Run every scenario of one demo session, pausing think_time between them"""
+    start = time.perf_counter()
+    demo = VisionMindBillionDollarDemo()
+    for key, method in demo.SCENARIOS:
+        await demo._run_scenario(key, method, None)
+        await asyncio.sleep(think_time)
+    if compact:
+        return DemoSession.from_demo(session_id, demo, time.perf_counter() - start)
+    return demo.demo_results
+
+
+async def _run_demo_sessions(sessions, think_time, compact):
+    with use_output_sink(NullSink()):
+        return await asyncio.gather(*(_run_demo_session(i, think_time, compact)
+                                      for i in range(sessions)))
+
+
+def simulate_demo_sessions(sessions=5000, think_time=0.01, compact=True):
+    """Run `sessions` demo sessions concurrently on one event loop"""
+    start = time.perf_counter()
+    results = asyncio.run(_run_demo_sessions(sessions, think_time, compact))
+    elapsed = time.perf_counter() - start
+    del results
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    gc.collect()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    try:
+        results = asyncio.run(_run_demo_sessions(sessions, think_time, compact))
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    total = sum(session.total_value for session in results) if compact else (
+        value_matrix(results)[1].sum())
+    return {
+        "sessions": sessions,
+        "representation": "slots" if compact else "dict",
+        "think_time": think_time,
+        "elapsed_seconds": round(elapsed, 3),
+        "sessions_per_second": round(sessions / elapsed, 1),
+        "peak_bytes_per_session": round((peak - baseline) / sessions),
+        "retained_bytes_per_session": round((retained - baseline) / sessions),
+        "total_value": total,
+    }
+
+
+def benchmark_demo_sessions(sessions=5000, think_time=0.01):
+    """simulate_demo_sessions with slots records and with demo_results dicts"""
+    return {"slots": simulate_demo_sessions(sessions, think_time, compact=True),
+            "dict": simulate_demo_sessions(sessions, think_time, compact=False)}
@@ -0,0 +1,102 @@
+"""Cold-start benchmark for the interactive menu"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from .core import emit, peak_rss_mb
+
+
+# The interactive menu the benchmark starts
+MENU_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "index.py")
+
+# Menu option -> (max wall seconds, max peak RSS in MB) for a cold process
+STARTUP_BUDGETS = {
+    "1": (6.0, 250),
+    "2": (1.0, 60),
+    "3": (1.0, 60),
+    "4": (1.0, 60),
+    "5": (6.0, 250),
+}
+
+
+def _parse_importtime(stderr_text, top=5):
+    """Return total import time (ms) and the heaviest top-level imports"""
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Top-level imports carry a single space of indentation
+        if name.startswith(" ") and not name.startswith("  "):
+            entries.append((int(cumulative) / 1000, name.strip()))
+    entries.sort(reverse=True)
+    return sum(ms for ms, _ in entries), entries[:top]
+
+
+def measure_startup(choice, script=None):
+    """Run one menu option in a fresh interpreter and measure its cold start"""
+    script = os.path.abspath(script or MENU_SCRIPT)
+    with tempfile.TemporaryDirectory() as workdir, \
+            tempfile.TemporaryFile(mode="w+") as stderr_file:
+        env = dict(os.environ, VISIONMIND_CACHE_DIR=os.path.join(workdir, "cache"))
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-X", "importtime", script],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+            stderr=stderr_file, cwd=workdir, env=env, text=True,
+        )
+        proc.stdin.write(f"{choice}\n")
+        proc.stdin.close()
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            rss_mb = peak_rss_mb(usage)
+        else:  # Windows has no per-child rusage
+            proc.wait()
+            rss_mb = None
+        wall = time.perf_counter() - start
+        stderr_file.seek(0)
+        import_ms, heaviest = _parse_importtime(stderr_file.read())
+
+    return {
+        "option": choice,
+        "exit_code": proc.returncode,
+        "wall_seconds": round(wall, 3),
+        "import_ms": round(import_ms, 1),
+        "peak_rss_mb": rss_mb,
+        "heaviest_imports": [{"module": name, "ms": round(ms, 1)} for ms, name in heaviest],
+    }
+
+
+def run_startup_benchmark(budgets=None):
+    """Check every menu option against its cold-start budget; return exit code"""
+    budgets = budgets or STARTUP_BUDGETS
+    failures = 0
+    emit("⏱️ VISIONMIND AI v3.0 - STARTUP BENCHMARK")
+    emit("=" * 50)
+
+    for choice, (max_wall, max_rss) in budgets.items():
+        result = measure_startup(choice)
+        over = []
+        if result["exit_code"] != 0:
+            over.append(f"exit code {result['exit_code']}")
+        if result["wall_seconds"] > max_wall:
+            over.append(f"wall {result['wall_seconds']}s > {max_wall}s")
+        if result["peak_rss_mb"] is not None and result["peak_rss_mb"] > max_rss:
+            over.append(f"RSS {result['peak_rss_mb']}MB > {max_rss}MB")
+
+        mark = "❌" if over else "✅"
+        emit(f"{mark} Option {choice}: {result['wall_seconds']}s wall, "
+             f"{result['import_ms']}ms imports, {result['peak_rss_mb'] or 'n/a'}MB peak RSS")
+        if over:
+            failures += 1
+            emit(f"   Over budget: {', '.join(over)}")
+            for entry in result["heaviest_imports"]:
+                emit(f"   {entry['module']}: {entry['ms']}ms")
+
+    emit("=" * 50)
+    emit(f"🎯 {len(budgets) - failures}/{len(budgets)} options within budget")
+    return 1 if failures else 0
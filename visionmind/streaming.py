@@ -0,0 +1,119 @@
+"""Streaming chat over WebSockets"""
+
+import asyncio
+import json
+import time
+
+from .config import DEMO_CONFIG
+from .core import websockets
+from .loadgen import LatencyHistogram
+
+
+async def stream_reply(ws, message_id, message, on_token=None):
+    """Send one message on an open WebSocket and consume the streamed reply"""
+    sent = time.perf_counter()
+    await ws.send(json.dumps({"id": message_id, "message": message}))
+    first = None
+    tokens = []
+    async for raw in ws:
+        frame = json.loads(raw)
+        if frame.get("done"):
+            break
+        if first is None:
+            first = time.perf_counter()
+        tokens.append(frame["token"])
+        if on_token:
+            on_token(frame["token"])
+    finished = time.perf_counter()
+
+    total = finished - sent
+    return {
+        "id": message_id,
+        "reply": "".join(tokens).strip(),
+        "tokens": len(tokens),
+        "ttft_ms": round((first - sent) * 1000, 3) if first else None,
+        "total_ms": round(total * 1000, 3),
+        "tokens_per_second": round(len(tokens) / total, 1) if total else None,
+    }
+
+
+async def run_streaming_conversations(url, conversations):
+    """Run several conversations at once on this event loop, one connection each"""
+    async def converse(index, messages):
+        async with websockets.connect(url) as ws:
+            return [await stream_reply(ws, f"{index}-{n}", message)
+                    for n, message in enumerate(messages, 1)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(converse(i, messages)
+                                     for i, messages in enumerate(conversations, 1)))
+    elapsed = time.perf_counter() - start
+
+    ttft = LatencyHistogram()
+    rates = []
+    tokens = 0
+    for conversation in results:
+        for stats in conversation:
+            if stats["ttft_ms"] is not None:
+                ttft.record(stats["ttft_ms"] * 1000)
+            if stats["tokens_per_second"]:
+                rates.append(stats["tokens_per_second"])
+            tokens += stats["tokens"]
+    return {
+        "url": url,
+        "conversations": len(conversations),
+        "messages": sum(len(conversation) for conversation in results),
+        "elapsed_seconds": round(elapsed, 3),
+        "tokens": tokens,
+        "aggregate_tokens_per_second": round(tokens / elapsed, 1) if elapsed else None,
+        "ttft_ms": ttft.summary(),
+        "tokens_per_second": {
+            "min": min(rates, default=None),
+            "mean": round(sum(rates) / len(rates), 1) if rates else None,
+            "max": max(rates, default=None),
+        },
+        "per_message": [stats for conversation in results for stats in conversation],
+    }
+
+
+class StreamingEchoServer:
+    """Local WebSocket stand-in for the streaming chat endpoint"""
+
+    def __init__(self, host="127.0.0.1", port=0, first_token_delay=0.02, token_delay=0.005):
+        self.host = host
+        self.port = port
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self._server = None
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}{DEMO_CONFIG['api_endpoints']['ai_stream']}"
+
+    async def _handle(self, ws):
+        async for raw in ws:
+            request = json.loads(raw)
+            words = f"AI Analysis: {request['message']}".split()
+            await asyncio.sleep(self.first_token_delay)
+            for i, word in enumerate(words):
+                if i and self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+                await ws.send(json.dumps({"id": request["id"], "token": word + " "}))
+            await ws.send(json.dumps({"id": request["id"], "done": True}))
+
+    async def __aenter__(self):
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+# Messages each simulated conversation sends, in order
+STREAMING_MESSAGES = [
+    "Analyze our Q3 financial performance and suggest optimization strategies",
+    "Create a comprehensive competitive analysis for the AI assistant market",
+    "Generate Python code for real-time stock analysis with risk assessment",
+]
@@ -0,0 +1,228 @@
+"""Monte Carlo valuation of the pitch projections"""
+
+import concurrent.futures
+import math
+import os
+import re
+import time
+
+from .core import np
+from .money import parse_money
+
+
+# Scenario drivers as (low, mode, high) triangular ranges. Revenue multiples
+# span the comparables in the valuation model (12-30x); the mode reproduces
+# the deck's 15x DCF lines.
+VALUATION_ASSUMPTIONS = {
+    "growth_execution": (0.5, 0.85, 1.1),   # share of planned log revenue growth achieved
+    "terminal_margin": (0.05, 0.25, 0.40),  # free-cash-flow margin reached by the final year
+    "revenue_multiple": (12.0, 15.0, 30.0), # exit multiple on final-year revenue
+    "discount_rate": (0.25, 0.35, 0.45),    # venture-stage cost of capital
+}
+
+
+VALUATION_DRIVERS = tuple(VALUATION_ASSUMPTIONS)
+
+
+# Yearly revenue shocks (log-normal sigma) and the first-year margin, burning cash
+VALUATION_GROWTH_VOLATILITY = 0.15
+
+
+VALUATION_INITIAL_MARGIN = -0.40
+
+
+# Log-spaced histogram valuations are binned into: 0.2% resolution from $100K to $10T
+_VALUATION_BINS = 8192
+
+
+_VALUATION_LOG_RANGE = (5.0, 13.0)
+
+
+_SENSITIVITY_BINS = 5
+
+
+_PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+
+def _triangular_ppf(u, low, mode, high):
+    """Inverse CDF of the triangular distribution, elementwise on uniforms `u`"""
+    split = (mode - low) / (high - low)
+    return np.where(u < split,
+                    low + np.sqrt(u * (high - low) * (mode - low)),
+                    high - np.sqrt((1 - u) * (high - low) * (high - mode)))
+
+
+def projected_revenue(projections):
+    """Yearly revenue from financial_projections, missing years filled geometrically"""
+    known = {int(re.sub(r"\D", "", year)): parse_money(values["revenue"]).amount
+             for year, values in projections.items()}
+    years = np.arange(1, max(known) + 1)
+    marks = sorted(known)
+    return np.exp(np.interp(years, marks, np.log([known[year] for year in marks])))
+
+
+def _simulate_valuation_chunk(task):
+    """Draw one chunk of scenarios; returns mergeable histogram counts and moments"""
+    seed, count, revenue, assumptions = task
+    rng = np.random.default_rng(seed)
+    years = len(revenue)
+    uniforms = rng.random((len(VALUATION_DRIVERS), count))
+    drivers = {name: _triangular_ppf(u, *assumptions[name])
+               for name, u in zip(VALUATION_DRIVERS, uniforms)}
+
+    planned = np.diff(np.log(revenue))
+    shocks = rng.standard_normal((count, years - 1)) * VALUATION_GROWTH_VOLATILITY
+    log_growth = drivers["growth_execution"][:, None] * planned + shocks
+    paths = np.empty((count, years))
+    paths[:, 0] = revenue[0]
+    paths[:, 1:] = revenue[0] * np.exp(np.cumsum(log_growth, axis=1))
+
+    ramp = np.linspace(0.0, 1.0, years)
+    margins = (VALUATION_INITIAL_MARGIN
+               + np.outer(drivers["terminal_margin"] - VALUATION_INITIAL_MARGIN, ramp))
+    discount = (1 + drivers["discount_rate"])[:, None] ** -np.arange(1, years + 1)
+    values = (paths * margins * discount).sum(axis=1)
+    values += paths[:, -1] * drivers["revenue_multiple"] * discount[:, -1]
+
+    low, high = _VALUATION_LOG_RANGE
+    scale = _VALUATION_BINS / (high - low)
+    index = ((np.log10(np.maximum(values, 1.0)) - low) * scale).astype(np.int64)
+    np.clip(index, 0, _VALUATION_BINS - 1, out=index)
+    quintiles = np.minimum((uniforms * _SENSITIVITY_BINS).astype(np.int64), _SENSITIVITY_BINS - 1)
+
+    histogram = np.bincount(index, minlength=_VALUATION_BINS)
+    sensitivity = np.stack([
+        np.bincount(q * _VALUATION_BINS + index, minlength=_SENSITIVITY_BINS * _VALUATION_BINS)
+        for q in quintiles])
+    grid_cell = (quintiles[VALUATION_DRIVERS.index("revenue_multiple")] * _SENSITIVITY_BINS
+                 + quintiles[VALUATION_DRIVERS.index("discount_rate")])
+    grid = np.bincount(grid_cell * _VALUATION_BINS + index,
+                       minlength=_SENSITIVITY_BINS ** 2 * _VALUATION_BINS)
+    return {
+        "histogram": histogram,
+        "sensitivity": sensitivity.reshape(len(VALUATION_DRIVERS), _SENSITIVITY_BINS, -1),
+        "grid": grid.reshape(_SENSITIVITY_BINS, _SENSITIVITY_BINS, -1),
+        "sum": float(values.sum()),
+        "sum_squares": float(np.square(values).sum()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "negative": int((values <= 0).sum()),
+    }
+
+
+def _histogram_percentiles(counts, percentiles):
+    """Percentiles of a log-binned valuation histogram, interpolated within bins"""
+    total = counts.sum()
+    if not total:
+        return [None] * len(percentiles)
+    low, high = _VALUATION_LOG_RANGE
+    width = (high - low) / _VALUATION_BINS
+    cumulative = np.cumsum(counts)
+    results = []
+    for pct in percentiles:
+        target = total * pct / 100
+        b = int(np.searchsorted(cumulative, target))
+        before = cumulative[b - 1] if b else 0
+        fraction = (target - before) / counts[b] if counts[b] else 0.0
+        results.append(10 ** (low + (b + fraction) * width))
+    return results
+
+
+class MonteCarloValuation:
+    """Vectorized Monte Carlo valuation of the pitch's financial projections"""
+
+    def __init__(self, projections, pre_money=None, assumptions=None,
+                 memory_budget_mb=64, workers=None):
+        self.revenue = projected_revenue(projections)
+        self.pre_money = pre_money
+        self.assumptions = dict(VALUATION_ASSUMPTIONS, **(assumptions or {}))
+        self.memory_budget_mb = memory_budget_mb
+        self.workers = workers or os.cpu_count() or 1
+
+    @classmethod
+    def from_pitch(cls, pitch_data, **options):
+        pre_money = parse_money(pitch_data["investment_ask"]["valuation"]).amount
+        return cls(pitch_data["financial_projections"], pre_money, **options)
+
+    @property
+    def chunk_size(self):
+        """Scenarios per chunk: about a dozen float64 arrays per year are live at once"""
+        per_scenario = 8 * (12 * len(self.revenue) + 2 * len(VALUATION_DRIVERS))
+        return max(10000, int(self.memory_budget_mb * 1e6 // per_scenario))
+
+    def run(self, scenarios=1000000, seed=None):
+        """Simulate `scenarios` valuations; returns percentiles and sensitivity tables"""
+        start = time.perf_counter()
+        chunk = self.chunk_size
+        counts = [chunk] * (scenarios // chunk) + ([scenarios % chunk] if scenarios % chunk else [])
+        seeds = np.random.SeedSequence(seed).spawn(len(counts))
+        tasks = [(s, n, self.revenue, self.assumptions) for s, n in zip(seeds, counts)]
+        workers = min(self.workers, len(tasks))
+        if workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                parts = list(pool.map(_simulate_valuation_chunk, tasks))
+        else:
+            parts = [_simulate_valuation_chunk(task) for task in tasks]
+        merged = {key: sum(part[key] for part in parts)
+                  for key in ("histogram", "sensitivity", "grid", "sum", "sum_squares", "negative")}
+        elapsed = time.perf_counter() - start
+        return self._report(scenarios, merged, parts, len(tasks), workers, elapsed)
+
+    def _report(self, scenarios, merged, parts, chunks, workers, elapsed):
+        mean = merged["sum"] / scenarios
+        pcts = _histogram_percentiles(merged["histogram"], _PERCENTILES)
+        report = {
+            "scenarios": scenarios,
+            "chunks": chunks,
+            "chunk_size": self.chunk_size,
+            "workers": workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "scenarios_per_second": round(scenarios / elapsed, 1),
+            "revenue_plan": [round(value, 2) for value in self.revenue],
+            "mean": round(mean, 2),
+            "std": round(math.sqrt(max(0.0, merged["sum_squares"] / scenarios - mean ** 2)), 2),
+            "min": round(min(part["min"] for part in parts), 2),
+            "max": round(max(part["max"] for part in parts), 2),
+            "percentiles": {f"p{pct}": round(value, 2) for pct, value in zip(_PERCENTILES, pcts)},
+            "non_positive_share": round(merged["negative"] / scenarios, 6),
+        }
+        if self.pre_money:
+            cumulative = np.cumsum(merged["histogram"])
+            low, high = _VALUATION_LOG_RANGE
+            position = ((math.log10(self.pre_money) - low) * _VALUATION_BINS / (high - low)
+                        if self.pre_money > 0 else -1.0)
+            # Below or above the binned range every scenario beats it, or none does
+            if position < 0:
+                above = 1.0
+            elif position >= _VALUATION_BINS:
+                above = 0.0
+            else:
+                b = min(int(position), _VALUATION_BINS - 1)
+                above = round(1 - cumulative[b] / scenarios, 4)
+            report["pre_money"] = self.pre_money
+            report["probability_above_pre_money"] = above
+
+        report["sensitivity"] = {}
+        for d, name in enumerate(VALUATION_DRIVERS):
+            low, mode, high = self.assumptions[name]
+            edges = _triangular_ppf(np.linspace(0, 1, _SENSITIVITY_BINS + 1), low, mode, high)
+            report["sensitivity"][name] = [
+                {"range": [round(float(edges[q]), 4), round(float(edges[q + 1]), 4)],
+                 **{f"p{pct}": round(value, 2) for pct, value in zip(
+                     (10, 50, 90),
+                     _histogram_percentiles(merged["sensitivity"][d, q], (10, 50, 90)))}}
+                for q in range(_SENSITIVITY_BINS)]
+
+        multiples = _triangular_ppf(np.linspace(0, 1, _SENSITIVITY_BINS + 1),
+                                    *self.assumptions["revenue_multiple"])
+        rates = _triangular_ppf(np.linspace(0, 1, _SENSITIVITY_BINS + 1),
+                                *self.assumptions["discount_rate"])
+        report["median_by_multiple_and_discount_rate"] = {
+            "multiple_ranges": [[round(float(multiples[q]), 2), round(float(multiples[q + 1]), 2)]
+                                for q in range(_SENSITIVITY_BINS)],
+            "discount_rate_ranges": [[round(float(rates[q]), 4), round(float(rates[q + 1]), 4)]
+                                     for q in range(_SENSITIVITY_BINS)],
+            "median": [[round(_histogram_percentiles(merged["grid"][m, r], (50,))[0] or 0.0, 2)
+                        for r in range(_SENSITIVITY_BINS)] for m in range(_SENSITIVITY_BINS)],
+        }
+        return report